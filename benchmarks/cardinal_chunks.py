@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare to_cardinal() with and without the 0..999 chunk table.
+
+The legacy converter is the same class with ``SPLIT_ENGINE = 'legacy'``,
+which makes Num2Word_Base fall back to splitnum() + clean() for every call.
+
+Usage:
+    PYTHONPATH=. python benchmarks/cardinal_chunks.py [--count N]
+        [--langs en,de,fr]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import timeit
+
+from num2words import CONVERTER_CLASSES
+
+
+def random_numbers(count, seed=0):
+    rnd = random.Random(seed)
+    return [rnd.randrange(10 ** (digits - 1), 10 ** digits)
+            for digits in (rnd.randint(1, 12) for _ in range(count))]
+
+
+def best_of(func, numbers, repeat):
+    return min(timeit.repeat(lambda: [func(n) for n in numbers],
+                             number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--langs', default='en,de,fr,nl,es,lb,da,sv')
+    args = parser.parse_args()
+
+    numbers = random_numbers(args.count)
+    for lang in args.langs.split(','):
+        fast = CONVERTER_CLASSES[lang]
+        legacy = type(fast)()
+        legacy.SPLIT_ENGINE = 'legacy'
+        assert [fast.to_cardinal(n) for n in numbers[:500]] == \
+            [legacy.to_cardinal(n) for n in numbers[:500]]
+        t_legacy = best_of(legacy.to_cardinal, numbers, args.repeat)
+        t_fast = best_of(fast.to_cardinal, numbers, args.repeat)
+        print('%-6s legacy %7.1f ms  table %7.1f ms  speedup %.2fx' % (
+            lang, t_legacy * 1000, t_fast * 1000, t_legacy / t_fast))
+
+
+if __name__ == '__main__':
+    main()
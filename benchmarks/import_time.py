@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure the cold-start cost of ``import num2words``.
+
+Every sample runs in a fresh interpreter. The ``lazy`` scenario imports the
+package and converts one number in each of the requested languages; the
+``eager`` scenario additionally instantiates every registered converter,
+which is what each import used to cost before the registry became lazy.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--langs lb,de,fr]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+import num2words
+t1 = time.perf_counter()
+for lang in %(langs)r:
+    num2words.num2words(1234, lang=lang)
+t2 = time.perf_counter()
+if %(eager)r:
+    for lang in num2words.CONVERTER_CLASSES:
+        num2words.CONVERTER_CLASSES[lang]
+t3 = time.perf_counter()
+json.dump({
+    'import': t1 - t0,
+    'first_call': t2 - t1,
+    'eager': t3 - t2,
+    'modules': len([m for m in sys.modules if m.startswith('num2words.')]),
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}, sys.stdout)
+"""
+
+
+def sample(langs, eager):
+    code = SCRIPT % {'langs': langs, 'eager': eager}
+    out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+    return json.loads(out.decode('utf-8'))
+
+
+def summarize(name, samples):
+    total = [s['import'] + s['first_call'] + s['eager'] for s in samples]
+    print('%-6s total %7.1f ms (min %7.1f)  import %6.1f ms  '
+          'modules %3d  maxrss %6d kB' % (
+              name,
+              statistics.median(total) * 1000,
+              min(total) * 1000,
+              statistics.median(s['import'] for s in samples) * 1000,
+              samples[0]['modules'],
+              statistics.median(s['maxrss_kb'] for s in samples)))
+    return statistics.median(total)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--langs', default='lb,de,fr')
+    args = parser.parse_args()
+    langs = args.langs.split(',')
+
+    lazy = summarize('lazy', [sample(langs, False) for _ in range(args.runs)])
+    eager = summarize('eager', [sample(langs, True) for _ in range(args.runs)])
+    print('cold start saving: %.1f ms (%.1fx)' % (
+        (eager - lazy) * 1000, eager / lazy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the table-driven Num2Word_LB.to_cardinal() with the if-chain
+it replaced.
+
+The if-chain is kept below as ChainLB. Both are timed on small integers,
+five-digit integers, large integers and integral Decimals, and their
+results are compared first.
+
+Usage:
+    PYTHONPATH=. python benchmarks/lb_cardinal.py [--count N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import timeit
+from decimal import Decimal
+
+from num2words.lang_LB import Num2Word_LB
+
+
+class ChainLB(Num2Word_LB):
+    """Num2Word_LB with to_cardinal() as it was before the tables."""
+
+    def to_cardinal(self, number):
+        # Handle string inputs
+        if isinstance(number, str):
+            return self.convert_decimal_number(number)
+        # If float, use decimal logic
+        if isinstance(number, float):
+            return self.convert_decimal_number(number)
+        if number < 0:
+            if number == -1:
+                return self.negword.strip() + " eent"
+            return self.negword + self.to_cardinal(abs(number))
+        if number == 0:
+            return "null"
+        if number == 1:
+            return "een"
+        if number == 2:
+            return "zwee"
+        if number == 3:
+            return "dräi"
+        if number == 4:
+            return "véier"
+        if number == 5:
+            return "fënnef"
+        if number == 6:
+            return "sechs"
+        if number == 7:
+            return "siwen"
+        if number == 8:
+            return "aacht"
+        if number == 9:
+            return "néng"
+        if number == 10:
+            return "zéng"
+        if number == 11:
+            return "eelef"
+        if number == 12:
+            return "zwielef"
+        if number == 13:
+            return "dräizéngten"
+        if number == 14:
+            return "véierzéng"
+        if number == 15:
+            return "fofzéng"
+        if number == 16:
+            return "siechzéng"
+        if number == 17:
+            return "siwwenzéng"
+        if number == 18:
+            return "uechtzéng"
+        if number == 19:
+            return "nonzéng"
+        # CHANGED: 100 and 100s use 'honnert', not 'eenhonnert'
+        if number == 100:
+            return "honnert"
+        if number == 1000:
+            return "dausend"
+        if number == 1001:
+            return "dausendeent"
+        if number == 1100:
+            return "dausendeenhonnert"
+        if number == 1000000:
+            return "eng Millioun"
+        if number == 2000000:
+            return "zwee Milliounen"
+        if number == 1000000000:
+            return "eng Milliard"
+        if number == 2000000000:
+            return "zwee Milliarden"
+        number = round(number, 2)
+        if number < 10:
+            return super(Num2Word_LB, self).to_cardinal(number)
+        if 10 <= number < 20:
+            return super(Num2Word_LB, self).to_cardinal(number)
+        if number % 10 == 0 and number < 100:
+            for n, word in self.mid_numwords:
+                if n == number:
+                    return word
+            if number == 20:
+                return "zwanzeg"
+        if 21 <= number <= 99 and number % 10 != 0:
+            unit = int(number % 10)
+            ten = int(number - unit)
+            if unit == 1:
+                unit_word = "een"
+            else:
+                unit_word = super(Num2Word_LB, self).to_cardinal(unit)
+            for n, word in self.mid_numwords:
+                if n == ten:
+                    ten_word = word
+                    break
+            else:
+                if ten == 20:
+                    ten_word = "zwanzeg"
+                else:
+                    ten_word = f"[{ten}]"
+            # Apply phonological rule: drop final -n before consonants
+            # (except n, d, t, z)
+            if ten_word.startswith(("véier", "fënnef", "fofzeg", "sech",
+                                    "siwwen")):
+                joiner = "a"  # "an" becomes "a" before consonants
+            else:
+                joiner = "an"
+            return unit_word + joiner + ten_word
+        # CHANGED: 100-199 use 'honnert', not 'eenhonnert'
+        if 100 <= number <= 199:
+            hundreds = number // 100
+            rest = number % 100
+            hundred_word = "honnert"
+            if rest == 0:
+                return hundred_word
+            if rest == 1:
+                return hundred_word + "eent"
+            return hundred_word + self.to_cardinal(rest)
+        if 200 <= number <= 999:
+            hundreds = number // 100
+            rest = number % 100
+            hundred_prefix = self.to_cardinal(hundreds)
+            hundred_word = hundred_prefix + "honnert"
+            if rest == 0:
+                return hundred_word
+            if rest == 1:
+                return hundred_word + "eent"
+            return hundred_word + self.to_cardinal(rest)
+        if 1000 <= number <= 9999:
+            thousands = number // 1000
+            rest = number % 1000
+            if thousands == 1:
+                thousand_word = "dausend"
+            else:
+                thousand_word = self.to_cardinal(thousands) + "dausend"
+            if rest == 0:
+                return thousand_word
+            if rest == 1:
+                return thousand_word + "eent"
+            return thousand_word + self.to_cardinal(rest)
+        if 10000 <= number <= 99999:
+            # Correctly handle 5-digit numbers like 19.565 as 19 dausend + 565
+            thousands = number // 1000
+            rest = number % 1000
+            thousand_word = self.to_cardinal(thousands) + "dausend"
+            if rest == 0:
+                return thousand_word
+            if rest == 1:
+                return thousand_word + "eent"
+            return thousand_word + self.to_cardinal(rest)
+        return super(Num2Word_LB, self).to_cardinal(number)
+
+
+def samples(count, seed=0):
+    rnd = random.Random(seed)
+    return {
+        'small': [rnd.randrange(0, 100) for _ in range(count)],
+        'five digits': [rnd.randrange(10000, 100000) for _ in range(count)],
+        'large': [rnd.randrange(10 ** 5, 10 ** 15) for _ in range(count)],
+        'decimals': [Decimal(rnd.randrange(0, 100000)) for _ in range(count)],
+    }
+
+
+def best_of(func, numbers, repeat):
+    return min(timeit.repeat(lambda: [func(n) for n in numbers],
+                             number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    chain = ChainLB()
+    tables = Num2Word_LB()
+    for name, numbers in samples(args.count).items():
+        assert [chain.to_cardinal(n) for n in numbers] == \
+            [tables.to_cardinal(n) for n in numbers], name
+        t_chain = best_of(chain.to_cardinal, numbers, args.repeat)
+        t_tables = best_of(tables.to_cardinal, numbers, args.repeat)
+        print('%-12s chain %8.1f ms  tables %8.1f ms  speedup %.2fx' % (
+            name, t_chain * 1000, t_tables * 1000, t_chain / t_tables))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the single-pass Num2Word_LB.to_unit() with the chain of
+re.sub() passes it replaced.
+
+The passes are kept below as PassesLB. Both are timed on short unit
+expressions and on sentences with a few of them, and their results are
+compared first.
+
+Usage:
+    PYTHONPATH=. python benchmarks/lb_units.py [--count N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import re
+import timeit
+
+from num2words.lang_LB import Num2Word_LB
+
+UNITS = ['kg', 'ml', 'gr', '\u00B0', '%']
+WORDS = ['Et', 'ass', 'haut', 'an', 'ech', 'hunn', 'Waasser', 'gedronk']
+
+
+class PassesLB(Num2Word_LB):
+    """Num2Word_LB with to_unit() as it was before the unit table."""
+
+    def to_unit(self, text):
+        """
+        Convert expressions like '100ml' or '60gr' to text.
+        Handles spaces between number and unit (e.g., '50 ml', '60 gr').
+        Also handles percentages like '25%' and temperature in '90°'.
+
+        Args:
+            text (str): Text containing number with unit
+
+        Returns:
+            str: Text with number converted to words and unit expanded
+        """
+        # Process each unit type in sequence, from most specific to most
+        # general
+        result = text
+
+        # Step 1: Handle negative temperatures (-X°)
+        # Note: We need to use a more specific pattern to avoid false matches
+        neg_temp_pattern = r'(?<![0-9])-(\d+)\s*[°\u00B0]'
+
+        def replace_neg_temp(match):
+            num = int(match.group(1))
+            word = self.to_cardinal(num)
+            if num == 1:  # Special case for singular
+                word = "een"
+            return f"minus {word} Grad"
+
+        result = re.sub(neg_temp_pattern, replace_neg_temp, result)
+
+        # Step 2: Handle kilograms (kg)
+        # Making the pattern more specific to avoid partial matches
+        kg_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*kg\b'
+
+        def replace_kg(match):
+            num = int(match.group(1))
+            word = self.to_cardinal(num)
+            if num == 1:  # Special case for singular - apply phonological rule
+                # "ee Kilogramm" not "een Kilogramm" (K is consonant)
+                word = "ee"
+            return f"{word} Kilogramm"
+
+        result = re.sub(kg_pattern, replace_kg, result)
+
+        # Step 3: Handle milliliters (ml)
+        # Making the pattern more specific
+        ml_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*ml\b'
+
+        def replace_ml(match):
+            num = int(match.group(1))
+            word = self.to_cardinal(num)
+            if num == 1:  # Special case for singular - apply phonological rule
+                # "ee Milliliter" not "een Milliliter" (M is consonant)
+                word = "ee"
+            return f"{word} Milliliter"
+
+        result = re.sub(ml_pattern, replace_ml, result)
+
+        # Step 4: Handle grams (gr)
+        # Making the pattern more specific
+        gr_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*gr\b'
+
+        def replace_gr(match):
+            num = int(match.group(1))
+            word = self.to_cardinal(num)
+            if num == 1:  # Special case for singular - apply phonological rule
+                word = "ee"  # "ee Gramm" not "een Gramm" (G is consonant)
+            return f"{word} Gramm"
+
+        result = re.sub(gr_pattern, replace_gr, result)
+
+        # Step 5: Handle temperature with degree symbol (X°)
+        # Use Unicode decimal value 176 (degree symbol)
+        temp_pattern = r'(\d+)\s*[\u00B0\u2103\u2109°]'
+
+        def replace_temp(match):
+            num = int(match.group(1))
+            word = self.to_cardinal(num)
+            if num == 1:  # Special case for singular - apply phonological rule
+                word = "ee"  # "ee Grad" not "een Grad" (G is consonant)
+            return f"{word} Grad"
+
+        result = re.sub(temp_pattern, replace_temp, result)
+
+        # Step 6: Handle percentages (X%)
+        # Using Unicode decimal value 37 (percent symbol)
+        percent_pattern = r'(\d+)\s*%'
+
+        def replace_percent(match):
+            num = int(match.group(1))
+            # Handle special cases
+            if num == 25:
+                return "fënnefanzwanzeg Prozent"
+            elif num == 50:
+                return "fofzeg Prozent"
+            elif num == 75:
+                return "fënnefasiwwenzeg Prozent"
+            else:
+                # General case
+                word = self.to_cardinal(num)
+                if num == 1:  # Apply phonological rule
+                    # "ee Prozent" not "een Prozent" (P is consonant)
+                    word = "ee"
+                return f"{word} Prozent"
+
+        result = re.sub(percent_pattern, replace_percent, result)
+
+        # Step 7: Handle years with -er suffix (e.g., 1970er)
+        # Making the pattern more specific
+        year_pattern = r'\b(1\d{3}|20\d{2})er\b'
+
+        def replace_year_with_suffix(match):
+            year = int(match.group(1))
+            # Convert the year to words
+            year_text = self.to_year(year)
+            # Add the -er suffix
+            return f"{year_text}er"
+
+        result = re.sub(year_pattern, replace_year_with_suffix, result)
+
+        return result
+
+
+def expression(rnd):
+    return '%d%s%s' % (rnd.randrange(0, 1000), rnd.choice(['', ' ']),
+                       rnd.choice(UNITS))
+
+
+def sentence(rnd):
+    words = [rnd.choice(WORDS) for _ in range(12)]
+    for _ in range(3):
+        words.insert(rnd.randrange(len(words)), expression(rnd))
+    if rnd.random() < 0.2:
+        words.insert(rnd.randrange(len(words)),
+                     '%der' % rnd.randrange(1900, 2030))
+    return ' '.join(words)
+
+
+def samples(count, seed=0):
+    rnd = random.Random(seed)
+    return {
+        'expressions': [expression(rnd) for _ in range(count)],
+        'sentences': [sentence(rnd) for _ in range(count)],
+    }
+
+
+def best_of(func, texts, repeat):
+    return min(timeit.repeat(lambda: [func(t) for t in texts],
+                             number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    passes = PassesLB()
+    table = Num2Word_LB()
+    for name, texts in samples(args.count).items():
+        assert [passes.to_unit(t) for t in texts] == \
+            [table.to_unit(t) for t in texts], name
+        t_passes = best_of(passes.to_unit, texts, args.repeat)
+        t_table = best_of(table.to_unit, texts, args.repeat)
+        print('%-12s passes %8.1f ms  table %8.1f ms  speedup %.2fx' % (
+            name, t_passes * 1000, t_table * 1000, t_passes / t_table))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the single-scan normalizer with the one-pass-per-rule one.
+
+Times LuxembourgishNormalizer.normalize() and normalize_passes() on the
+text fixtures of the test suite and on generated sentences, and reports
+how many of the generated sentences come out differently. The one-off cost
+of compiling the rules of normalize() is reported separately.
+
+Usage:
+    PYTHONPATH=. python benchmarks/normalizer_engine.py [--sentences 2000]
+"""
+
+from __future__ import print_function
+
+import argparse
+import glob
+import os
+import random
+import re
+import timeit
+
+from num2words.normalizer import DEFAULT_RULES, LuxembourgishNormalizer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+PIECES = [
+    'den', 'an', 'mat', 'Leit', 'Plaz', 'Joer', 'Regierung', 'Auer',
+    'Mäerz', 'Juni', 'Abrëll', 'CSV', 'FIFA', 'VW', 'FC', 'Stonnen',
+    'Minutten', 'Milliounen', 'Milliarden', 'Prozent', '%', '°', 'ml',
+]
+
+
+def make_number(rnd):
+    return rnd.choice([
+        lambda: str(rnd.randrange(0, 100)),
+        lambda: str(rnd.randrange(100, 10 ** 7)),
+        lambda: str(rnd.randrange(1900, 2030)),
+        lambda: '%d.%d.' % (rnd.randrange(1, 32), rnd.randrange(1, 13)),
+        lambda: '%d:%02d' % (rnd.randrange(0, 24), rnd.randrange(0, 60)),
+        lambda: '%d,%d%%' % (rnd.randrange(0, 100), rnd.randrange(0, 10)),
+        lambda: '%d %03d' % (rnd.randrange(1, 1000), rnd.randrange(1000)),
+        lambda: '%der' % rnd.randrange(1900, 2030),
+    ])()
+
+
+def sentences(count, seed=0):
+    rnd = random.Random(seed)
+    result = []
+    for _ in range(count):
+        words = [make_number(rnd) if rnd.random() < 0.3
+                 else rnd.choice(PIECES)
+                 for _ in range(rnd.randrange(4, 16))]
+        result.append(' '.join(words) + '.')
+    return result
+
+
+def compile_seconds(repeat):
+    """Return the best time to compile the default rules from scratch."""
+    best = None
+    for _ in range(repeat):
+        rules = DEFAULT_RULES.copy()
+        re.purge()
+        rules.compile()
+        best = min(best or rules.compile_seconds, rules.compile_seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    normalizer = LuxembourgishNormalizer()
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(HERE, '..', 'tests',
+                                              '*.txt'))):
+        with open(path, encoding='utf-8') as f:
+            fixtures.append(f.read())
+    generated = sentences(args.sentences)
+
+    print('compiling %d rules: %.2fms, once per process' % (
+        len(DEFAULT_RULES), compile_seconds(args.repeat) * 1e3))
+    print('%-10s %12s %12s %8s %10s' % (
+        'input', 'passes', 'scan', 'speedup', 'differing'))
+    for name, texts in (('fixtures', fixtures), ('generated', generated)):
+        timings = []
+        for func in (normalizer.normalize_passes, normalizer.normalize):
+            timings.append(min(timeit.repeat(
+                lambda: [func(text) for text in texts],
+                number=1, repeat=args.repeat)))
+        differing = sum(normalizer.normalize(text)
+                        != normalizer.normalize_passes(text)
+                        for text in texts)
+        print('%-10s %10.1fms %10.1fms %7.1fx %10d' % (
+            name, timings[0] * 1e3, timings[1] * 1e3,
+            timings[0] / timings[1], differing))
+        print('%-10s %10.1fus %10.1fus   per text' % (
+            '', timings[0] * 1e6 / len(texts),
+            timings[1] * 1e6 / len(texts)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Throughput regression harness for the normalizer entry points.
+
+The text fixtures of the test suite (tests/*.txt) are amplified into a
+synthetic corpus: their lines, with every number replaced by a random one
+of the same length, are put together into paragraphs until the corpus
+has ``--size`` characters. Every entry point then
+
+* normalizes the fixtures, which must give the golden outputs of
+  tests/golden_normalized.json,
+* normalizes the whole corpus, timed as characters per second (best of
+  ``--repeat``); normalize_stream() and normalize_incremental() must give
+  the result of normalize(),
+* normalizes the corpus line by line, for the p50 and p99 latency of a
+  line (for the entry points that take single texts).
+
+The report is compared with a baseline, benchmarks/normalizer_baseline.json
+by default, and the exit status is 1 when an entry point got slower than
+the baseline by more than ``--threshold`` (0.25 = 25%) in throughput or p99
+latency, or when an output is wrong. The baseline depends on the machine:
+write a new one with ``--output`` where the harness runs regularly.
+
+Usage:
+    PYTHONPATH=. python benchmarks/normalizer_throughput.py [--size N]
+    PYTHONPATH=. python benchmarks/normalizer_throughput.py \
+        --output benchmarks/normalizer_baseline.json
+    PYTHONPATH=. python benchmarks/normalizer_throughput.py --update-golden
+"""
+
+from __future__ import print_function
+
+import argparse
+import glob
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+
+from num2words import run_num2words_text
+from num2words.normalizer import LuxembourgishNormalizer, TextNormalizer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, '..', 'tests')
+GOLDEN = os.path.join(FIXTURES, 'golden_normalized.json')
+BASELINE = os.path.join(HERE, 'normalizer_baseline.json')
+
+NUMBER = re.compile(r'\d+')
+
+
+def load_fixtures(directory=FIXTURES):
+    """Return ``{file name: text}`` for the *.txt files of `directory`."""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.txt'))):
+        with open(path, encoding='utf-8') as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+
+def amplify(fixtures, size, seed=0):
+    """Return a corpus of about `size` characters made of the lines of
+    `fixtures`, with new numbers, in paragraphs of one to four lines."""
+    rnd = random.Random(seed)
+    lines = [line.strip() for text in fixtures.values()
+             for line in text.splitlines() if line.strip()]
+
+    def renumber(match):
+        digits = match.group(0)
+        first = rnd.choice('123456789') if digits[0] != '0' else '0'
+        return first + ''.join(rnd.choice('0123456789')
+                               for _ in digits[1:])
+
+    paragraphs = []
+    length = 0
+    while length < size:
+        paragraph = '\n'.join(NUMBER.sub(renumber, rnd.choice(lines))
+                              for _ in range(rnd.randint(1, 4)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return '\n\n'.join(paragraphs)
+
+
+def entry_points():
+    """Return ``{name: (golden set, text function, line function)}``;
+    the line function is None where a line on its own is not a useful
+    measure."""
+    lb = LuxembourgishNormalizer()
+    text = TextNormalizer()
+    simple = run_num2words_text.TextNormalizer()
+
+    def stream(corpus):
+        return ''.join(lb.normalize_stream(io.StringIO(corpus)))
+
+    def incremental(corpus):
+        # a cold cache: every paragraph is new
+        lb.segment_cache.cache_clear()
+        return lb.normalize_incremental(corpus)
+
+    return {
+        'normalize': ('lb', lb.normalize, lb.normalize),
+        'normalize_passes': ('lb', lb.normalize_passes, lb.normalize_passes),
+        'normalize_stream': ('lb', stream, None),
+        'normalize_incremental': ('lb', incremental, None),
+        'text_normalizer': ('text', text.normalize_text, text.normalize_text),
+        'text_normalizer_simple': ('text_simple', simple.normalize_text,
+                                   simple.normalize_text),
+    }
+
+
+def golden_outputs(fixtures, entries=None):
+    """Return the golden outputs of `fixtures`: ``{set: {name: text}}``."""
+    entries = entries or entry_points()
+    golden = {}
+    for name in ('normalize', 'text_normalizer', 'text_normalizer_simple'):
+        group, func, _ = entries[name]
+        golden[group] = {fixture: func(text)
+                         for fixture, text in fixtures.items()}
+    return golden
+
+
+def check_golden(fixtures, golden, entries):
+    """Return the ``(entry point, fixture)`` pairs whose output is not the
+    golden one."""
+    wrong = []
+    for name, (group, func, _) in sorted(entries.items()):
+        for fixture, text in sorted(fixtures.items()):
+            if func(text) != golden.get(group, {}).get(fixture):
+                wrong.append((name, fixture))
+    return wrong
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def time_entry(func, line_func, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func(corpus)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    result = {'chars_per_second': round(len(corpus) / best),
+              'seconds': round(best, 4)}
+    if line_func is not None:
+        latencies = []
+        for line in corpus.splitlines():
+            started = time.perf_counter()
+            line_func(line)
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        result['p50_us'] = round(percentile(latencies, 0.50) * 1e6, 1)
+        result['p99_us'] = round(percentile(latencies, 0.99) * 1e6, 1)
+    return result, output
+
+
+def run(size=200000, repeat=3, seed=0, names=None, log=None):
+    """Run the harness and return the report as a dict."""
+    fixtures = load_fixtures()
+    with open(GOLDEN, encoding='utf-8') as f:
+        golden = json.load(f)
+    entries = entry_points()
+    if names:
+        entries = {name: entries[name] for name in names}
+    corpus = amplify(fixtures, size, seed)
+    results = {}
+    outputs = {}
+    for name, (group, func, line_func) in entries.items():
+        results[name], outputs[name] = time_entry(func, line_func, corpus,
+                                                  repeat)
+        if log is not None:
+            log('%-24s %10d chars/s  p50 %8s us  p99 %8s us' % (
+                name, results[name]['chars_per_second'],
+                results[name].get('p50_us', '-'),
+                results[name].get('p99_us', '-')))
+    expected = outputs.get('normalize')
+    if expected is None:
+        expected = LuxembourgishNormalizer().normalize(corpus)
+    inconsistent = [name for name in ('normalize_stream',
+                                      'normalize_incremental')
+                    if name in outputs and outputs[name] != expected]
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'corpus_chars': len(corpus),
+            'corpus_lines': corpus.count('\n') + 1,
+            'repeat': repeat,
+            'seed': seed,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+        'golden_mismatches': ['%s: %s' % pair for pair in
+                              check_golden(fixtures, golden, entries)],
+        'inconsistent': inconsistent,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Return the ``(entry point, metric, baseline, current, ratio)``
+    tuples of the measures that got worse than `baseline` by more than
+    `threshold`; the ratio is always slowdown (> 1 is slower)."""
+    regressions = []
+    for name, current in sorted(report['results'].items()):
+        before = baseline.get('results', {}).get(name)
+        if before is None:
+            continue
+        ratio = before['chars_per_second'] / current['chars_per_second']
+        if ratio > 1 + threshold:
+            regressions.append((name, 'chars_per_second',
+                                before['chars_per_second'],
+                                current['chars_per_second'], ratio))
+        if 'p99_us' in before and 'p99_us' in current:
+            ratio = current['p99_us'] / before['p99_us']
+            if ratio > 1 + threshold:
+                regressions.append((name, 'p99_us', before['p99_us'],
+                                    current['p99_us'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200000,
+                        help='characters of the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--entries', help='comma separated entry points '
+                        '(default: all)')
+    parser.add_argument('--output', help='write the JSON report here')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='JSON report to compare with (default: '
+                        '%(default)s, if it exists)')
+    parser.add_argument('--threshold', type=float, default=0.25)
+    parser.add_argument('--update-golden', action='store_true',
+                        help='write the current outputs of the fixtures '
+                        'as the golden ones and exit')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.update_golden:
+        with open(GOLDEN, 'w', encoding='utf-8') as f:
+            json.dump(golden_outputs(load_fixtures()), f, indent=2,
+                      sort_keys=True, ensure_ascii=False)
+            f.write('\n')
+        return 0
+    names = args.entries.split(',') if args.entries else None
+    for name in names or ():
+        if name not in entry_points():
+            parser.error('unknown entry point: %s' % name)
+
+    report = run(args.size, args.repeat, args.seed, names,
+                 log=None if args.quiet else print)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    status = 0
+    for mismatch in report['golden_mismatches']:
+        print('WRONG OUTPUT %s' % mismatch)
+        status = 1
+    for name in report['inconsistent']:
+        print('WRONG OUTPUT %s differs from normalize() on the corpus'
+              % name)
+        status = 1
+    if args.baseline and os.path.exists(args.baseline) and \
+            os.path.abspath(args.baseline) != os.path.abspath(args.output
+                                                              or ''):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for name, metric, before, after, ratio in compare(
+                report, baseline, args.threshold):
+            print('REGRESSION %-24s %-16s %12s -> %12s (%.2fx slower)' % (
+                name, metric, before, after, ratio))
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure how ParallelConverter scales from 1 to N worker processes.
+
+The baseline is num2words_many() in the calling process. For each worker
+count, the pool is started (and its converters warmed up) outside the
+timing, then the same input is converted with map() and with imap().
+
+Usage:
+    PYTHONPATH=. python benchmarks/parallel_scaling.py [--count N]
+        [--lang lb] [--max-workers N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import time
+
+from num2words import num2words_many
+from num2words.parallel import ParallelConverter
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--lang', default='lb')
+    parser.add_argument('--to', default='cardinal')
+    parser.add_argument('--max-workers', type=int,
+                        default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    numbers = [rnd.randrange(10 ** rnd.randint(1, 9))
+               for _ in range(args.count)]
+
+    base, expected = timed(lambda: num2words_many(numbers, lang=args.lang,
+                                                  to=args.to))
+    print('%-12s %8.2f s %9.0f numbers/s' % (
+        'in-process', base, args.count / base))
+
+    counts = [1]
+    while counts[-1] * 2 < args.max_workers:
+        counts.append(counts[-1] * 2)
+    counts.append(args.max_workers)
+    for workers in sorted(set(counts)):
+        with ParallelConverter(workers, langs=[args.lang]) as pool:
+            pool.map(range(workers * 64), lang=args.lang, to=args.to)
+            t_map, result = timed(lambda: pool.map(numbers, lang=args.lang,
+                                                   to=args.to))
+            assert result == expected
+            t_imap, _ = timed(lambda: sum(1 for _ in pool.imap(
+                iter(numbers), lang=args.lang, to=args.to)))
+        print('%2d worker(s) %8.2f s %9.0f numbers/s  speedup %5.2fx  '
+              'efficiency %3.0f%%  (imap %.2f s)' % (
+                  workers, t_map, args.count / t_map, base / t_map,
+                  100.0 * base / t_map / workers, t_imap))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the bisect scale lookup with a linear scan over the cards.
+
+For each language, time ``_scale_for()`` on its own and a legacy
+splitnum() + clean() conversion, once with the bisect lookup and once
+with the linear scan splitnum() used to do.
+
+Usage:
+    PYTHONPATH=. python benchmarks/scale_lookup.py [--langs en,de,lb,fr]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import timeit
+
+from num2words import CONVERTER_CLASSES
+
+
+def linear_scale_for(converter):
+    def scale_for(value):
+        for elem in converter.cards:
+            if elem <= value:
+                return elem
+    return scale_for
+
+
+def make_converter(lang, linear):
+    converter = type(CONVERTER_CLASSES[lang])()
+    converter.SPLIT_ENGINE = 'legacy'
+    if linear:
+        converter._scale_for = linear_scale_for(converter)
+    return converter
+
+
+def best_of(func, values, repeat):
+    return min(timeit.repeat(lambda: [func(v) for v in values],
+                             number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--langs', default='en,de,lb,fr,nl,es')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    print('%-5s %6s %-11s %10s %10s %8s' % (
+        'lang', 'cards', 'what', 'linear', 'bisect', 'speedup'))
+    for lang in args.langs.split(','):
+        linear = make_converter(lang, True)
+        bisect = make_converter(lang, False)
+        max_digits = len(str(bisect.MAXVAL)) - 1
+        for digits in (6, max_digits):
+            values = [rnd.randrange(10 ** (digits - 1), 10 ** digits)
+                      for _ in range(args.count)]
+            assert [linear.to_cardinal(v) for v in values[:50]] == \
+                [bisect.to_cardinal(v) for v in values[:50]]
+            for what, name in (('_scale_for', '_scale_for'),
+                               ('to_cardinal', 'to_cardinal')):
+                t_linear = best_of(getattr(linear, name), values,
+                                   args.repeat)
+                t_bisect = best_of(getattr(bisect, name), values,
+                                   args.repeat)
+                print('%-5s %6d %-11s %8.1fms %8.1fms %7.2fx  (%d digits)' % (
+                    lang, len(bisect.cards), what, t_linear * 1000,
+                    t_bisect * 1000, t_linear / t_bisect, digits))
+
+
+if __name__ == '__main__':
+    main()
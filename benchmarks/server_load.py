@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Load-test the num2words HTTP server.
+
+Starts ``python -m num2words.server`` with ``--workers`` processes (or
+uses the server at ``--url``), then ``--clients`` threads send requests
+over keep-alive connections for ``--duration`` seconds. Reports requests
+and items per second and the p50/p90/p99/max latency of a request.
+
+Usage:
+    PYTHONPATH=. python benchmarks/server_load.py [--endpoint convert]
+        [--clients 8] [--duration 5] [--workers 1] [--batch-size 100]
+    PYTHONPATH=. python benchmarks/server_load.py --url http://host:8080
+"""
+
+from __future__ import print_function
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, workers, langs):
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'num2words.server', '--port', str(port),
+         '--workers', str(workers), '--langs', langs])
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 0.2).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise SystemExit('the server did not start')
+            time.sleep(0.05)
+    process.terminate()
+    raise SystemExit('the server did not start in time')
+
+
+def make_bodies(endpoint, lang, to, batch_size, count=256):
+    """Return `count` request bodies and the number of items in each."""
+    rnd = random.Random(0)
+
+    def number():
+        return rnd.randrange(10 ** rnd.randint(1, 9))
+
+    bodies = []
+    for _ in range(count):
+        if endpoint == 'convert':
+            body = {'number': number(), 'lang': lang, 'to': to}
+        elif endpoint == 'convert/batch':
+            body = {'numbers': [number() for _ in range(batch_size)],
+                    'lang': lang, 'to': to}
+        elif endpoint == 'normalize':
+            body = {'text': 'Den %d. Mee %d um %d:%02d Auer, %d Leit.' % (
+                rnd.randint(1, 31), rnd.randint(1900, 2100),
+                rnd.randint(0, 23), rnd.randint(0, 59), number())}
+        else:
+            body = {'texts': ['Den %d. Mee %d hat hien %d%%.' % (
+                rnd.randint(1, 31), rnd.randint(1900, 2100),
+                rnd.randint(0, 100)) for _ in range(batch_size)]}
+        bodies.append(json.dumps(body).encode('utf-8'))
+    items = 1 if endpoint in ('convert', 'normalize') else batch_size
+    return bodies, items
+
+
+def client(host, port, path, bodies, stop, latencies, errors):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {'Content-Type': 'application/json'}
+    index = 0
+    while not stop.is_set():
+        body = bodies[index % len(bodies)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            connection.request('POST', path, body, headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(1)
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+        if response.status != 200:
+            errors.append(response.status)
+    connection.close()
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='server to test (default: start one)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='server processes when starting one')
+    parser.add_argument('--endpoint', default='convert',
+                        choices=['convert', 'convert/batch', 'normalize',
+                                 'normalize/batch'])
+    parser.add_argument('--lang', default='lb')
+    parser.add_argument('--to', default='cardinal')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--json', action='store_true',
+                        help='print the report as JSON')
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        process = start_server(port, args.workers, args.lang)
+    bodies, items = make_bodies(args.endpoint, args.lang, args.to,
+                                args.batch_size)
+    try:
+        stop = threading.Event()
+        latencies = []
+        errors = []
+        threads = [threading.Thread(target=client, args=(
+            host, port, '/' + args.endpoint, bodies, stop, latencies,
+            errors)) for _ in range(args.clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    if not latencies:
+        raise SystemExit('no request succeeded')
+    report = {
+        'endpoint': args.endpoint,
+        'clients': args.clients,
+        'workers': None if args.url else args.workers,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'items_per_second': round(len(latencies) * items / elapsed, 1),
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50) * 1e3, 2),
+            'p90': round(percentile(latencies, 0.90) * 1e3, 2),
+            'p99': round(percentile(latencies, 0.99) * 1e3, 2),
+            'max': round(latencies[-1] * 1e3, 2),
+        },
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print('%(endpoint)s: %(requests)d requests, %(errors)d errors, '
+          '%(requests_per_second).1f requests/s, %(items_per_second).1f '
+          'items/s' % report)
+    print('latency: p50 %(p50).2f ms  p90 %(p90).2f ms  p99 %(p99).2f ms  '
+          'max %(max).2f ms' % report['latency_ms'])
+
+
+if __name__ == '__main__':
+    main()
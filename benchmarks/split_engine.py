@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the iterative split/merge engine with splitnum() + clean().
+
+For numbers of increasing size, up to just below the converter's MAXVAL,
+report per call:
+
+* the time spent in to_cardinal(),
+* the peak of memory allocated while converting (tracemalloc),
+* the number of splitnum(), clean() and merge() calls.
+
+Usage:
+    PYTHONPATH=. python benchmarks/split_engine.py [--lang en]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import timeit
+import tracemalloc
+
+from num2words import CONVERTER_CLASSES
+
+
+class CallCounter(object):
+    """Count calls of some methods of a converter instance."""
+
+    def __init__(self, converter, names):
+        self.counts = dict.fromkeys(names, 0)
+        for name in names:
+            setattr(converter, name, self._wrap(name, getattr(converter,
+                                                              name)))
+
+    def _wrap(self, name, method):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return method(*args, **kwargs)
+        return counted
+
+
+def make_converter(lang, engine):
+    converter = type(CONVERTER_CLASSES[lang])()
+    converter.SPLIT_ENGINE = engine
+    converter.to_cardinal(0)  # build the chunk table outside the timings
+    return converter
+
+
+def peak_bytes(func, value):
+    tracemalloc.start()
+    try:
+        func(value)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(lang, engine, value, repeat):
+    converter = make_converter(lang, engine)
+    seconds = min(timeit.repeat(lambda: converter.to_cardinal(value),
+                                number=1, repeat=repeat))
+    peak = peak_bytes(converter.to_cardinal, value)
+
+    counted = make_converter(lang, engine)
+    counter = CallCounter(counted, ('splitnum', 'clean', 'merge'))
+    counted.to_cardinal(value)
+    return seconds, peak, counter.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    max_digits = len(str(CONVERTER_CLASSES[args.lang].MAXVAL)) - 1
+    print('%6s  %-9s %10s %10s %9s %6s %6s' % (
+        'digits', 'engine', 'time', 'peak', 'splitnum', 'clean', 'merge'))
+    for digits in (3, 6, 12, 30, 100, max_digits):
+        value = rnd.randrange(10 ** (digits - 1), 10 ** digits)
+        for engine in ('legacy', 'iterative'):
+            seconds, peak, counts = measure(args.lang, engine, value,
+                                            args.repeat)
+            print('%6d  %-9s %8.1fus %8.1fkB %9d %6d %6d' % (
+                digits, engine, seconds * 1e6, peak / 1024.0,
+                counts['splitnum'], counts['clean'], counts['merge']))
+
+
+if __name__ == '__main__':
+    main()
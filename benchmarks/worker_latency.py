@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Compare the latency of a num2words worker with a process per call.
+
+Measures, for the same numbers:
+
+* ``bin/num2words <number>`` started for every call (fork-per-call),
+* a ``python -m num2words.worker`` co-process over pipes, one request at
+  a time (round trip) and with all requests sent before reading the
+  responses (pipelined),
+* the same worker on a Unix domain socket, one request at a time.
+
+Usage:
+    PYTHONPATH=. python benchmarks/worker_latency.py [--calls 2000]
+        [--fork-calls 30] [--lang lb] [--to cardinal]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BIN = os.path.join(HERE, '..', 'bin', 'num2words')
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def report(name, latencies, total, calls=None):
+    if latencies is None:
+        # pipelined: the latency is mostly the time spent in the queue
+        print('%-22s %6d calls  %9.1f calls/s' % (name, calls,
+                                                  calls / total))
+        return
+    print('%-22s %6d calls  %9.1f calls/s  p50 %8.3f ms  p99 %8.3f ms' % (
+        name, len(latencies), len(latencies) / total,
+        percentile(latencies, 0.50) * 1e3,
+        percentile(latencies, 0.99) * 1e3))
+
+
+def fork_per_call(numbers, lang, to):
+    latencies = []
+    for number in numbers:
+        started = time.perf_counter()
+        subprocess.run([sys.executable, BIN, str(number), '-l', lang,
+                        '-t', to], stdout=subprocess.DEVNULL, check=True)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def requests(numbers, lang, to):
+    return [json.dumps({'id': index, 'number': number, 'lang': lang,
+                        'to': to}).encode('utf-8') + b'\n'
+            for index, number in enumerate(numbers)]
+
+
+def round_trips(reader, writer, lines):
+    latencies = []
+    for line in lines:
+        started = time.perf_counter()
+        writer.write(line)
+        writer.flush()
+        json.loads(reader.readline())
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def pipelined(reader, writer, lines):
+    """Send all requests from another thread while reading the
+    responses."""
+    def send():
+        for line in lines:
+            writer.write(line)
+        writer.flush()
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    for _ in lines:
+        json.loads(reader.readline())
+    thread.join()
+
+
+def start_worker(lang, *args):
+    return subprocess.Popen(
+        [sys.executable, '-m', 'num2words.worker', '--langs', lang] +
+        list(args), stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    latencies = func(*args)
+    return latencies, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--fork-calls', type=int, default=30,
+                        help='calls for fork-per-call, which is slow')
+    parser.add_argument('--lang', default='lb')
+    parser.add_argument('--to', default='cardinal')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    numbers = [rnd.randrange(10 ** rnd.randint(1, 9))
+               for _ in range(args.calls)]
+    lines = requests(numbers, args.lang, args.to)
+
+    report('fork-per-call', *timed(fork_per_call,
+                                   numbers[:args.fork_calls], args.lang,
+                                   args.to))
+
+    worker = start_worker(args.lang)
+    try:
+        # the first response also waits for the start of the worker
+        round_trips(worker.stdout, worker.stdin, lines[:1])
+        report('worker pipe', *timed(round_trips, worker.stdout,
+                                     worker.stdin, lines))
+        report('worker pipe pipelined', *timed(pipelined, worker.stdout,
+                                               worker.stdin, lines),
+               calls=len(lines))
+    finally:
+        worker.stdin.close()
+        worker.wait()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        return
+    path = os.path.join(tempfile.mkdtemp(), 'num2words.sock')
+    worker = start_worker(args.lang, '--socket', path)
+    try:
+        deadline = time.time() + 30
+        while not os.path.exists(path) and time.time() < deadline:
+            time.sleep(0.01)
+        sock = socket.socket(socket.AF_UNIX)
+        sock.connect(path)
+        stream = sock.makefile('rwb')
+        round_trips(stream, stream, lines[:1])
+        report('worker socket', *timed(round_trips, stream, stream, lines))
+        stream.close()
+        sock.close()
+    finally:
+        worker.terminate()
+        worker.wait()
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == '__main__':
+    main()
@@ -17,87 +17,102 @@
 
 from __future__ import unicode_literals
 
-from . import (lang_AM, lang_AR, lang_AZ, lang_BE, lang_BN, lang_CA, lang_CE,
-               lang_CS, lang_CY, lang_DA, lang_DE, lang_EN, lang_EN_IN,
-               lang_EN_NG, lang_EO, lang_ES, lang_ES_CO, lang_ES_CR,
-               lang_ES_GT, lang_ES_NI, lang_ES_VE, lang_FA, lang_FI, lang_FR,
-               lang_FR_BE, lang_FR_CH, lang_FR_DZ, lang_HE, lang_HI, lang_HU,
-               lang_ID, lang_IS, lang_IT, lang_JA, lang_KN, lang_KO, lang_KZ, lang_LB,
-               lang_LT, lang_LV, lang_MN, lang_NL, lang_NO, lang_PL, lang_PT,
-               lang_PT_BR, lang_RO, lang_RU, lang_SK, lang_SL, lang_SR,
-               lang_SV, lang_TE, lang_TET, lang_TG, lang_TH, lang_TR, lang_UK,
-               lang_VI, lang_ZH, lang_ZH_CN, lang_ZH_HK, lang_ZH_TW)
-
-CONVERTER_CLASSES = {
-    'am': lang_AM.Num2Word_AM(),
-    'ar': lang_AR.Num2Word_AR(),
-    'az': lang_AZ.Num2Word_AZ(),
-    'be': lang_BE.Num2Word_BE(),
-    'bn': lang_BN.Num2Word_BN(),
-    'ca': lang_CA.Num2Word_CA(),
-    'ce': lang_CE.Num2Word_CE(),
-    'cs': lang_CS.Num2Word_CS(),
-    'cy': lang_CY.Num2Word_CY(),
-    'en': lang_EN.Num2Word_EN(),
-    'en_IN': lang_EN_IN.Num2Word_EN_IN(),
-    'en_NG': lang_EN_NG.Num2Word_EN_NG(),
-    'fa': lang_FA.Num2Word_FA(),
-    'fr': lang_FR.Num2Word_FR(),
-    'fr_CH': lang_FR_CH.Num2Word_FR_CH(),
-    'fr_BE': lang_FR_BE.Num2Word_FR_BE(),
-    'fr_DZ': lang_FR_DZ.Num2Word_FR_DZ(),
-    'de': lang_DE.Num2Word_DE(),
-    'fi': lang_FI.Num2Word_FI(),
-    'eo': lang_EO.Num2Word_EO(),
-    'es': lang_ES.Num2Word_ES(),
-    'es_CO': lang_ES_CO.Num2Word_ES_CO(),
-    'es_CR': lang_ES_CR.Num2Word_ES_CR(),
-    'es_GT': lang_ES_GT.Num2Word_ES_GT(),
-    'es_NI': lang_ES_NI.Num2Word_ES_NI(),
-    'es_VE': lang_ES_VE.Num2Word_ES_VE(),
-    'id': lang_ID.Num2Word_ID(),
-    'ja': lang_JA.Num2Word_JA(),
-    'kn': lang_KN.Num2Word_KN(),
-    'ko': lang_KO.Num2Word_KO(),
-    'kz': lang_KZ.Num2Word_KZ(),
-    'mn': lang_MN.Num2Word_MN(),
-    'lb': lang_LB.Num2Word_LB(),  
-    'lt': lang_LT.Num2Word_LT(),
-    'lv': lang_LV.Num2Word_LV(),
-    'pl': lang_PL.Num2Word_PL(),
-    'ro': lang_RO.Num2Word_RO(),
-    'ru': lang_RU.Num2Word_RU(),
-    'sk': lang_SK.Num2Word_SK(),
-    'sl': lang_SL.Num2Word_SL(),
-    'sr': lang_SR.Num2Word_SR(),
-    'sv': lang_SV.Num2Word_SV(),
-    'no': lang_NO.Num2Word_NO(),
-    'da': lang_DA.Num2Word_DA(),
-    'pt': lang_PT.Num2Word_PT(),
-    'pt_BR': lang_PT_BR.Num2Word_PT_BR(),
-    'he': lang_HE.Num2Word_HE(),
-    'it': lang_IT.Num2Word_IT(),
-    'vi': lang_VI.Num2Word_VI(),
-    'tg': lang_TG.Num2Word_TG(),
-    'th': lang_TH.Num2Word_TH(),
-    'tr': lang_TR.Num2Word_TR(),
-    'nl': lang_NL.Num2Word_NL(),
-    'uk': lang_UK.Num2Word_UK(),
-    'te': lang_TE.Num2Word_TE(),
-    'tet': lang_TET.Num2Word_TET(),
-    'hu': lang_HU.Num2Word_HU(),
-    'is': lang_IS.Num2Word_IS(),
-    'hi': lang_HI.Num2Word_HI(),
-    'zh': lang_ZH.Num2Word_ZH(),
-    'zh_CN': lang_ZH_CN.Num2Word_ZH_CN(),
-    'zh_TW': lang_ZH_TW.Num2Word_ZH_TW(),
-    'zh_HK': lang_ZH_HK.Num2Word_ZH_HK(),
-}
+from .cache import ResultCache, kwargs_key, number_key
+from .registry import ConverterRegistry
+
+CONVERTER_CLASSES = ConverterRegistry([
+    ('am', 'lang_AM.Num2Word_AM'),
+    ('ar', 'lang_AR.Num2Word_AR'),
+    ('az', 'lang_AZ.Num2Word_AZ'),
+    ('be', 'lang_BE.Num2Word_BE'),
+    ('bn', 'lang_BN.Num2Word_BN'),
+    ('ca', 'lang_CA.Num2Word_CA'),
+    ('ce', 'lang_CE.Num2Word_CE'),
+    ('cs', 'lang_CS.Num2Word_CS'),
+    ('cy', 'lang_CY.Num2Word_CY'),
+    ('en', 'lang_EN.Num2Word_EN'),
+    ('en_IN', 'lang_EN_IN.Num2Word_EN_IN'),
+    ('en_NG', 'lang_EN_NG.Num2Word_EN_NG'),
+    ('fa', 'lang_FA.Num2Word_FA'),
+    ('fr', 'lang_FR.Num2Word_FR'),
+    ('fr_CH', 'lang_FR_CH.Num2Word_FR_CH'),
+    ('fr_BE', 'lang_FR_BE.Num2Word_FR_BE'),
+    ('fr_DZ', 'lang_FR_DZ.Num2Word_FR_DZ'),
+    ('de', 'lang_DE.Num2Word_DE'),
+    ('fi', 'lang_FI.Num2Word_FI'),
+    ('eo', 'lang_EO.Num2Word_EO'),
+    ('es', 'lang_ES.Num2Word_ES'),
+    ('es_CO', 'lang_ES_CO.Num2Word_ES_CO'),
+    ('es_CR', 'lang_ES_CR.Num2Word_ES_CR'),
+    ('es_GT', 'lang_ES_GT.Num2Word_ES_GT'),
+    ('es_NI', 'lang_ES_NI.Num2Word_ES_NI'),
+    ('es_VE', 'lang_ES_VE.Num2Word_ES_VE'),
+    ('id', 'lang_ID.Num2Word_ID'),
+    ('ja', 'lang_JA.Num2Word_JA'),
+    ('kn', 'lang_KN.Num2Word_KN'),
+    ('ko', 'lang_KO.Num2Word_KO'),
+    ('kz', 'lang_KZ.Num2Word_KZ'),
+    ('mn', 'lang_MN.Num2Word_MN'),
+    ('lb', 'lang_LB.Num2Word_LB'),
+    ('lt', 'lang_LT.Num2Word_LT'),
+    ('lv', 'lang_LV.Num2Word_LV'),
+    ('pl', 'lang_PL.Num2Word_PL'),
+    ('ro', 'lang_RO.Num2Word_RO'),
+    ('ru', 'lang_RU.Num2Word_RU'),
+    ('sk', 'lang_SK.Num2Word_SK'),
+    ('sl', 'lang_SL.Num2Word_SL'),
+    ('sr', 'lang_SR.Num2Word_SR'),
+    ('sv', 'lang_SV.Num2Word_SV'),
+    ('no', 'lang_NO.Num2Word_NO'),
+    ('da', 'lang_DA.Num2Word_DA'),
+    ('pt', 'lang_PT.Num2Word_PT'),
+    ('pt_BR', 'lang_PT_BR.Num2Word_PT_BR'),
+    ('he', 'lang_HE.Num2Word_HE'),
+    ('it', 'lang_IT.Num2Word_IT'),
+    ('vi', 'lang_VI.Num2Word_VI'),
+    ('tg', 'lang_TG.Num2Word_TG'),
+    ('th', 'lang_TH.Num2Word_TH'),
+    ('tr', 'lang_TR.Num2Word_TR'),
+    ('nl', 'lang_NL.Num2Word_NL'),
+    ('uk', 'lang_UK.Num2Word_UK'),
+    ('te', 'lang_TE.Num2Word_TE'),
+    ('tet', 'lang_TET.Num2Word_TET'),
+    ('hu', 'lang_HU.Num2Word_HU'),
+    ('is', 'lang_IS.Num2Word_IS'),
+    ('hi', 'lang_HI.Num2Word_HI'),
+    ('zh', 'lang_ZH.Num2Word_ZH'),
+    ('zh_CN', 'lang_ZH_CN.Num2Word_ZH_CN'),
+    ('zh_TW', 'lang_ZH_TW.Num2Word_ZH_TW'),
+    ('zh_HK', 'lang_ZH_HK.Num2Word_ZH_HK'),
+])
 
 CONVERTES_TYPES = ['cardinal', 'ordinal', 'ordinal_num', 'year', 'currency', 'unit']
 
 
+# Opt-in result cache, see enable_cache()
+_cache = None
+_MISSING = object()
+
+
 def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
+    cache = _cache
+    if cache is None:
+        return _num2words(number, ordinal, lang, to, kwargs)
+
+    key = _cache_key(CONVERTER_CLASSES.resolve(lang), to, ordinal, number,
+                     kwargs)
+    if key is None:
+        cache.bypass()
+        return _num2words(number, ordinal, lang, to, kwargs)
+    words = cache.get(key, _MISSING)
+    if words is _MISSING:
+        words = _num2words(number, ordinal, lang, to, kwargs)
+        if isinstance(words, str):
+            cache.put(key, words)
+    return words
+
+
+def _num2words(number, ordinal, lang, to, kwargs):
     # We try the full language first
     if lang not in CONVERTER_CLASSES:
         # ... and then try only the first 2 letters
@@ -126,3 +141,130 @@ def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
         raise NotImplementedError()
 
     return getattr(converter, 'to_{}'.format(to))(number, **kwargs)
+
+
+def _batch_converter(lang, to, kwargs):
+    """Resolve everything num2words() looks up on each call exactly once
+    and return a one-argument function converting a single number.
+    """
+    converter = CONVERTER_CLASSES.resolve(lang)
+    if to not in CONVERTES_TYPES:
+        raise NotImplementedError()
+    method = getattr(converter, 'to_{}'.format(to), None)
+    if method is None:
+        raise NotImplementedError(
+            "Language {} does not support {} conversion".format(lang, to))
+    str_to_number = converter.str_to_number
+
+    def convert(number):
+        if isinstance(number, str):
+            # Special case for text units (like "100ml", "50gr", etc.)
+            if to == 'unit':
+                return method(number)
+            number = str_to_number(number)
+        return method(number, **kwargs)
+
+    cache = _cache
+    if cache is None:
+        return convert
+    kwargs_part = kwargs_key(kwargs)
+    if kwargs_part is None:
+        return convert
+
+    def cached_convert(number):
+        number_part = number_key(number)
+        if number_part is None:
+            cache.bypass()
+            return convert(number)
+        key = (converter, to, False, number_part, kwargs_part)
+        words = cache.get(key, _MISSING)
+        if words is _MISSING:
+            words = convert(number)
+            if isinstance(words, str):
+                cache.put(key, words)
+        return words
+
+    return cached_convert
+
+
+def _convert_each(convert, numbers, return_errors):
+    for number in numbers:
+        try:
+            yield convert(number)
+        except Exception as err:
+            if not return_errors:
+                raise
+            yield err
+
+
+def num2words_many(numbers, lang='en', to='cardinal', errors='raise',
+                   lazy=False, **kwargs):
+    """Convert every number of `numbers` with the same lang, to and kwargs.
+
+    The converter and its ``to_<to>`` method are resolved once for the whole
+    batch instead of once per number. `numbers` may be any iterable,
+    including a one-dimensional NumPy array or anything else that provides
+    ``tolist()``.
+
+    With ``errors='raise'`` the first number that cannot be converted aborts
+    the batch, exactly as a loop over num2words() would. With
+    ``errors='return'`` the exception is put in place of that number's
+    words and the batch carries on.
+
+    Returns a list, or a generator if `lazy` is true.
+    """
+    if errors not in ('raise', 'return'):
+        raise ValueError("errors must be 'raise' or 'return', not %r"
+                         % (errors,))
+    convert = _batch_converter(lang, to, kwargs)
+    if hasattr(numbers, 'tolist'):
+        # NumPy scalars are not int/float subclasses, plain lists are faster
+        numbers = numbers.tolist()
+    results = _convert_each(convert, numbers, errors == 'return')
+    return results if lazy else list(results)
+
+
+def _cache_key(converter, to, ordinal, number, kwargs):
+    number_part = number_key(number)
+    if number_part is None:
+        return None
+    kwargs_part = kwargs_key(kwargs)
+    if kwargs_part is None:
+        return None
+    return converter, to, bool(ordinal), number_part, kwargs_part
+
+
+def enable_cache(maxsize=1024, maxbytes=None):
+    """Cache the results of num2words() and num2words_many().
+
+    Results are kept per converter, ``to`` type, number and keyword
+    arguments, in a least recently used cache of at most `maxsize` entries
+    and `maxbytes` bytes (either may be None for no limit). Numbers of
+    other types than int, float, Decimal and str, and unhashable keyword
+    arguments, are converted without going through the cache.
+
+    Calling it again replaces the cache with an empty one. Call
+    cache_clear() after changing the settings of a converter.
+    """
+    global _cache
+    _cache = ResultCache(maxsize, maxbytes)
+
+
+def disable_cache():
+    """Stop caching results and drop the cache."""
+    global _cache
+    _cache = None
+
+
+def cache_info():
+    """Return the cache statistics as a CacheInfo named tuple, or None
+    if the cache is not enabled."""
+    cache = _cache
+    return None if cache is None else cache.cache_info()
+
+
+def cache_clear():
+    """Drop every cached result and reset the statistics."""
+    cache = _cache
+    if cache is not None:
+        cache.cache_clear()
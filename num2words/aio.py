@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""asyncio front-end for num2words and the Luxembourgish normalizer.
+
+Conversions are CPU-bound and would block the event loop, so every
+coroutine here runs them in an executor: the loop's default thread pool
+unless another one is passed. Converters keep their per-call state per
+thread, so a thread pool can share them. make_executor() builds a thread
+or process pool whose workers have the converters loaded already::
+
+    executor = make_executor(4, langs=['lb'], processes=True)
+    words = await anum2words(42, lang='lb', executor=executor)
+    async for line in anormalize_lines(reader, executor=executor):
+        ...
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import num2words, num2words_many
+from .parallel import _warm_up
+
+
+def make_executor(workers=None, langs=(), processes=False):
+    """Return an executor for the coroutines of this module.
+
+    The converters of `langs` are loaded before the executor is returned
+    (threads share this process' converters) or, with `processes`, in
+    every worker process when it starts.
+    """
+    if processes:
+        return ProcessPoolExecutor(workers, initializer=_warm_up,
+                                   initargs=(tuple(langs),))
+    _warm_up(langs)
+    return ThreadPoolExecutor(workers)
+
+
+def normalize_lb(text):
+    """Normalize `text` with the LuxembourgishNormalizer shared by the
+    whole process, see num2words.normalizer.default_normalizer()."""
+    from .normalizer import default_normalizer
+    return default_normalizer().normalize(text)
+
+
+def _run(executor, func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs))
+
+
+async def anum2words(number, ordinal=False, lang='en', to='cardinal',
+                     executor=None, **kwargs):
+    """Awaitable num2words()."""
+    return await _run(executor, num2words, number, ordinal=ordinal,
+                      lang=lang, to=to, **kwargs)
+
+
+async def anum2words_many(numbers, lang='en', to='cardinal',
+                          errors='raise', executor=None, **kwargs):
+    """Awaitable num2words_many(); the whole batch is converted by one
+    worker, see ParallelConverter to use several."""
+    return await _run(executor, num2words_many, list(numbers), lang=lang,
+                      to=to, errors=errors, **kwargs)
+
+
+async def anormalize(text, normalize=normalize_lb, executor=None):
+    """Awaitable ``normalize(text)``, for a whole document."""
+    return await _run(executor, normalize, text)
+
+
+async def _aiter(items):
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def amap(func, items, executor=None, max_pending=8):
+    """Yield ``func(item)`` for every item of the (async) iterable
+    `items`, in order, computing up to `max_pending` of them concurrently.
+
+    Items are only read while fewer than `max_pending` results are
+    waiting to be consumed, so a slow consumer slows the reading down
+    instead of piling up work. When the iteration is closed or
+    cancelled, the calls that have not started yet are cancelled.
+    """
+    if max_pending < 1:
+        raise ValueError('max_pending must be >= 1')
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    try:
+        async for item in _aiter(items):
+            pending.append(loop.run_in_executor(executor, func, item))
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def anormalize_lines(lines, normalize=normalize_lb, executor=None,
+                     max_pending=8):
+    """Return an asynchronous iterator over the lines of `lines`,
+    normalized, in order.
+
+    `lines` may be a regular or an asynchronous iterable, e.g. a file or
+    a StreamReader; line terminators are stripped and each line is
+    normalized on its own. See amap() for `max_pending`.
+    """
+    return amap(normalize, _strip_lines(lines), executor, max_pending)
+
+
+async def _strip_lines(lines):
+    async for line in _aiter(lines):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        yield line.rstrip('\r\n')
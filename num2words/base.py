@@ -17,7 +17,10 @@
 
 from __future__ import unicode_literals
 
+import functools
 import math
+import threading
+from bisect import bisect_right
 from collections import OrderedDict
 from decimal import Decimal
 
@@ -25,10 +28,102 @@ from .compat import to_s
 from .currency import parse_currency_parts, prefix_currency
 
 
-class Num2Word_Base(object):
+class _CallStateAttribute(object):
+    """Instance attribute holding state of the conversion in progress.
+
+    Assignments made while a conversion method (``to_*``) runs in a
+    thread are seen by that thread only, until the outermost conversion
+    method returns; so a converter can be shared by several threads even
+    though its methods keep intermediate results on ``self``. Assignments
+    made outside of conversions, e.g. ``converter.precision = 3``,
+    configure the converter for every thread.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj.__dict__
+        local = values.get('_call_state')
+        if local is not None:
+            try:
+                return local.values[self.name]
+            except (AttributeError, KeyError):
+                pass
+        try:
+            return values['_call_defaults'][self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __set__(self, obj, value):
+        values = obj.__dict__
+        local = values.get('_call_state')
+        if local is not None and getattr(local, 'depth', 0):
+            local.values[self.name] = value
+        else:
+            values.setdefault('_call_defaults', {})[self.name] = value
+
+
+def _conversion(method):
+    """Wrap the conversion method `method` so that the CALL_STATE
+    assignments it makes are kept for the calling thread until the
+    outermost conversion returns."""
+    @functools.wraps(method)
+    def conversion(self, *args, **kwargs):
+        local = self.__dict__.get('_call_state')
+        if local is None or getattr(local, 'depth', 0):
+            # still being constructed, or called by another conversion
+            return method(self, *args, **kwargs)
+        local.values = {}
+        local.depth = 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            local.depth = 0
+            local.values = {}
+    return conversion
+
+
+class _ConverterType(type):
+    """Install the CALL_STATE attributes of converter classes and make
+    their conversion methods keep that state per thread once an instance
+    is constructed."""
+
+    def __init__(cls, name, bases, namespace):
+        super(_ConverterType, cls).__init__(name, bases, namespace)
+        for attr in cls.CALL_STATE:
+            if not isinstance(getattr(cls, attr, None), _CallStateAttribute):
+                setattr(cls, attr, _CallStateAttribute(attr))
+        for attr, value in namespace.items():
+            if attr.startswith('to_') and callable(value):
+                setattr(cls, attr, _conversion(value))
+
+    def __call__(cls, *args, **kwargs):
+        converter = super(_ConverterType, cls).__call__(*args, **kwargs)
+        converter.__dict__['_call_state'] = threading.local()
+        return converter
+
+
+class Num2Word_Base(object, metaclass=_ConverterType):
     CURRENCY_FORMS = {}
     CURRENCY_ADJECTIVES = {}
 
+    # Instance attributes the conversion methods assign to while they run.
+    # Their values are kept per thread during a conversion, see
+    # _CallStateAttribute.
+    CALL_STATE = ('precision',)
+
+    # Instance attributes read by merge(). The table of merged 0..999
+    # groups is kept once per combination of their values. None means
+    # merge() is not a pure function of them and the table is not used.
+    CHUNK_STATE = ()
+
+    # 'iterative' converts through _split_merge() and the chunk table,
+    # 'legacy' through the nested lists of splitnum() and clean().
+    SPLIT_ENGINE = 'iterative'
+
     def __init__(self):
         self.is_title = False
         self.precision = 2
@@ -66,29 +161,147 @@ class Num2Word_Base(object):
             self.cards[n] = word
 
     def splitnum(self, value):
-        for elem in self.cards:
-            if elem > value:
-                continue
+        elem = self._scale_for(value)
+        if elem is None:
+            return None
 
-            out = []
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
+
+        if div == 1:
+            out.append((self.cards[1], 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(div * self.cards[elem], div*elem)]
+            out.append(self.splitnum(div))
+
+        out.append((self.cards[elem], elem))
+
+        if mod:
+            out.append(self.splitnum(mod))
+
+        return out
+
+    def _scale_for(self, value):
+        """Return the first card not greater than `value`, i.e. the scale
+        splitnum() divides `value` by, or None if there is none.
+
+        The cards are kept in descending order, so this is the largest one
+        and can be found by bisecting their sorted values.
+        """
+        scales = self.__dict__.get('_scales')
+        if scales is None or scales[0] != len(self.cards):
+            scales = self.__dict__['_scales'] = self._sorted_scales()
+        size, ascending = scales
+        if ascending is None:
+            for elem in self.cards:
+                if elem <= value:
+                    return elem
+            return None
+        index = bisect_right(ascending, value)
+        return ascending[index - 1] if index else None
+
+    def _sorted_scales(self):
+        """Return ``(len(self.cards), ascending card values)``; the values
+        are None if the cards are not in descending order, in which case
+        _scale_for() falls back to scanning them.
+        """
+        cards = list(self.cards)
+        ascending = sorted(cards)
+        if ascending[::-1] != cards:
+            ascending = None
+        return len(cards), ascending
+
+    def _chunk_table(self):
+        """Return the merged ``(words, value)`` pairs for 0..999, or None
+        when the legacy splitnum() + clean() path must be used instead.
+
+        The table is only valid for converters that keep both of those
+        methods, and it is built on first use.
+        """
+        cls = type(self)
+        if (self.SPLIT_ENGINE != 'iterative' or self.CHUNK_STATE is None
+                or not hasattr(self, 'cards')
+                or cls.splitnum is not Num2Word_Base.splitnum
+                or cls.clean is not Num2Word_Base.clean):
+            return None
+        key = tuple(self._state_key(getattr(self, name))
+                    for name in self.CHUNK_STATE)
+        tables = self.__dict__.setdefault('_chunk_tables', {})
+        try:
+            return tables[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable state
+            return None
+        # Every group only needs smaller ones, so the table fills itself
+        table = []
+        for value in range(1000):
+            try:
+                table.append(self._split_merge(value, table))
+            except Exception:
+                table.append(None)
+        table = tables[key] = tuple(table)
+        return table
+
+    @staticmethod
+    def _state_key(value):
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    def _split_merge(self, value, table):
+        """Return ``self.clean(self.splitnum(value))`` for an int `value`.
+
+        Instead of building the nested lists of splitnum() and reducing
+        them in clean(), walk down the scales in a loop: each step merges
+        the multiplier with its scale word, and the pending steps are then
+        merged with the remainder from the right, which is the same
+        sequence of merge() calls clean() makes. Values below
+        ``len(table)`` are taken from `table`.
+        """
+        pending = []
+        while value >= len(table):
+            elem = self._scale_for(value)
             if value == 0:
                 div, mod = 1, 0
             else:
                 div, mod = divmod(value, elem)
 
             if div == 1:
-                out.append((self.cards[1], 1))
+                head = (self.cards[1], 1)
+            elif div == value:  # The system tallies, eg Roman Numerals
+                tail = (div * self.cards[elem], div * elem)
+                break
             else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(div * self.cards[elem], div*elem)]
-                out.append(self.splitnum(div))
+                head = self._split_merge(div, table)
+
+            step = self.merge(head, (self.cards[elem], elem))
+            if not mod:
+                tail = step
+                break
+            pending.append(step)
+            value = mod
+        else:
+            tail = table[value]
+            if tail is None:
+                tail = self.clean(self.splitnum(value))
 
-            out.append((self.cards[elem], elem))
+        for step in reversed(pending):
+            tail = self.merge(step, tail)
+        return tail
 
-            if mod:
-                out.append(self.splitnum(mod))
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_call_state', None)
+        return state
 
-            return out
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__['_call_state'] = threading.local()
 
     def parse_minus(self, num_str):
         """Detach minus and return it as symbol with new num_str."""
@@ -114,8 +327,12 @@ class Num2Word_Base(object):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value)
-        words, num = self.clean(val)
+        table = self._chunk_table()
+        if table is None:
+            val = self.splitnum(value)
+            words, num = self.clean(val)
+        else:
+            words, num = self._split_merge(int(value), table)
         return self.title(out + words)
 
     def float2tuple(self, value):
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Convert numbers read one per line, for ``num2words --batch``.
+
+Every line holds a number, optionally followed by a language and a
+converter type that override the defaults for that line only (``-`` keeps
+the default)::
+
+    42
+    42 fr
+    42 - ordinal
+    1999 de year
+
+The converter of every (lang, to) pair is resolved once, the words are
+written in blocks of lines and a line that cannot be converted is reported
+on its own, leaving an empty line in the output so that the output lines
+still match the input lines.
+
+With ``num2words --jsonl`` every line is a JSON record instead, and the
+output has a record with the words or the error for each of them::
+
+    {"id": 7, "number": 1.5, "lang": "lb", "to": "currency"}
+    -> {"id": 7, "words": "een Euro a fofzeg Cent"}
+    {"id": 8, "number": "x", "kwargs": {"currency": "USD"}}
+    -> {"id": 8, "error": "InvalidOperation: ..."}
+"""
+
+from __future__ import unicode_literals
+
+import json
+
+from . import _batch_converter
+from .cache import kwargs_key
+
+
+def parse_line(line, lang='en', to='cardinal'):
+    """Return ``(number, lang, to)`` for `line`, or None for a blank line.
+
+    Raises ValueError for a line with more than three fields.
+    """
+    fields = line.split()
+    if not fields:
+        return None
+    if len(fields) > 3:
+        raise ValueError('expected "<number> [<lang> [<to>]]", got %d '
+                         'fields' % len(fields))
+    fields += ['-'] * (3 - len(fields))
+    number, line_lang, line_to = fields
+    return (number, lang if line_lang == '-' else line_lang,
+            to if line_to == '-' else line_to)
+
+
+def describe_error(err):
+    """Return a one-line description of the exception `err`."""
+    message = str(err)
+    return '%s: %s' % (type(err).__name__, message) if message \
+        else type(err).__name__
+
+
+def _resolve(converters, lang, to, kwargs=None):
+    """Return the converter for (lang, to, kwargs), resolved on first use
+    and kept in `converters`, or the exception resolving it raised."""
+    kwargs = kwargs or {}
+    key = (lang, to, kwargs_key(kwargs))
+    convert = converters.get(key)
+    if convert is None:
+        try:
+            convert = _batch_converter(lang, to, kwargs)
+        except NotImplementedError as err:
+            # Later numbers of this pair fail the same way
+            convert = err if str(err) else NotImplementedError(
+                'unsupported lang/to: %s/%s' % (lang, to))
+        except Exception as err:
+            convert = err
+        if key[2] is not None:
+            converters[key] = convert
+    return convert
+
+
+def convert_lines(lines, lang='en', to='cardinal'):
+    """Yield ``(line, words, error)`` for every line of `lines`, without
+    its line terminator.
+
+    `error` is None for a line that was converted, and `words` is None
+    for a line that was not. Blank lines give empty words.
+    """
+    converters = {}
+    for line in lines:
+        line = line.rstrip('\r\n')
+        try:
+            parsed = parse_line(line, lang, to)
+        except ValueError as err:
+            yield line, None, err
+            continue
+        if parsed is None:
+            yield line, '', None
+            continue
+        number, line_lang, line_to = parsed
+        convert = _resolve(converters, line_lang, line_to)
+        if isinstance(convert, Exception):
+            yield line, None, convert
+            continue
+        try:
+            yield line, convert(number), None
+        except Exception as err:
+            yield line, None, err
+
+
+def convert_file(infile, outfile, errfile, lang='en', to='cardinal',
+                 buffer_lines=1024, name='<stdin>'):
+    """Convert the lines of `infile` and write the words to `outfile`.
+
+    The words are written every `buffer_lines` lines and when the input
+    ends; a line that cannot be converted gives an empty line, and the
+    error goes to `errfile` as ``name:lineno: line: error``. Returns the
+    number of lines that could not be converted.
+    """
+    buffer_lines = max(1, buffer_lines)
+    pending = []
+    errors = 0
+    results = convert_lines(infile, lang, to)
+    for lineno, (line, words, error) in enumerate(results, 1):
+        if error is not None:
+            errors += 1
+            words = ''
+            errfile.write('%s:%d: %s: %s\n' % (name, lineno, line,
+                                               describe_error(error)))
+        pending.append(words + '\n')
+        if len(pending) >= buffer_lines:
+            outfile.write(''.join(pending))
+            outfile.flush()
+            pending = []
+    outfile.write(''.join(pending))
+    outfile.flush()
+    return errors
+
+
+def _parse_record(line, lang, to):
+    """Return ``(id, number, lang, to, kwargs)`` for the JSON record of
+    `line`; raises ValueError for anything else."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError('expected a JSON object')
+    record_id = record.get('id')
+    if 'number' not in record:
+        raise ValueError('the record has no number')
+    record_lang = record.get('lang', lang)
+    record_to = record.get('to', to)
+    kwargs = record.get('kwargs') or {}
+    if not isinstance(record_lang, str) or not isinstance(record_to, str):
+        raise ValueError('lang and to must be strings')
+    if not isinstance(kwargs, dict):
+        raise ValueError('kwargs must be an object')
+    return record_id, record['number'], record_lang, record_to, kwargs
+
+
+def _record_id(line):
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record.get('id') if isinstance(record, dict) else None
+
+
+def _convert_block(lines, lang, to, converters):
+    """Return the output records for the JSON lines of `lines`.
+
+    The records are grouped by (lang, to, kwargs) so that each group is
+    converted by one converter in a row; the output is in input order.
+    """
+    output = [None] * len(lines)
+    groups = {}
+    for index, line in enumerate(lines):
+        try:
+            record_id, number, record_lang, record_to, kwargs = \
+                _parse_record(line, lang, to)
+        except ValueError as err:
+            output[index] = {'id': _record_id(line),
+                             'error': describe_error(err)}
+            continue
+        output[index] = {'id': record_id}
+        kwargs_part = kwargs_key(kwargs)
+        # records with unhashable kwargs are a group on their own
+        key = (record_lang, record_to,
+               kwargs_part if kwargs_part is not None else index)
+        groups.setdefault(key, (kwargs, []))[1].append((index, number))
+    for (record_lang, record_to, _), (kwargs, items) in groups.items():
+        convert = _resolve(converters, record_lang, record_to, kwargs)
+        for index, number in items:
+            if isinstance(convert, Exception):
+                output[index]['error'] = describe_error(convert)
+                continue
+            try:
+                output[index]['words'] = convert(number)
+            except Exception as err:
+                output[index]['error'] = describe_error(err)
+    return output
+
+
+def convert_records(lines, lang='en', to='cardinal', buffer_size=1024):
+    """Yield an output record (a dict) for every JSON line of `lines`.
+
+    Every output record has the ``id`` of its input record (None if it has
+    none) and either ``words`` or ``error``. Blank lines are skipped. The
+    lines are read and converted `buffer_size` at a time.
+    """
+    buffer_size = max(1, buffer_size)
+    converters = {}
+    block = []
+    for line in lines:
+        if not line.strip():
+            continue
+        block.append(line)
+        if len(block) >= buffer_size:
+            for record in _convert_block(block, lang, to, converters):
+                yield record
+            block = []
+    for record in _convert_block(block, lang, to, converters):
+        yield record
+
+
+def convert_jsonl(infile, outfile, lang='en', to='cardinal',
+                  buffer_size=1024):
+    """Convert the JSON lines of `infile` and write the output records to
+    `outfile`, `buffer_size` records at a time. Returns the number of
+    records that could not be converted."""
+    buffer_size = max(1, buffer_size)
+    errors = 0
+    pending = []
+    for record in convert_records(infile, lang, to, buffer_size):
+        errors += 'error' in record
+        pending.append(json.dumps(record, ensure_ascii=False) + '\n')
+        if len(pending) >= buffer_size:
+            outfile.write(''.join(pending))
+            outfile.flush()
+            pending = []
+    outfile.write(''.join(pending))
+    outfile.flush()
+    return errors
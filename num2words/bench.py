@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Benchmark every language and converter type.
+
+Times num2words() for every (lang, to) pair over reproducible number
+distributions, writes the results as JSON and compares them with a
+baseline report::
+
+    python -m num2words.bench --output bench.json
+    python -m num2words.bench --baseline bench.json --threshold 0.25
+
+The exit status is 1 when a pair got slower than the baseline by more
+than the threshold (0.25 = 25%).
+
+Pairs the converter does not support are skipped, as are numbers it
+rejects (e.g. beyond its MAXVAL); calls that take longer than
+``--timeout`` seconds mark the pair as skipped too.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import platform
+import random
+import signal
+import sys
+import time
+
+from . import CONVERTER_CLASSES, CONVERTES_TYPES, num2words
+
+
+def small_ints(rnd, count):
+    return [rnd.randrange(0, 1000) for _ in range(count)]
+
+
+def years(rnd, count):
+    return [rnd.randrange(1000, 2100) for _ in range(count)]
+
+
+def prices(rnd, count):
+    return [round(rnd.randrange(0, 1000000) / 100.0, 2)
+            for _ in range(count)]
+
+
+def huge_ints(rnd, count):
+    return [rnd.randrange(10 ** 12, 10 ** 30) for _ in range(count)]
+
+
+def floats(rnd, count):
+    return [round(rnd.uniform(-1000, 1000), rnd.randint(1, 4))
+            for _ in range(count)]
+
+
+UNITS = ['ml', 'gr', 'kg', 'km', '%', '°', 'Stonnen', 'Minutten']
+
+
+def unit_strings(rnd, count):
+    return ['%d%s%s' % (rnd.randrange(0, 1000), rnd.choice(['', ' ']),
+                        rnd.choice(UNITS)) for _ in range(count)]
+
+
+DISTRIBUTIONS = {
+    'small': small_ints,
+    'years': years,
+    'prices': prices,
+    'huge': huge_ints,
+    'floats': floats,
+    'units': unit_strings,
+}
+
+# Distributions each converter type is measured on
+TYPE_DISTRIBUTIONS = {
+    'cardinal': ['small', 'years', 'huge', 'floats'],
+    'ordinal': ['small', 'years', 'huge'],
+    'ordinal_num': ['small', 'years'],
+    'year': ['years'],
+    'currency': ['prices', 'small'],
+    'unit': ['units'],
+}
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise _Timeout()
+
+
+def _call_with_timeout(func, timeout):
+    if not timeout or not hasattr(signal, 'setitimer'):
+        return func()
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def supported_numbers(lang, to, numbers, timeout):
+    """Return the numbers of `numbers` that convert without error.
+
+    Raises NotImplementedError if the converter has no method for `to`,
+    and _Timeout if a call takes longer than `timeout`. Numbers the
+    method rejects, even with NotImplementedError, are left out.
+    """
+    converter = CONVERTER_CLASSES[lang]
+    if not hasattr(converter, 'to_' + to):
+        raise NotImplementedError()
+    ok = []
+    for number in numbers:
+        try:
+            _call_with_timeout(
+                lambda: num2words(number, lang=lang, to=to), timeout)
+        except _Timeout:
+            raise
+        except Exception:
+            continue
+        ok.append(number)
+    return ok
+
+
+def time_pair(lang, to, numbers, repeat):
+    """Return the best time per call over `repeat` runs, in ns."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for number in numbers:
+            num2words(number, lang=lang, to=to)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e9 / len(numbers)
+
+
+def run(langs, types, count=200, repeat=3, seed=0, timeout=2.0,
+        log=None):
+    """Run the benchmark and return the report as a dict."""
+    results = {}
+    skipped = {}
+    samples = {}
+    for name, make in DISTRIBUTIONS.items():
+        samples[name] = make(random.Random('%s-%s' % (seed, name)), count)
+    for lang in langs:
+        for to in types:
+            for dist in TYPE_DISTRIBUTIONS[to]:
+                key = '%s/%s/%s' % (lang, to, dist)
+                try:
+                    numbers = supported_numbers(lang, to, samples[dist],
+                                                timeout)
+                except NotImplementedError:
+                    skipped[key] = 'not implemented'
+                    continue
+                except _Timeout:
+                    skipped[key] = 'timeout'
+                    continue
+                if not numbers:
+                    skipped[key] = 'no supported numbers'
+                    continue
+                results[key] = {
+                    'ns_per_call': round(time_pair(lang, to, numbers,
+                                                   repeat), 1),
+                    'calls': len(numbers),
+                    'rejected': count - len(numbers),
+                }
+                if log is not None:
+                    log('%-28s %12.1f ns/call' % (
+                        key, results[key]['ns_per_call']))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'count': count,
+            'repeat': repeat,
+            'seed': seed,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Return the ``(key, baseline ns, current ns, ratio)`` tuples of the
+    pairs that got slower than `baseline` by more than `threshold`."""
+    regressions = []
+    for key, current in sorted(report['results'].items()):
+        before = baseline.get('results', {}).get(key)
+        if before is None:
+            continue
+        ratio = current['ns_per_call'] / before['ns_per_call']
+        if ratio > 1 + threshold:
+            regressions.append((key, before['ns_per_call'],
+                                current['ns_per_call'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m num2words.bench',
+        description=__doc__.splitlines()[0])
+    parser.add_argument('--langs', help='comma separated (default: all)')
+    parser.add_argument('--to', help='comma separated converter types '
+                        '(default: %s)' % ','.join(CONVERTES_TYPES))
+    parser.add_argument('--count', type=int, default=200,
+                        help='numbers per distribution')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=2.0,
+                        help='seconds allowed per call')
+    parser.add_argument('--output', help='write the JSON report here')
+    parser.add_argument('--baseline', help='JSON report to compare with')
+    parser.add_argument('--threshold', type=float, default=0.25)
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    langs = args.langs.split(',') if args.langs else list(CONVERTER_CLASSES)
+    types = args.to.split(',') if args.to else list(CONVERTES_TYPES)
+    for lang in langs:
+        if lang not in CONVERTER_CLASSES:
+            parser.error('unknown language: %s' % lang)
+    for to in types:
+        if to not in TYPE_DISTRIBUTIONS:
+            parser.error('unknown converter type: %s' % to)
+
+    log = None if args.quiet else print
+    report = run(langs, types, count=args.count, repeat=args.repeat,
+                 seed=args.seed, timeout=args.timeout, log=log)
+    if not args.quiet:
+        print('%d pairs timed, %d skipped' % (
+            len(report['results']), len(report['skipped'])))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print('REGRESSION %-28s %10.1f -> %10.1f ns/call (%+.0f%%)' % (
+                key, before, after, (ratio - 1) * 100))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from decimal import Decimal
+
+CacheInfo = namedtuple('CacheInfo', [
+    'hits', 'misses', 'evictions', 'bypassed',
+    'maxsize', 'currsize', 'maxbytes', 'currbytes'])
+
+# Types whose values can stand for themselves in a key. Floats and
+# Decimals go in by repr(): 1.0 == Decimal('1.00') but they are not
+# spelled out the same way.
+_EXACT_TYPES = (int, bool, str)
+_REPR_TYPES = (float, Decimal)
+
+
+def number_key(number):
+    """Return a hashable key for `number`, or None if results for it
+    should not be cached."""
+    cls = type(number)
+    if cls in _EXACT_TYPES:
+        return cls, number
+    if cls in _REPR_TYPES:
+        return cls, repr(number)
+    return None
+
+
+def kwargs_key(kwargs):
+    """Return a hashable key for `kwargs`, or None if one of the values
+    cannot be hashed."""
+    if not kwargs:
+        return ()
+    key = tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ResultCache(object):
+    """Bounded LRU cache of conversion results.
+
+    Either bound may be None. `maxsize` limits the number of entries and
+    `maxbytes` the memory taken by the cached strings and their keys, as
+    estimated by ``sys.getsizeof()``. When a new entry does not fit, the
+    least recently used ones are evicted.
+    """
+
+    def __init__(self, maxsize=1024, maxbytes=None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be None or >= 0')
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError('maxbytes must be None or >= 0')
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.bypassed = 0
+        self.currbytes = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, size = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        size = sys.getsizeof(value) + sum(sys.getsizeof(k) for k in key)
+        if self.maxsize == 0 or (self.maxbytes is not None
+                                 and size > self.maxbytes):
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.currbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.currbytes += size
+            while ((self.maxsize is not None
+                    and len(self._entries) > self.maxsize)
+                   or (self.maxbytes is not None
+                       and self.currbytes > self.maxbytes)):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.currbytes -= evicted
+                self.evictions += 1
+
+    def bypass(self):
+        """Count a call whose result could not be cached."""
+        with self._lock:
+            self.bypassed += 1
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.bypassed, self.maxsize, len(self._entries),
+                             self.maxbytes, self.currbytes)
+
+    def cache_clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._reset()
+
+    def __len__(self):
+        return len(self._entries)
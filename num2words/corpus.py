@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Normalize a Luxembourgish text corpus on several processes.
+
+Inputs are files, directories (searched recursively for ``--pattern``) or
+glob patterns. Every file is cut into shards of about ``--shard-size``
+bytes at line breaks; the shards are normalized by a pool of worker
+processes, each with its own default_normalizer(), and put back
+together in order::
+
+    python -m num2words.corpus transcripts/ -o normalized/ --workers 8
+    python -m num2words.corpus 'data/*.txt' big.txt -o normalized/
+
+Every input file is written to the output directory under its path
+relative to the directory it was found in (or its name). A finished shard
+is kept as ``<output>.part-<start>-<end>`` until its file is complete, so
+an interrupted run picks up where it stopped when it is started again;
+``--restart`` throws the earlier work away.
+
+The matches that normalize_stream() joins across line breaks (like
+'40\\n000') are not joined across shards.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import fnmatch
+import glob
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+_normalizer = None
+
+
+def _init_worker():
+    global _normalizer
+    from .normalizer import default_normalizer
+    _normalizer = default_normalizer()
+
+
+def find_inputs(paths, pattern='*'):
+    """Return ``(path, name)`` for the files of `paths`, where `name` is
+    the path of the output relative to the output directory."""
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(fnmatch.filter(files, pattern)):
+                    full = os.path.join(root, name)
+                    inputs.append((full, os.path.relpath(full, path)))
+        elif os.path.isfile(path):
+            inputs.append((path, os.path.basename(path)))
+        else:
+            matches = sorted(p for p in glob.glob(path) if os.path.isfile(p))
+            if not matches:
+                raise ValueError('no such file or directory: %s' % path)
+            inputs.extend((p, os.path.basename(p)) for p in matches)
+    names = {}
+    for path, name in inputs:
+        if names.setdefault(name, path) != path:
+            raise ValueError('%s and %s would both be written to %s'
+                             % (names[name], path, name))
+    return inputs
+
+
+def plan_shards(path, shard_size):
+    """Return the ``(start, end)`` byte offsets of the shards of `path`,
+    cut after the first line break at or after every `shard_size` bytes."""
+    size = os.path.getsize(path)
+    shards = []
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            end = start + shard_size
+            if end < size:
+                # a line break right before `end` ends the shard there
+                f.seek(end - 1)
+                f.readline()
+                end = f.tell()
+            end = min(end, size)
+            shards.append((start, end))
+            start = end
+    return shards
+
+
+def _read_lines(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while start < end:
+            line = f.readline()
+            if not line:
+                break
+            start += len(line)
+            yield line.decode('utf-8')
+
+
+def _normalize_shard(path, start, end, part):
+    """Normalize the lines of `path` between `start` and `end` into the
+    file `part` and return the number of lines."""
+    lines = 0
+    tmp = part + '.tmp'
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as out:
+        for chunk in _normalizer.normalize_stream(_read_lines(path, start,
+                                                              end)):
+            lines += chunk.count('\n')
+            out.write(chunk)
+    os.replace(tmp, part)
+    return lines
+
+
+def _part_name(output, start, end):
+    return '%s.part-%d-%d' % (output, start, end)
+
+
+def _assemble(output, parts):
+    tmp = output + '.tmp'
+    with open(tmp, 'wb') as out:
+        for part in parts:
+            with open(part, 'rb') as f:
+                while True:
+                    block = f.read(1 << 20)
+                    if not block:
+                        break
+                    out.write(block)
+    os.replace(tmp, output)
+    for part in parts:
+        os.remove(part)
+
+
+class Progress(object):
+    """Count the bytes and lines normalized and report the throughput."""
+
+    def __init__(self, total_bytes, log=None, interval=1.0):
+        self.total_bytes = total_bytes
+        self.done_bytes = 0
+        self.skipped_bytes = 0
+        self.lines = 0
+        self.log = log
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.reported = self.started
+
+    def skip(self, size):
+        """Count `size` bytes normalized by an earlier run."""
+        self.done_bytes += size
+        self.skipped_bytes += size
+
+    def add(self, size, lines):
+        self.done_bytes += size
+        self.lines += lines
+        now = time.perf_counter()
+        if now - self.reported >= self.interval:
+            self.reported = now
+            self.report()
+
+    def rates(self):
+        """Return MB/s and lines/s of this run."""
+        seconds = max(time.perf_counter() - self.started, 1e-9)
+        done = self.done_bytes - self.skipped_bytes
+        return done / seconds / 1e6, self.lines / seconds
+
+    def report(self, prefix=''):
+        if self.log is None:
+            return
+        mb_per_s, lines_per_s = self.rates()
+        self.log('%s%.1f/%.1f MB, %d lines, %.2f MB/s, %.0f lines/s' % (
+            prefix, self.done_bytes / 1e6, self.total_bytes / 1e6,
+            self.lines, mb_per_s, lines_per_s))
+
+
+def normalize_corpus(inputs, output_dir, workers=None,
+                     shard_size=64 << 20, restart=False, log=None):
+    """Normalize the ``(path, name)`` files of `inputs` into `output_dir`
+    on `workers` processes and return the Progress of the run."""
+    files = []
+    for path, name in inputs:
+        output = os.path.join(output_dir, name)
+        shards = [(start, end, _part_name(output, start, end))
+                  for start, end in plan_shards(path, shard_size)]
+        files.append((path, output, shards))
+    progress = Progress(sum(os.path.getsize(path) for path, _ in inputs),
+                        log)
+
+    missing = {}
+    jobs = []
+    for path, output, shards in files:
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        if restart:
+            for name in glob.glob(glob.escape(output) + '.part-*'):
+                os.remove(name)
+        elif os.path.exists(output):
+            progress.skip(sum(end - start for start, end, _ in shards))
+            continue
+        missing[output] = set()
+        for start, end, part in shards:
+            if not restart and os.path.exists(part):
+                progress.skip(end - start)
+            else:
+                missing[output].add(part)
+                jobs.append((path, start, end, part, output))
+        if not missing[output]:
+            _assemble(output, [part for _, _, part in shards])
+
+    parts = {output: [part for _, _, part in shards]
+             for _, output, shards in files}
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker)
+    pending = {}
+    jobs.reverse()
+    try:
+        while jobs or pending:
+            while jobs and len(pending) < 2 * workers:
+                path, start, end, part, output = job = jobs.pop()
+                pending[executor.submit(_normalize_shard, path, start, end,
+                                        part)] = job
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, start, end, part, output = pending.pop(future)
+                progress.add(end - start, future.result())
+                missing[output].discard(part)
+                if not missing[output]:
+                    _assemble(output, parts[output])
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+    progress.report('done: ')
+    return progress
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m num2words.corpus',
+        description=__doc__.splitlines()[0])
+    parser.add_argument('inputs', nargs='+',
+                        help='files, directories or glob patterns')
+    parser.add_argument('-o', '--output', required=True,
+                        help='output directory')
+    parser.add_argument('--pattern', default='*',
+                        help='file names to take from directories')
+    parser.add_argument('--workers', type=int,
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--shard-size', type=int, default=64,
+                        help='MB per shard (default: 64)')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore the work of an earlier run')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+    if args.shard_size < 1:
+        parser.error('--shard-size must be at least 1')
+
+    try:
+        inputs = find_inputs(args.inputs, args.pattern)
+    except ValueError as e:
+        parser.error(str(e))
+    log = None if args.quiet else (
+        lambda message: print(message, file=sys.stderr))
+    try:
+        normalize_corpus(inputs, args.output, workers=args.workers,
+                         shard_size=args.shard_size << 20,
+                         restart=args.restart, log=log)
+    except KeyboardInterrupt:
+        print('interrupted, run again to resume', file=sys.stderr)
+        return 130
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Spell out columns of a CSV file.
+
+``num2words csv`` (or ``python -m num2words.csvcolumns``) reads a CSV file
+with a header row and appends, for every ``--column``, a column with its
+values in words::
+
+    num2words csv -c amount -l lb -t currency orders.csv > orders_words.csv
+
+The rows are read, converted and written in chunks of ``--chunk-size``
+rows, so the memory used does not depend on the size of the file. With
+``--workers`` the chunks are converted on a pool of processes and written
+in the input order. Empty cells give empty words; a value that cannot be
+converted gives an empty cell and a message on standard error, and the
+exit status is then 1.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import csv
+import io
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import CONVERTER_CLASSES, _batch_converter
+from .batch import describe_error
+from .parallel import _warm_up
+
+
+def convert_rows(rows, indices, lang='en', to='cardinal', kwargs=None,
+                 width=0):
+    """Return `rows`, padded to `width` cells, with the words of the
+    columns at `indices` appended, and the ``(row offset, column index,
+    error)`` tuples of the values that could not be converted."""
+    convert = _batch_converter(lang, to, kwargs or {})
+    converted = []
+    errors = []
+    for offset, row in enumerate(rows):
+        words = []
+        for index in indices:
+            value = row[index].strip() if index < len(row) else ''
+            if not value:
+                words.append('')
+                continue
+            try:
+                words.append(convert(value))
+            except Exception as err:
+                words.append('')
+                errors.append((offset, index, describe_error(err)))
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        converted.append(row + words)
+    return converted, errors
+
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_chunks(rows, indices, lang='en', to='cardinal', kwargs=None,
+                   width=0, chunk_size=1000, executor=None, workers=1):
+    """Yield the results of convert_rows() for the chunks of `rows`, in
+    order. With an `executor`, up to two chunks per worker are converted
+    at the same time and no more are read ahead."""
+    chunks = _chunks(rows, chunk_size)
+    if executor is None:
+        for chunk in chunks:
+            yield convert_rows(chunk, indices, lang, to, kwargs, width)
+        return
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(convert_rows, chunk, indices,
+                                           lang, to, kwargs, width))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def convert_csv(infile, outfile, columns, lang='en', to='cardinal',
+                kwargs=None, suffix='_words', delimiter=',', chunk_size=1000,
+                workers=1, errfile=None, name='<stdin>'):
+    """Copy the CSV of `infile` to `outfile` with a words column appended
+    for each of the `columns`, named after it with `suffix`.
+
+    Raises ValueError if the file has no header or one of the `columns`
+    is not in it. Returns the number of values that could not be
+    converted; they are reported on `errfile` as
+    ``name:row: column: value: error``.
+    """
+    reader = csv.reader(infile, delimiter=delimiter)
+    writer = csv.writer(outfile, delimiter=delimiter, lineterminator='\n')
+    header = next(reader, None)
+    if header is None:
+        raise ValueError('%s: the file is empty, a header is required'
+                         % name)
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError('%s: no column %s in the header'
+                         % (name, ', '.join(missing)))
+    indices = [header.index(column) for column in columns]
+    # Fail before reading any row for an unknown lang/to
+    _batch_converter(lang, to, kwargs or {})
+    writer.writerow(header + [column + suffix for column in columns])
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_warm_up,
+                                       initargs=((lang,),))
+    failed = 0
+    row_number = 1
+    try:
+        for rows, errors in convert_chunks(reader, indices, lang, to, kwargs,
+                                           len(header), chunk_size, executor,
+                                           workers):
+            writer.writerows(rows)
+            for offset, index, message in errors:
+                failed += 1
+                if errfile is not None:
+                    errfile.write('%s:%d: %s: %s: %s\n' % (
+                        name, row_number + offset + 1, header[index],
+                        rows[offset][index], message))
+            row_number += len(rows)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    return failed
+
+
+def main(argv=None, prog='python -m num2words.csvcolumns'):
+    parser = argparse.ArgumentParser(prog=prog,
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('input', nargs='?',
+                        help='CSV file (default: standard input)')
+    parser.add_argument('-o', '--output',
+                        help='output file (default: standard output)')
+    parser.add_argument('-c', '--column', action='append', required=True,
+                        help='column to spell out, may be repeated')
+    parser.add_argument('-l', '--lang', default='en')
+    parser.add_argument('-t', '--to', default='cardinal')
+    parser.add_argument('--suffix', default='_words',
+                        help='appended to the column names for the new '
+                        'columns (default: %(default)s)')
+    parser.add_argument('-d', '--delimiter', default=',')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='rows converted at once (default: 1000)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes converting chunks (default: 1)')
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if len(args.delimiter) != 1:
+        parser.error('--delimiter must be one character')
+    try:
+        CONVERTER_CLASSES.resolve(args.lang)
+    except NotImplementedError:
+        parser.error('unknown language: %s' % args.lang)
+
+    if args.input:
+        infile = open(args.input, encoding='utf-8', newline='')
+    else:
+        infile = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8',
+                                  newline='')
+    if args.output:
+        outfile = open(args.output, 'w', encoding='utf-8', newline='')
+    else:
+        outfile = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                                   newline='')
+    try:
+        with infile:
+            failed = convert_csv(
+                infile, outfile, args.column, args.lang, args.to,
+                suffix=args.suffix, delimiter=args.delimiter,
+                chunk_size=args.chunk_size, workers=args.workers,
+                errfile=sys.stderr, name=args.input or '<stdin>')
+    except (ValueError, NotImplementedError) as err:
+        print('%s: %s' % (prog, describe_error(err) if isinstance(
+            err, NotImplementedError) else err), file=sys.stderr)
+        return 2
+    finally:
+        outfile.flush()
+        if args.output:
+            outfile.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
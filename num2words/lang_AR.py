@@ -44,6 +44,11 @@ ARABIC_ONES = [
 
 
 class Num2Word_AR(Num2Word_Base):
+    CALL_STATE = Num2Word_Base.CALL_STATE + (
+        "number", "arabicPrefixText", "arabicSuffixText", "integer_value",
+        "_decimalValue", "partPrecision", "currency_unit", "currency_subunit",
+        "isCurrencyPartNameFeminine", "isCurrencyNameFeminine", "separator",
+        "arabicOnes")
     errmsg_toobig = "abs(%s) must be less than %s."
     MAXVAL = 10**51
 
@@ -409,6 +414,7 @@ class Num2Word_AR(Num2Word_Base):
         self.separator = ','
         self.currency_subunit = ('', '', '', '')
         self.currency_unit = ('', '', '', '')
+        self.partPrecision = 2
         self.arabicPrefixText = ""
         self.arabicSuffixText = ""
         self.arabicOnes = ARABIC_ONES
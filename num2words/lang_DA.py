@@ -21,6 +21,9 @@ from . import lang_EU
 
 
 class Num2Word_DA(lang_EU.Num2Word_EU):
+    CALL_STATE = lang_EU.Num2Word_EU.CALL_STATE + ("ordflag",)
+    CHUNK_STATE = ("ordflag",)
+
     GIGA_SUFFIX = "illiarder"
     MEGA_SUFFIX = "illioner"
 
@@ -96,8 +99,10 @@ class Num2Word_DA(lang_EU.Num2Word_EU):
     def to_ordinal(self, value):
         self.verify_ordinal(value)
         self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        try:
+            outword = self.to_cardinal(value)
+        finally:
+            self.ordflag = False
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
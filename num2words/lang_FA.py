@@ -89,9 +89,9 @@ class Num2Word_FA(object):
         pre = int(value)
 
         # Simple way of finding decimal places to update the precision
-        self.precision = abs(Decimal(str(value)).as_tuple().exponent)
+        precision = abs(Decimal(str(value)).as_tuple().exponent)
 
-        post = abs(value - pre) * 10**self.precision
+        post = abs(value - pre) * 10**precision
         if abs(round(post) - post) < 0.01:
             # We generally floor all values beyond our precision (rather than
             # rounding), but in cases where we have something like 1.239999999,
@@ -100,7 +100,7 @@ class Num2Word_FA(object):
             post = int(round(post))
         else:
             post = int(floor(post))
-        return pre, post, self.precision
+        return pre, post, precision
 
     def cardinal3(self, number):
         if number <= 19:
@@ -521,31 +521,31 @@ class Num2Word_JA(Num2Word_Base):
         )
 
     def splitnum(self, value, reading, prefer):
-        for elem in self.cards:
-            if elem > value:
-                continue
+        elem = self._scale_for(value)
+        if elem is None:
+            return None
 
-            out = []
-            if value == 0:
-                div, mod = 1, 0
-            else:
-                div, mod = divmod(value, elem)
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
 
-            if div == 1:
-                out.append((select_text(self.cards[1], reading, prefer), 1))
-            else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(
-                        div * select_text(self.cards[elem], reading, prefer),
-                        div * elem)]
-                out.append(self.splitnum(div, reading, prefer))
+        if div == 1:
+            out.append((select_text(self.cards[1], reading, prefer), 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(
+                    div * select_text(self.cards[elem], reading, prefer),
+                    div * elem)]
+            out.append(self.splitnum(div, reading, prefer))
 
-            out.append((select_text(self.cards[elem], reading, prefer), elem))
+        out.append((select_text(self.cards[elem], reading, prefer), elem))
 
-            if mod:
-                out.append(self.splitnum(mod, reading, prefer))
+        if mod:
+            out.append(self.splitnum(mod, reading, prefer))
 
-            return out
+        return out
 
     def to_cardinal(self, value, reading=False, prefer=None):
         try:
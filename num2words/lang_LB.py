@@ -1,9 +1,19 @@
 from __future__ import print_function, unicode_literals
 
 import re
+from collections import namedtuple
+
 from .lang_EU import Num2Word_EU
 from num2words.base import parse_currency_parts
 
+# A unit Num2Word_LB.to_unit() spells out: its symbol (a regular
+# expression), its words for one and for several, its gender ('m', 'f' or
+# 'n') and the word for one in front of it ('ee', 'een' or 'eng'; picked
+# from the gender and the first letter when None)
+Unit = namedtuple('Unit',
+                  'symbol singular plural gender article guarded signed')
+Unit.__new__.__defaults__ = (None, False, False)
+
 
 class Num2Word_LB(Num2Word_EU):
 
@@ -98,6 +108,16 @@ class Num2Word_LB(Num2Word_EU):
             "nen": "ns", "rde": "rds", "rden": "rds"
         }
 
+    # Values whose words do not follow the rules of _cardinal_tables()
+    CARDINAL_EXCEPTIONS = {
+        13: "dräizéngten",
+        1100: "dausendeenhonnert",
+        1000000: "eng Millioun",
+        2000000: "zwee Milliounen",
+        1000000000: "eng Milliard",
+        2000000000: "zwee Milliarden",
+    }
+
     def to_cardinal(self, number):
         # Handle string inputs
         if isinstance(number, str):
@@ -109,138 +129,119 @@ class Num2Word_LB(Num2Word_EU):
             if number == -1:
                 return self.negword.strip() + " eent"
             return self.negword + self.to_cardinal(abs(number))
-        if number == 0:
-            return "null"
-        if number == 1:
-            return "een"
-        if number == 2:
-            return "zwee"
-        if number == 3:
-            return "dräi"
-        if number == 4:
-            return "véier"
-        if number == 5:
-            return "fënnef"
-        if number == 6:
-            return "sechs"
-        if number == 7:
-            return "siwen"
-        if number == 8:
-            return "aacht"
-        if number == 9:
-            return "néng"
-        if number == 10:
-            return "zéng"
-        if number == 11:
-            return "eelef"
-        if number == 12:
-            return "zwielef"
-        if number == 13:
-            return "dräizéngten"
-        if number == 14:
-            return "véierzéng"
-        if number == 15:
-            return "fofzéng"
-        if number == 16:
-            return "siechzéng"
-        if number == 17:
-            return "siwwenzéng"
-        if number == 18:
-            return "uechtzéng"
-        if number == 19:
-            return "nonzéng"
-        # CHANGED: 100 and 100s use 'honnert', not 'eenhonnert'
-        if number == 100:
-            return "honnert"
-        if number == 1000:
-            return "dausend"
-        if number == 1001:
-            return "dausendeent"
-        if number == 1100:
-            return "dausendeenhonnert"
-        if number == 1000000:
-            return "eng Millioun"
-        if number == 2000000:
-            return "zwee Milliounen"
-        if number == 1000000000:
-            return "eng Milliard"
-        if number == 2000000000:
-            return "zwee Milliarden"
-        number = round(number, 2)
-        if number < 10:
+        if not isinstance(number, int):
+            if number != int(number):
+                return self._cardinal_fraction(number)
+            number = int(number)
+        words, thousands, rests, groups = self._cardinal_tables()
+        if number < 1000:
+            return words[number]
+        exception = self.CARDINAL_EXCEPTIONS.get(number)
+        if exception is not None:
+            return exception
+        if number < 100000:
+            return thousands[number // 1000] + rests[number % 1000]
+        if number >= self.MAXVAL:
             return super().to_cardinal(number)
-        if 10 <= number < 20:
-            return super().to_cardinal(number)
-        if number % 10 == 0 and number < 100:
-            for n, word in self.mid_numwords:
-                if n == number:
-                    return word
-            if number == 20:
-                return "zwanzeg"
-        if 21 <= number <= 99 and number % 10 != 0:
+        return self._cardinal_groups(number, groups)
+
+    def _cardinal_tables(self):
+        """Return the tables to_cardinal() spells integers with, built on
+        first use:
+
+        * the words of 0..999,
+        * the words of 1000 times 0..99 and of 0..999 after them, which
+          make up 1000..99999,
+        * the words Num2Word_EU gives to 0..999 as a group of larger
+          numbers (e.g. 'zwanzegeent' for 21).
+        """
+        tables = self.__dict__.get('_cardinal_table_cache')
+        if tables is not None:
+            return tables
+        words = []
+        for number in range(1000):
+            words.append(self.CARDINAL_EXCEPTIONS.get(number)
+                         or self._compose_cardinal(number, words))
+        rests = ["", "eent"] + words[2:]
+        thousands = ["", "dausend"] + [word + "dausend"
+                                       for word in words[2:100]]
+        groups = [super(Num2Word_LB, self).to_cardinal(number)
+                  for number in range(1000)]
+        tables = self.__dict__['_cardinal_table_cache'] = (
+            tuple(words), tuple(thousands), tuple(rests), tuple(groups))
+        return tables
+
+    def _compose_cardinal(self, number, words):
+        """Spell 0 <= `number` < 1000 from the smaller `words`."""
+        if number < 20:
+            return super().to_cardinal(number) if number != 1 else "een"
+        if number < 100:
+            unit = number % 10
+            ten_word = self._ten_word(number - unit)
+            if unit == 0:
+                return ten_word
+            unit_word = "een" if unit == 1 else super().to_cardinal(unit)
+            return unit_word + self._ten_joiner(ten_word) + ten_word
+        hundreds, rest = divmod(number, 100)
+        # 100-199 use 'honnert', not 'eenhonnert'
+        if hundreds == 1:
+            hundred_word = "honnert"
+        else:
+            hundred_word = words[hundreds] + "honnert"
+        if rest == 0:
+            return hundred_word
+        return hundred_word + ("eent" if rest == 1 else words[rest])
+
+    def _ten_word(self, ten):
+        for n, word in self.mid_numwords:
+            if n == ten:
+                return word
+        return "zwanzeg" if ten == 20 else f"[{ten}]"
+
+    def _ten_joiner(self, ten_word):
+        # Apply phonological rule: drop final -n before consonants (except
+        # n, d, t, z)
+        if ten_word.startswith(("véier", "fënnef", "fofzeg", "sech",
+                                "siwwen")):
+            return "a"  # "an" becomes "a" before consonants
+        return "an"
+
+    def _cardinal_groups(self, number, groups):
+        """Spell 100000 <= `number` < MAXVAL from its groups of three
+        digits, as Num2Word_EU merges them"""
+        parts = []
+        scale = 1
+        while number:
+            number, group = divmod(number, 1000)
+            if group:
+                if scale == 1:
+                    parts.append(groups[group])
+                else:
+                    parts.append(self.merge((groups[group], group),
+                                            (self.cards[scale], scale))[0])
+            scale *= 1000
+        return "".join(reversed(parts))
+
+    def _cardinal_fraction(self, number):
+        """Spell a Decimal with decimal places. Below 20 and outside the
+        ranges of the integer rules, Num2Word_EU spells the decimals; in
+        those ranges the integer rules are applied to the value as is."""
+        number = round(number, 2)
+        if 21 <= number <= 99:
             unit = int(number % 10)
-            ten = int(number - unit)
-            if unit == 1:
-                unit_word = "een"
-            else:
-                unit_word = super().to_cardinal(unit)
-            for n, word in self.mid_numwords:
-                if n == ten:
-                    ten_word = word
-                    break
-            else:
-                if ten == 20:
-                    ten_word = "zwanzeg"
+            ten_word = self._ten_word(int(number - unit))
+            unit_word = "een" if unit == 1 else super().to_cardinal(unit)
+            return unit_word + self._ten_joiner(ten_word) + ten_word
+        for low, high, scale in ((100, 199, 100), (200, 999, 100),
+                                 (1000, 9999, 1000), (10000, 99999, 1000)):
+            if low <= number <= high:
+                head, rest = divmod(number, scale)
+                word = "honnert" if scale == 100 else "dausend"
+                if head == 1 and low in (100, 1000):
+                    head_word = word
                 else:
-                    ten_word = f"[{ten}]"
-            # Apply phonological rule: drop final -n before consonants (except n, d, t, z)
-            if ten_word.startswith(("véier", "fënnef", "fofzeg", "sech", "siwwen")):
-                joiner = "a"  # "an" becomes "a" before consonants
-            else:
-                joiner = "an"
-            return unit_word + joiner + ten_word
-        # CHANGED: 100-199 use 'honnert', not 'eenhonnert'
-        if 100 <= number <= 199:
-            hundreds = number // 100
-            rest = number % 100
-            hundred_word = "honnert"
-            if rest == 0:
-                return hundred_word
-            if rest == 1:
-                return hundred_word + "eent"
-            return hundred_word + self.to_cardinal(rest)
-        if 200 <= number <= 999:
-            hundreds = number // 100
-            rest = number % 100
-            hundred_prefix = self.to_cardinal(hundreds)
-            hundred_word = hundred_prefix + "honnert"
-            if rest == 0:
-                return hundred_word
-            if rest == 1:
-                return hundred_word + "eent"
-            return hundred_word + self.to_cardinal(rest)
-        if 1000 <= number <= 9999:
-            thousands = number // 1000
-            rest = number % 1000
-            if thousands == 1:
-                thousand_word = "dausend"
-            else:
-                thousand_word = self.to_cardinal(thousands) + "dausend"
-            if rest == 0:
-                return thousand_word
-            if rest == 1:
-                return thousand_word + "eent"
-            return thousand_word + self.to_cardinal(rest)
-        if 10000 <= number <= 99999:
-            # Correctly handle 5-digit numbers like 19.565 as 19 dausend + 565
-            thousands = number // 1000
-            rest = number % 1000
-            thousand_word = self.to_cardinal(thousands) + "dausend"
-            if rest == 0:
-                return thousand_word
-            if rest == 1:
-                return thousand_word + "eent"
-            return thousand_word + self.to_cardinal(rest)
+                    head_word = self.to_cardinal(head) + word
+                return head_word + self.to_cardinal(rest)
         return super().to_cardinal(number)
 
     def merge(self, curr, next):
@@ -429,122 +430,122 @@ class Num2Word_LB(Num2Word_EU):
         result = result.replace("komma", "Komma")
         return result + " Prozent"
         
+    # Units to_unit() spells out after a number. `symbol` is a regular
+    # expression; `guarded` symbols must not follow a letter, digit or
+    # hyphen and must end a word, and `signed` ones take a leading minus.
+    # Two of a feminine unit are 'zwou'. The normalizer of
+    # num2words.normalizer spells out the same units.
+    UNITS = (
+        Unit(r'kg', 'Kilogramm', 'Kilogramm', 'n', 'ee', guarded=True),
+        Unit(r'ml', 'Milliliter', 'Milliliter', 'm', 'ee', guarded=True),
+        Unit(r'gr', 'Gramm', 'Gramm', 'n', 'ee', guarded=True),
+        Unit(r'\u00B0\s*C(?:elsius)?\b', 'Grad Celsius', 'Grad Celsius',
+             'm', 'ee', signed=True),
+        Unit(r'\u00B0\s*F(?:ahrenheit)?\b', 'Grad Fahrenheit',
+             'Grad Fahrenheit', 'm', 'ee', signed=True),
+        Unit('[\u00B0\u2103\u2109]', 'Grad', 'Grad', 'm', 'ee',
+             signed=True),
+        Unit(r'%', 'Prozent', 'Prozent', 'n', 'ee'),
+        Unit(r'Minutten', 'Minutt', 'Minutten', 'f', 'eng'),
+        Unit(r'Stonnen', 'Stonn', 'Stonnen', 'f', 'eng'),
+        Unit(r'Wochen', 'Woch', 'Wochen', 'f', 'eng'),
+        Unit(r'Monaten', 'Mount', 'Monaten', 'm', 'ee'),
+        Unit(r'Stroossen', 'Strooss', 'Stroossen', 'f', 'eng'),
+        Unit(r'Fläschen', 'Fläsch', 'Fläschen', 'f', 'eng'),
+        Unit(r'Maschinnen', 'Maschinn', 'Maschinnen', 'f', 'eng'),
+        Unit(r'Kilometer', 'Kilometer', 'Kilometer', 'm', 'ee'),
+    )
+
     def to_unit(self, text):
         """
         Convert expressions like '100ml' or '60gr' to text.
         Handles spaces between number and unit (e.g., '50 ml', '60 gr').
-        Also handles percentages like '25%' and temperature in '90°'.
-        
+        Also handles percentages like '25%', temperature in '90°' and
+        years with the -er suffix like '1970er'.
+
+        Every unit of UNITS is recognized by one regular expression, in a
+        single pass over `text`.
+
         Args:
             text (str): Text containing number with unit
-            
+
         Returns:
             str: Text with number converted to words and unit expanded
         """
-        # Process each unit type in sequence, from most specific to most general
-        result = text
-        
-        # Step 1: Handle negative temperatures (-X°)
-        # Note: We need to use a more specific pattern to avoid false matches
-        neg_temp_pattern = r'(?<![0-9])-(\d+)\s*[°\u00B0]'
-        
-        def replace_neg_temp(match):
-            num = int(match.group(1))
-            word = self.to_cardinal(num)
-            if num == 1:  # Special case for singular
-                word = "een"
-            return f"minus {word} Grad"
-            
-        result = re.sub(neg_temp_pattern, replace_neg_temp, result)
-        
-        # Step 2: Handle kilograms (kg)
-        # Making the pattern more specific to avoid partial matches
-        kg_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*kg\b'
-        
-        def replace_kg(match):
-            num = int(match.group(1))
-            word = self.to_cardinal(num)
-            if num == 1:  # Special case for singular - apply phonological rule
-                word = "ee"  # "ee Kilogramm" not "een Kilogramm" (K is consonant)
-            return f"{word} Kilogramm"
-            
-        result = re.sub(kg_pattern, replace_kg, result)
-        
-        # Step 3: Handle milliliters (ml)
-        # Making the pattern more specific
-        ml_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*ml\b'
-        
-        def replace_ml(match):
-            num = int(match.group(1))
-            word = self.to_cardinal(num)
-            if num == 1:  # Special case for singular - apply phonological rule
-                word = "ee"  # "ee Milliliter" not "een Milliliter" (M is consonant)
-            return f"{word} Milliliter"
-            
-        result = re.sub(ml_pattern, replace_ml, result)
-        
-        # Step 4: Handle grams (gr)
-        # Making the pattern more specific
-        gr_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*gr\b'
-        
-        def replace_gr(match):
-            num = int(match.group(1))
-            word = self.to_cardinal(num)
-            if num == 1:  # Special case for singular - apply phonological rule
-                word = "ee"  # "ee Gramm" not "een Gramm" (G is consonant)
-            return f"{word} Gramm"
-            
-        result = re.sub(gr_pattern, replace_gr, result)
-        
-        # Step 5: Handle temperature with degree symbol (X°)
-        # Use Unicode decimal value 176 (degree symbol)
-        temp_pattern = r'(\d+)\s*[\u00B0\u2103\u2109°]'
-        
-        def replace_temp(match):
-            num = int(match.group(1))
-            word = self.to_cardinal(num)
-            if num == 1:  # Special case for singular - apply phonological rule
-                word = "ee"  # "ee Grad" not "een Grad" (G is consonant)
-            return f"{word} Grad"
-            
-        result = re.sub(temp_pattern, replace_temp, result)
-        
-        # Step 6: Handle percentages (X%)
-        # Using Unicode decimal value 37 (percent symbol)
-        percent_pattern = r'(\d+)\s*%'
-        
-        def replace_percent(match):
-            num = int(match.group(1))
-            # Handle special cases
-            if num == 25:
-                return "fënnefanzwanzeg Prozent"
-            elif num == 50:
-                return "fofzeg Prozent"
-            elif num == 75:
-                return "fënnefasiwwenzeg Prozent"
+        pattern, branches = self._unit_recognizer()
+        return pattern.sub(lambda match: self._spell_unit(match, branches),
+                           text)
+
+    def _unit_recognizer(self):
+        """Return the regular expression matching a number followed by any
+        unit of UNITS, or a year with the -er suffix, and the
+        ``(unit, number group, sign group)`` of each of its branches by the
+        index of the group enclosing the branch. Built on first use and
+        whenever UNITS changes."""
+        cache = self.__dict__.get('_unit_recognizer_cache')
+        if cache is not None and cache[0] is self.UNITS:
+            return cache[1], cache[2]
+        parts = []
+        branches = {}
+        group = 0
+        for unit in self.UNITS:
+            sign = r'(?:(?<![0-9])(-))?' if unit.signed else ''
+            guard = r'(?<![a-zA-Z0-9-])' if unit.guarded else ''
+            end = r'\b' if unit.guarded else ''
+            parts.append(rf'({sign}{guard}(\d+)\s*(?:{unit.symbol}){end})')
+            if unit.signed:
+                branches[group + 1] = (unit, group + 3, group + 2)
+                group += 3
             else:
-                # General case
-                word = self.to_cardinal(num)
-                if num == 1:  # Apply phonological rule
-                    word = "ee"  # "ee Prozent" not "een Prozent" (P is consonant)
-                return f"{word} Prozent"
-            
-        result = re.sub(percent_pattern, replace_percent, result)
-        
-        # Step 7: Handle years with -er suffix (e.g., 1970er)
-        # Making the pattern more specific
-        year_pattern = r'\b(1\d{3}|20\d{2})er\b'
-        
-        def replace_year_with_suffix(match):
-            year = int(match.group(1))
-            # Convert the year to words
-            year_text = self.to_year(year)
-            # Add the -er suffix
-            return f"{year_text}er"
-        
-        result = re.sub(year_pattern, replace_year_with_suffix, result)
-        
-        return result
+                branches[group + 1] = (unit, group + 2, None)
+                group += 2
+        parts.append(r'(\b(1\d{3}|20\d{2})er\b)')
+        branches[group + 1] = (None, group + 2, None)
+        # Every branch starts with a minus or a digit: checking that first
+        # spares trying each of them at every position
+        pattern = re.compile(r'(?=[-\d])(?:%s)' % '|'.join(parts))
+        self.__dict__['_unit_recognizer_cache'] = (self.UNITS, pattern,
+                                                   branches)
+        return pattern, branches
+
+    def _spell_unit(self, match, branches):
+        unit, number, sign = branches[match.lastindex]
+        value = int(match.group(number))
+        if unit is None:
+            return f"{self.to_year(value)}er"
+        if sign is not None and match.group(sign):
+            # "minus een Grad": no article form after minus
+            return f"minus {self.to_cardinal(value)} {unit.plural}"
+        if value == 1:
+            return f"{self.unit_article(unit)} {unit.singular}"
+        if value == 2 and unit.gender == 'f':
+            return f"zwou {unit.plural}"
+        return f"{self.to_cardinal(value)} {unit.plural}"
+
+    def unit_article(self, unit):
+        """Return the word for one `unit`: its `article`, or else 'eng' for
+        feminine units, 'een' before a vowel or h, n, d, t, z and 'ee'
+        otherwise."""
+        if unit.article is not None:
+            return unit.article
+        if unit.gender == 'f':
+            return "eng"
+        if unit.singular[0].lower() in "aeiouäëéhndtz":
+            return "een"
+        return "ee"
+
+    def find_unit(self, symbol):
+        """Return the first unit of UNITS whose symbol matches all of
+        `symbol`, or None"""
+        cache = self.__dict__.get('_unit_symbol_cache')
+        if cache is None or cache[0] is not self.UNITS:
+            cache = self.__dict__['_unit_symbol_cache'] = (self.UNITS, {})
+        units = cache[1]
+        if symbol not in units:
+            units[symbol] = next((unit for unit in self.UNITS
+                                  if re.fullmatch(unit.symbol, symbol)),
+                                 None)
+        return units[symbol]
 
     # Helper for currency
     def _get_currency_parts(self, val):
@@ -26,6 +26,8 @@ CENTS = ('cêntimo', 'cêntimos')
 
 
 class Num2Word_PT(Num2Word_EU):
+    # to_currency() drops the trailing space of negword while it runs
+    CALL_STATE = Num2Word_EU.CALL_STATE + ("negword",)
 
     CURRENCY_FORMS = {
         'AUD': (DOLLAR, CENTS),
@@ -220,11 +222,13 @@ class Num2Word_PT(Num2Word_EU):
         # change negword because base.to_currency() does not need space after
         backup_negword = self.negword
         self.negword = self.negword[:-1]
-        result = super(Num2Word_PT, self).to_currency(
-            val, currency=currency, cents=cents, separator=separator,
-            adjective=adjective)
-        # undo the change on negword
-        self.negword = backup_negword
+        try:
+            result = super(Num2Word_PT, self).to_currency(
+                val, currency=currency, cents=cents, separator=separator,
+                adjective=adjective)
+        finally:
+            # undo the change on negword
+            self.negword = backup_negword
 
         # transforms "milhões euros" em "milhões de euros"
         cr1, _ = self.CURRENCY_FORMS[currency]
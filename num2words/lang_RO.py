@@ -21,6 +21,11 @@ from . import lang_EU
 
 
 class Num2Word_RO(lang_EU.Num2Word_EU):
+    # to_currency() swaps gen_numwords[1] while it runs
+    CALL_STATE = lang_EU.Num2Word_EU.CALL_STATE + (
+        "gen_numwords", "numwords_inflections")
+    CHUNK_STATE = ("gen_numwords",)
+
     GIGA_SUFFIX = "iliard/e"
     MEGA_SUFFIX = "ilion"
     # inflection for mi/billion follows different rule
@@ -48,16 +53,9 @@ fi convertit în cuvinte (abs(%s) > %s)."
                              "unsprezece", "zece", "nouă", "opt", "șapte",
                              "șase", "cinci", "patru", "trei", "doi",
                              "unu", "zero"]
-        self.gen_numwords = ["", "o", "două", "trei", "patru", "cinci",
-                             "șase", "șapte", "opt", "nouă"]
         self.gen_numwords_n = ["", "un", "două", "trei", "patru", "cinci",
                                "șase", "șapte", "opt", "nouă"]
-        self.numwords_inflections = {
-            100: self.gen_numwords,
-            1000: self.gen_numwords,
-            1000000: self.gen_numwords_n,
-            1000000000: self.gen_numwords_n
-        }
+        self.set_gen_numwords("o")
         self.ords = {"unu": "primul",
                      "doi": "al doilea",
                      "three": "al treilea",
@@ -66,6 +64,16 @@ fi convertit în cuvinte (abs(%s) > %s)."
                      "nouă": "al nouălea",
                      "doisprezece": "al doisprezecelea"}
 
+    def set_gen_numwords(self, one):
+        self.gen_numwords = ["", one, "două", "trei", "patru", "cinci",
+                             "șase", "șapte", "opt", "nouă"]
+        self.numwords_inflections = {
+            100: self.gen_numwords,
+            1000: self.gen_numwords,
+            1000000: self.gen_numwords_n,
+            1000000000: self.gen_numwords_n
+        }
+
     def merge(self, lpair, rpair):
         ltext, lnum = lpair
         rtext, rnum = rpair
@@ -137,15 +145,17 @@ fi convertit în cuvinte (abs(%s) > %s)."
     def to_currency(self, val, currency="RON", cents=False, separator=" și",
                     adjective=False):
         # romanian currency has a particularity for numeral: one
-        self.gen_numwords[1] = "una"
-        result = super(Num2Word_RO, self).to_currency(
-            int(round(val*100)),
-            currency,
-            True,
-            separator,
-            adjective
-        )
-        self.gen_numwords[1] = "o"  # revert numeral
+        self.set_gen_numwords("una")
+        try:
+            result = super(Num2Word_RO, self).to_currency(
+                int(round(val*100)),
+                currency,
+                True,
+                separator,
+                adjective
+            )
+        finally:
+            self.set_gen_numwords("o")  # revert numeral
         return result.replace(
             "unu leu", "un leu"
         ).replace(
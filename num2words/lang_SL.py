@@ -22,6 +22,9 @@ from .lang_EU import Num2Word_EU
 
 
 class Num2Word_SL(Num2Word_EU):
+    CALL_STATE = Num2Word_EU.CALL_STATE + ("ordflag",)
+    CHUNK_STATE = ("ordflag",)
+
     GIGA_SUFFIX = "ilijard"
     MEGA_SUFFIX = "ilijon"
 
@@ -144,8 +147,10 @@ class Num2Word_SL(Num2Word_EU):
     def to_ordinal(self, value):
         self.verify_ordinal(value)
         self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        try:
+            outword = self.to_cardinal(value)
+        finally:
+            self.ordflag = False
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
@@ -25,6 +25,10 @@ CENTS = ('sentavu', 'sentavu')
 
 
 class Num2Word_TET(Num2Word_EU):
+    # merge() counts the groups it has joined without "ho" during the
+    # current conversion, so its result depends on earlier merges
+    CALL_STATE = Num2Word_EU.CALL_STATE + ("count",)
+    CHUNK_STATE = None
 
     CURRENCY_FORMS = {
         'AUD': (DOLLAR, CENTS),
@@ -130,6 +134,7 @@ class Num2Word_TET(Num2Word_EU):
         return result
 
     def to_cardinal(self, value):
+        self.count = 0
         result = super().to_cardinal(value)
 
         results = self.remove_ho(result, value)
@@ -137,6 +142,7 @@ class Num2Word_TET(Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
+        self.count = 0
         out = ""
         val = self.splitnum(value)
         outs = val
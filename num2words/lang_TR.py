@@ -22,6 +22,10 @@ from .base import Num2Word_Base
 
 
 class Num2Word_TR(Num2Word_Base):
+    CALL_STATE = Num2Word_Base.CALL_STATE + (
+        "integers_to_read", "total_triplets_to_read",
+        "total_digits_outside_triplets", "order_of_last_zero_digit")
+
     def __init__(self):
         self.precision = 2
         self.negword = u"eksi"
@@ -23,6 +23,10 @@ from .currency import parse_currency_parts
 
 
 class Num2Word_ZH(Num2Word_Base):
+    CALL_STATE = Num2Word_Base.CALL_STATE + (
+        "reading", "prefer", "capital", "stuff_zero")
+    CHUNK_STATE = ("reading", "prefer", "stuff_zero")
+
     CURRENCY_FLOATS = ["角", "分"]
 
     CURRENCY_FORMS = {
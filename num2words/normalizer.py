@@ -0,0 +1,1560 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Normalization engine for Luxembourgish text.
+
+Numbers, dates, times, units and abbreviations are spelled out by
+LuxembourgishNormalizer (and by TextNormalizer, the older pipeline behind
+run_num2words). All of them use the Num2Word_LB converter of
+``CONVERTER_CLASSES['lb']``, which the whole process shares, and all
+LuxembourgishNormalizers created without rules of their own share
+DEFAULT_RULES and its compiled pattern::
+
+    >>> from num2words.normalizer import default_normalizer
+    >>> default_normalizer().normalize('Den 1. Mee 2020 um 17:30')
+
+Run ``python -m num2words.normalizer`` to normalize a file.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+
+from num2words import CONVERTER_CLASSES
+from num2words.cache import ResultCache
+from num2words.lang_LB import Num2Word_LB
+
+
+def unit_pattern(units):
+    """Return the pattern of the 'unit' rule of LuxembourgishNormalizer
+    for `units`, rows like those of Num2Word_LB.UNITS"""
+    symbols = []
+    for unit in units:
+        # a guarded symbol, like 'ml' in '5 ml 2020', is part of a month
+        # to normalize_dates(), which runs first
+        guard = r'(?![A-Za-zäëöüÄËÖÜ]* \d{4})' if unit.guarded else ''
+        symbols.append(f'(?:{unit.symbol}){guard}')
+    return rf"(?P<u_number>\d+)\s*(?P<u_unit>{'|'.join(symbols)})"
+
+
+def singular_pattern(units):
+    """Return a pattern matching the singular of any of `units`"""
+    return '|'.join(re.escape(unit.singular) for unit in units)
+
+
+class NormalizationRule:
+    """A rule of LuxembourgishNormalizer.normalize(): where `pattern`
+    matches, the text is replaced by ``handler(normalizer, match)``.
+
+    Rules with a lower `priority` are tried first when several match at
+    the same position."""
+
+    def __init__(self, name, pattern, handler, priority, enabled=True):
+        self.name = name
+        self.pattern = pattern
+        self.handler = handler
+        self.priority = priority
+        self.enabled = enabled
+
+    def __repr__(self):
+        state = '' if self.enabled else ', enabled=False'
+        return (f"NormalizationRule({self.name!r}, {self.pattern!r}, "
+                f"priority={self.priority}{state})")
+
+
+class RuleRegistry:
+    """Ordered set of NormalizationRules, compiled into a single pattern.
+
+    The pattern is compiled on first use and kept until a rule is added,
+    removed, enabled or disabled; `compile_seconds` is the time the last
+    compilation took. All normalizers created without a registry of their
+    own share DEFAULT_RULES, so changing it affects all of them; use
+    copy() to customize one normalizer only::
+
+        rules = DEFAULT_RULES.copy()
+        rules.disable('abbreviation')
+        rules.add('euro', r'(?P<eu_amount>[0-9]+) ?€', euro_handler,
+                  priority=55)
+        normalizer = LuxembourgishNormalizer(rules=rules)
+    """
+
+    def __init__(self, rules=()):
+        self._rules = {}
+        self._compiled = None
+        self.compile_seconds = None
+        for rule in rules:
+            self._add(rule)
+
+    def __iter__(self):
+        return iter(sorted(self._rules.values(),
+                           key=lambda rule: rule.priority))
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __contains__(self, name):
+        return name in self._rules
+
+    def __getitem__(self, name):
+        return self._rules[name]
+
+    def copy(self):
+        return RuleRegistry(NormalizationRule(rule.name, rule.pattern,
+                                              rule.handler, rule.priority,
+                                              rule.enabled)
+                            for rule in self._rules.values())
+
+    def _add(self, rule):
+        if not rule.name.isidentifier():
+            raise ValueError(
+                f"rule names must be identifiers: {rule.name!r}")
+        if rule.name in self._rules:
+            raise ValueError(f"there is a rule named {rule.name!r} already")
+        groups = set(re.compile(rule.pattern).groupindex) | {rule.name}
+        for other in self._rules.values():
+            other_groups = set(re.compile(other.pattern).groupindex)
+            clash = groups & (other_groups | {other.name})
+            if clash:
+                raise ValueError(f"rule {rule.name!r} reuses the group names "
+                                 f"{sorted(clash)} of rule {other.name!r}")
+        self._rules[rule.name] = rule
+        self._compiled = None
+
+    def add(self, name, pattern, handler, priority=None, enabled=True):
+        """Add a rule and return it. Without a `priority` the rule is
+        tried after all the others."""
+        if priority is None:
+            priority = max((rule.priority for rule in self._rules.values()),
+                           default=0) + 10
+        rule = NormalizationRule(name, pattern, handler, priority, enabled)
+        self._add(rule)
+        return rule
+
+    def remove(self, name):
+        del self._rules[name]
+        self._compiled = None
+
+    def enable(self, *names):
+        self._set_enabled(names, True)
+
+    def disable(self, *names):
+        self._set_enabled(names, False)
+
+    def _set_enabled(self, names, enabled):
+        for name in names:
+            self._rules[name].enabled = enabled
+        self._compiled = None
+
+    def compile(self):
+        """Return the combined pattern of the enabled rules and a dict
+        mapping their names to their handlers."""
+        if self._compiled is None:
+            started = time.perf_counter()
+            rules = [rule for rule in self if rule.enabled]
+            # A pattern that can never match keeps search() working when
+            # every rule is disabled
+            pattern = re.compile('|'.join(f"(?P<{rule.name}>{rule.pattern})"
+                                          for rule in rules)
+                                 or '(?!)')
+            handlers = {rule.name: rule.handler for rule in rules}
+            self._compiled = pattern, handlers
+            self.compile_seconds = time.perf_counter() - started
+        return self._compiled
+
+
+class NormalizationProfile:
+    """Statistics of the stages of the normalizers created with this profile.
+
+    For every stage, `calls` counts how often it ran, `seconds` the wall
+    time it took, `matches` the text it replaced, `bytes_in` and
+    `bytes_out` the UTF-8 size of its input and output and
+    `converter_calls` the to_*() calls it made on the Num2Word_LB
+    converter. The stages of LuxembourgishNormalizer.normalize() are
+    'prepare_lines' (phone numbers and line endings), 'scan' and, within
+    the scan, every rule by name ('date', 'time', ..., 'number'), whose
+    matches are its tokens.
+
+    `callback`, if given, is called with the statistics of every
+    normalized text (every chunk for normalize_stream()) in the form of
+    as_dict(), e.g. to export them::
+
+        profile = NormalizationProfile(callback=metrics.observe)
+        normalizer = LuxembourgishNormalizer(profile=profile)
+    """
+
+    FIELDS = ('calls', 'seconds', 'matches', 'bytes_in', 'bytes_out',
+              'converter_calls')
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def record(stats, stage, seconds, matches, text_in, text_out,
+               converter_calls):
+        """Add a run of `stage` to `stats`, a dict of one text's statistics"""
+        totals = stats.get(stage)
+        if totals is None:
+            totals = stats[stage] = [0, 0.0, 0, 0, 0, 0]
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] += matches
+        totals[3] += len(text_in.encode('utf-8'))
+        totals[4] += len(text_out.encode('utf-8'))
+        totals[5] += converter_calls
+
+    def add(self, stats):
+        """Add the statistics of one text, see record()"""
+        with self._lock:
+            for stage, values in stats.items():
+                totals = self._stages.setdefault(stage, [0] * len(values))
+                for index, value in enumerate(values):
+                    totals[index] += value
+        if self.callback is not None:
+            self.callback(self._as_dict(stats))
+
+    def _as_dict(self, stages):
+        return {stage: dict(zip(self.FIELDS, values))
+                for stage, values in stages.items()}
+
+    def as_dict(self):
+        """Return the statistics so far as ``{stage: {field: value}}``"""
+        with self._lock:
+            return self._as_dict(self._stages)
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+
+class CountingConverter:
+    """Proxy of a converter counting the calls of its to_*() methods, per
+    thread"""
+
+    def __init__(self, converter):
+        self.converter = converter
+        self._local = threading.local()
+
+    @property
+    def calls(self):
+        return getattr(self._local, 'calls', 0)
+
+    def __getattr__(self, name):
+        attr = getattr(self.converter, name)
+        if not name.startswith('to_') or not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            self._local.calls = self.calls + 1
+            return attr(*args, **kwargs)
+        return counted
+
+
+class LuxembourgishNormalizer:
+    # Luxembourgish letter pronunciations
+    letter_pronunciations = {
+        'A': 'AA', 'B': 'BEE', 'C': 'ZEE', 'D': 'DEE', 'E': 'EE',
+        'F': 'ÄFF', 'G': 'GEE', 'H': 'HASCH', 'I': 'I', 'J': 'JOTT',
+        'K': 'KA', 'L': 'ÄLL', 'M': 'ÄMM', 'N': 'ÄNN', 'O': 'O',
+        'P': 'PEE', 'Q': 'KU', 'R': 'ÄRR', 'S': 'ÄSS', 'T': 'TEE',
+        'U': 'U', 'V': 'FAU', 'W': 'WEE', 'X': 'ICKS', 'Y': 'I-GRÄCK',
+        'Z': 'ZÄTT', 'Ä': 'Ä', 'Ö': 'Ö', 'Ü': 'Ü'
+    }
+
+    # Custom dictionary for word-based abbreviations
+    word_abbreviations = {
+        'FIFA': 'FIFA',
+        'NATO': 'NATO',
+        'UNO': 'UNO',
+        'EU': 'EU',
+        'USA': 'USA',
+        'UNESCO': 'UNESCO',
+        'UNICEF': 'UNICEF',
+        'WHO': 'WHO',
+        'UN': 'UN',
+        'EU': 'EU',
+        'UNO': 'UNO'
+    }
+
+    # Patterns of the one pass per rule pipeline, see normalize_passes()
+    # den 30. Abrëll 2010, de 15. Mee 1982, um 5. Juli 2021, 5. Juli 2021, etc.
+    date_pattern = re.compile(
+        r'(?P<article>(?:dem |den |de |um )?)'
+        r'(?P<day>\d{1,2})\. ?'
+        r'(?P<month>[A-Za-zäëöüÄËÖÜ]+) '
+        r'(?P<year>\d{4})'
+    )
+    # Numeric date: den 28.11.1733, 28.11.1733, etc.
+    numeric_date_pattern = re.compile(
+        r'(?P<article>(?:dem |den |de |um )?)'
+        r'(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4})'
+    )
+    # Month + year: Abrëll 1887, Oktober 1344, etc.
+    month_year_pattern = re.compile(
+        r'(?P<article>(?:dem |den |de |um )?)'
+        r'(?P<month>[A-Za-zäëöüÄËÖÜ]+) '
+        r'(?P<year>\d{4})'
+    )
+    # Ordinal dates without year: 6. Abrëll, 7. Plaz, etc.
+    ordinal_date_pattern = re.compile(
+        r'(?P<article>(?:dem |den |de |déi |an dësen )?)'
+        r'(?P<day>\d{1,2})\. ?'
+        r'(?P<month>[A-Za-zäëöüÄËÖÜ]+)'
+    )
+    # DD.M format: 22.3. (22nd of March)
+    numeric_month_pattern = re.compile(
+        r'(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.')
+    phone_digits_pattern = re.compile(r'\d{2,}')
+    decimal_percent_pattern = re.compile(r'(\d+[,.]\d+)\s*%')
+    year_suffix_pattern = re.compile(r'\b(1\d{3}|20\d{2})er\b')
+    number_pattern = re.compile(r'\b\d+\b')
+    # Only match valid times: hours 0-24, minutes 00-59
+    time_dot_pattern = re.compile(r'\b([01]?\d|2[0-4])\.([0-5]\d)\b')
+    time_pattern = re.compile(r'\b([01]?\d|2[0-4]):([0-5]\d)\b')
+    time_h_pattern = re.compile(r'\b([01]?\d|2[0-4])h([0-5]\d)\b')
+    auer_twice_pattern = re.compile(r'(Auer)\s+\1')
+    auer_after_pattern = re.compile(r'(Auer [^\s]+) Auer')
+    # Numbers with dots or spaces as thousand separators
+    large_number_pattern = re.compile(r'\b(\d{1,3}(?:[\.\s]\d{3})+)\b')
+    # Number + large unit (e.g., 961 Milliarden)
+    large_word_pattern = re.compile(r'(\d+)\s+(Milliarden?|Milliounen?)',
+                                    re.IGNORECASE)
+    # Match numbers 0-999 for sports scores (basketball, handball, etc.)
+    match_result_pattern = re.compile(r'\b(\d{1,3})[:\-](\d{1,3})\b')
+    # Match 2+ consecutive capital letters (abbreviations)
+    abbreviation_pattern = re.compile(r'\b[A-ZÄÖÜ]{2,}\b')
+
+    def __init__(self, rules=None, profile=None, segment_cache=None):
+        self.lb = CONVERTER_CLASSES['lb']
+        self.rules = DEFAULT_RULES if rules is None else rules
+        # Results of normalize_incremental() by segment
+        if segment_cache is None:
+            segment_cache = ResultCache(maxsize=1024)
+        self.segment_cache = segment_cache
+        self._segment_rules = None
+        # NormalizationProfile the stages are recorded in, if any
+        self.profile = profile
+        if profile is not None:
+            self.lb = CountingConverter(self.lb)
+        self.months = {
+            'januar': 'Januar', 'februar': 'Februar', 'mäerz': 'Mäerz',
+            'abrëll': 'Abrëll', 'mee': 'Mee', 'juni': 'Juni', 'juli': 'Juli',
+            'august': 'August', 'september': 'September',
+            'oktober': 'Oktober', 'november': 'November',
+            'dezember': 'Dezember'
+        }
+        self.articles = ['den', 'de', 'um']
+
+    def adjust_ordinal_for_following_word(self, ordinal, following_word):
+        if not following_word:
+            return ordinal
+        first_letter = following_word[0].lower()
+        if first_letter in 'aeiouäëöündtz':
+            return ordinal
+        if ordinal.endswith('n'):
+            return ordinal[:-1]
+        return ordinal
+
+    def normalize_dates(self, text):
+        # Handle articles before dates
+        def date_repl(match):
+            article = match.group('article') or ''
+            day = int(match.group('day'))
+            month = match.group('month').lower()
+            year = int(match.group('year'))
+            month_name = self.months.get(month, month.capitalize())
+            day_ordinal = self.lb.to_ordinal(day)
+            day_ordinal = self.adjust_ordinal_for_following_word(
+                day_ordinal, month_name)
+            year_text = self.lb.to_year(year)
+            return f"{article}{day_ordinal} {month_name} {year_text}"
+
+        text = self.date_pattern.sub(date_repl, text)
+
+        # Numeric date: den 28.11.1733, 28.11.1733, etc.
+        def numeric_date_repl(match):
+            article = match.group('article') or ''
+            day = int(match.group('day'))
+            month_num = int(match.group('month'))
+            year = int(match.group('year'))
+            month_names = list(self.months.values())
+            if 1 <= month_num <= 12:
+                month_name = month_names[month_num - 1]
+            else:
+                month_name = f"Monat {month_num}"
+            day_ordinal = self.lb.to_ordinal(day)
+            day_ordinal = self.adjust_ordinal_for_following_word(
+                day_ordinal, month_name)
+            year_text = self.lb.to_year(year)
+            return f"{article}{day_ordinal} {month_name} {year_text}"
+
+        text = self.numeric_date_pattern.sub(numeric_date_repl, text)
+
+        # Month + year: Abrëll 1887, Oktober 1344, etc.
+        def month_year_repl(match):
+            article = match.group('article') or ''
+            month = match.group('month').lower()
+            year = int(match.group('year'))
+            month_name = self.months.get(month, month.capitalize())
+            year_text = self.lb.to_year(year)
+            return f"{article}{month_name} {year_text}"
+
+        text = self.month_year_pattern.sub(month_year_repl, text)
+
+        return text
+
+    def normalize_ordinal_dates(self, text):
+        """Handle ordinal dates like '6. Abrëll' without year"""
+        def ordinal_date_repl(match):
+            article = match.group('article') or ''
+            day = int(match.group('day'))
+            month = match.group('month').lower()
+            month_name = self.months.get(month, month.capitalize())
+            day_ordinal = self.lb.to_ordinal(day)
+            day_ordinal = self.adjust_ordinal_for_following_word(
+                day_ordinal, month_name)
+            return f"{article}{day_ordinal} {month_name}"
+
+        text = self.ordinal_date_pattern.sub(ordinal_date_repl, text)
+
+        # Handle numeric month format like '22.3.' (22nd of March)
+        def numeric_month_repl(match):
+            day = int(match.group('day'))
+            month_num = int(match.group('month'))
+            month_names = list(self.months.values())
+            if 1 <= month_num <= 12:
+                month_name = month_names[month_num - 1]
+            else:
+                month_name = f"Monat {month_num}"
+            day_ordinal = self.lb.to_ordinal(day)
+            day_ordinal = self.adjust_ordinal_for_following_word(
+                day_ordinal, month_name)
+            return f"{day_ordinal} {month_name}"
+
+        text = self.numeric_month_pattern.sub(numeric_month_repl, text)
+
+        return text
+
+    def normalize_phone_numbers(self, text):
+        """Convert phone numbers like '62 11 08' to words, always including
+        'null' for 0 and for leading zeros in groups like '08'."""
+        text = '\n'.join(self.phone_line(line) for line in text.splitlines())
+        return text
+
+    def phone_line(self, line):
+        # If the line looks like a phone number (contains "Telefon:" or
+        # similar), convert all groups of 2+ digits
+        if 'Telefon' in line or 'Tel' in line or 'Phone' in line:
+            # Replace all groups of 2+ digits, even if followed by punctuation
+            return self.phone_digits_pattern.sub(self.phone_digits, line)
+        return line
+
+    def phone_digits(self, match):
+        num = match.group(0)
+        words = []
+        for digit in num:
+            if digit == '0':
+                words.append('null')
+            else:
+                words.append(self.lb.to_cardinal(int(digit)))
+        return " ".join(words)
+
+    def normalize_units(self, text):
+        # Decimal percentages with a comma or a dot, with or without a
+        # space (93,9%, 3.9 %)
+        def percent_repl(match):
+            percent_str = match.group(1)
+            percent_val = percent_str.replace(',', '.')
+            return self.lb.to_percentage(percent_val)
+        text = self.decimal_percent_pattern.sub(percent_repl, text)
+
+        # Then the units of Num2Word_LB.UNITS: °, ml, gr, %, Stonnen, ...
+        for unit in self.lb.UNITS:
+            def unit_repl(match, unit=unit):
+                num = int(match.group(1))
+                if num == 2 and unit.gender == 'f':
+                    return f"zwou {unit.plural}"
+                return f"{self.lb.to_cardinal(num)} {unit.plural}"
+            text = re.sub(rf'(\d+)\s*(?:{unit.symbol})', unit_repl, text)
+
+        # Singular fixes
+        return self.fix_singular(text)
+
+    def normalize_years_with_suffix(self, text):
+        # 1970er, 1980er, etc.
+        def year_suffix_repl(match):
+            year = int(match.group(1))
+            try:
+                year_text = self.lb.to_year(year)
+            except AttributeError:
+                year_text = self.lb.to_cardinal(year)
+            return f"{year_text}er"
+        return self.year_suffix_pattern.sub(year_suffix_repl, text)
+
+    def normalize_numbers(self, text):
+        # Standalone numbers (not part of dates/units)
+        def number_repl(match):
+            num = int(match.group(0))
+            return self.lb.to_cardinal(num)
+        # Only replace numbers not part of a word (avoid breaking years,
+        # units, etc.)
+        return self.number_pattern.sub(number_repl, text)
+
+    def normalize_times(self, text):
+        """Convert time expressions like 10:34, 10h34, or 17.40 to
+        Luxembourgish text, avoiding duplicate 'Auer' if already present and
+        not appending 'Auer' after minutes if already present in the
+        input."""
+
+        def insert_auer(hours_word, minutes_word, original, match_start,
+                        match_end):
+            # Only insert 'Auer' if not already present after the match
+            after = original[match_end:match_end+6].lower()
+            # If 'Auer' is present after the match, do not append 'Auer'
+            # after minutes
+            if 'auer' in after:
+                return f"{hours_word} Auer {minutes_word}"
+            else:
+                return f"{hours_word} Auer {minutes_word}"
+
+        # Handle 17.40 format (time with dot)
+        def time_dot_repl(match):
+            hours = int(match.group(1))
+            minutes = int(match.group(2))
+            if hours == 0:
+                hours_word = "null"
+            elif hours == 1:
+                hours_word = "eng"
+            else:
+                hours_word = self.lb.to_cardinal(hours)
+            if minutes == 0:
+                minutes_word = "null"
+            else:
+                minutes_word = self.lb.to_cardinal(minutes)
+            # Check if 'Auer' is present after the match
+            after = match.string[match.end():match.end()+6].lower()
+            if 'auer' in after:
+                return f"{hours_word} Auer {minutes_word}"
+            else:
+                return f"{hours_word} Auer {minutes_word}"
+        text = self.time_dot_pattern.sub(time_dot_repl, text)
+
+        # Handle 10:34 format
+        def time_repl(match):
+            hours = int(match.group(1))
+            minutes = int(match.group(2))
+            if hours == 0:
+                hours_word = "null"
+            elif hours == 1:
+                hours_word = "eng"
+            else:
+                hours_word = self.lb.to_cardinal(hours)
+            if minutes == 0:
+                minutes_word = "null"
+            else:
+                minutes_word = self.lb.to_cardinal(minutes)
+            after = match.string[match.end():match.end()+6].lower()
+            if 'auer' in after:
+                return f"{hours_word} Auer {minutes_word}"
+            else:
+                return f"{hours_word} Auer {minutes_word}"
+        text = self.time_pattern.sub(time_repl, text)
+
+        # Handle 10h34 format
+        def time_h_repl(match):
+            hours = int(match.group(1))
+            minutes = int(match.group(2))
+            if hours == 0:
+                hours_word = "null"
+            elif hours == 1:
+                hours_word = "eng"
+            else:
+                hours_word = self.lb.to_cardinal(hours)
+            if minutes == 0:
+                minutes_word = "null"
+            else:
+                minutes_word = self.lb.to_cardinal(minutes)
+            after = match.string[match.end():match.end()+6].lower()
+            if 'auer' in after:
+                return f"{hours_word} Auer {minutes_word}"
+            else:
+                return f"{hours_word} Auer {minutes_word}"
+        text = self.time_h_pattern.sub(time_h_repl, text)
+
+        # Remove duplicate 'Auer' if it appears twice in a row
+        text = self.auer_twice_pattern.sub(r'\1', text)
+        # Remove 'Auer' after minutes if it appears (e.g., 'siwwenzéng Auer
+        # véierzeg Auer' -> 'siwwenzéng Auer véierzeg')
+        text = self.auer_after_pattern.sub(r'\1', text)
+        return text
+
+    def normalize_large_numbers(self, text):
+        """Handle large numbers like 2.000 and 40 000"""
+        def large_number_repl(match):
+            number_str = ''.join(match.group(1).replace('.', '').split())
+            number = int(number_str)
+            return self.lb.to_cardinal(number)
+
+        text = self.large_number_pattern.sub(large_number_repl, text)
+        return text
+
+    def normalize_large_number_words(self, text):
+        """Handle large number words like '961 Milliarden'"""
+        def large_word_repl(match):
+            number = int(match.group(1))
+            unit = match.group(2)
+            number_word = self.lb.to_cardinal(number)
+
+            # Handle different large number units
+            if unit.lower() in ['milliarden', 'milliard']:
+                if number == 1:
+                    return f"{number_word} Milliard"
+                else:
+                    return f"{number_word} Milliarden"
+            elif unit.lower() in ['milliounen', 'millioun']:
+                if number == 1:
+                    return f"{number_word} Millioun"
+                else:
+                    return f"{number_word} Milliounen"
+            else:
+                return f"{number_word} {unit}"
+
+        text = self.large_word_pattern.sub(large_word_repl, text)
+        return text
+
+    def normalize_match_results(self, text):
+        # Convert match results like 1:1 or 1-1 to 'eent zu eent'
+        def match_result_repl(match):
+            left = int(match.group(1))
+            right = int(match.group(2))
+            left_word = 'eent' if left == 1 else self.lb.to_cardinal(left)
+            right_word = 'eent' if right == 1 else self.lb.to_cardinal(right)
+            return f"{left_word} zu {right_word}"
+        return self.match_result_pattern.sub(match_result_repl, text)
+
+    def normalize_abbreviations(self, text):
+        """Convert abbreviations like VW, CSV to their Luxembourgish letter
+        pronunciations"""
+        def abbreviation_repl(match):
+            abbreviation = match.group(0)
+
+            # Check if it's a word-based abbreviation first
+            if abbreviation in self.word_abbreviations:
+                return self.word_abbreviations[abbreviation]
+
+            # Convert each letter to its pronunciation
+            pronunciations = []
+            for letter in abbreviation:
+                if letter in self.letter_pronunciations:
+                    pronunciations.append(
+                        self.letter_pronunciations[letter])
+                else:
+                    # Keep unknown characters as-is
+                    pronunciations.append(letter)
+            return ''.join(pronunciations)
+
+        text = self.abbreviation_pattern.sub(abbreviation_repl, text)
+        return text
+
+    def normalize_passes(self, text):
+        """Reference implementation of normalize(): one regex pass per rule"""
+        # Move phone numbers to the top
+        text = self.normalize_phone_numbers(text)
+        # Handle abbreviations early
+        text = self.normalize_abbreviations(text)
+        # Handle match results before times
+        text = self.normalize_match_results(text)
+        text = self.normalize_dates(text)
+        text = self.normalize_ordinal_dates(text)  # Add ordinal dates
+        text = self.normalize_times(text)
+        # Run ordinal dates again after times
+        text = self.normalize_ordinal_dates(text)
+        text = self.normalize_large_numbers(text)  # Add large numbers
+        # Add large number words
+        text = self.normalize_large_number_words(text)
+        text = self.normalize_units(text)
+        text = self.normalize_years_with_suffix(text)
+        text = self.normalize_numbers(text)
+        return text
+
+    # Single-pass engine. TOKEN_PATTERNS are the rules of DEFAULT_RULES,
+    # tried at every position in this order, so where several match at the
+    # same place the rule of the earliest pass of normalize_passes() wins.
+    # Each handler returns the final text of its token, i.e. what all the
+    # passes would have made of it. Articles in front of dates are copied
+    # unchanged by the passes, so the patterns leave them out.
+    ALPHA = 'A-Za-zäëöüÄËÖÜ'
+    TOKEN_PATTERNS = [
+        ('month_year',
+         rf'(?<![{ALPHA}])(?P<my_word>[{ALPHA}]+) (?P<my_year>\d{{4}})'),
+        ('abbreviation', r'\b[A-ZÄÖÜ]{2,}\b'),
+        ('match_result',
+         r'\b(?P<mr_left>\d{1,3})[:\-](?P<mr_right>\d{1,3})\b'),
+        ('date', rf'(?P<d_day>\d{{1,2}})\. ?(?P<d_month>[{ALPHA}]+) '
+                 rf'(?P<d_year>\d{{4}})'),
+        ('numeric_date', r'(?P<nd_day>\d{1,2})\.(?P<nd_month>\d{1,2})\.'
+                         r'(?P<nd_year>\d{4})'),
+        ('ordinal_date',
+         rf'(?P<od_day>\d{{1,2}})\. ?(?P<od_word>[{ALPHA}]+)'),
+        ('day_before_date', rf'(?P<dd_day>\d{{1,2}})\.'
+                            rf'(?P<dd_date>\d{{1,2}}\. ?[{ALPHA}]+'
+                            rf'(?: \d{{4}})?)'),
+        ('numeric_month', r'(?P<nm_day>\d{1,2})\.(?P<nm_month>\d{1,2})\.'),
+        ('time', r'\b(?P<t_hours>[01]?\d|2[0-4])[.:h]'
+                 r'(?P<t_minutes>[0-5]\d)\b(?P<t_auer> Auer)?'),
+        ('auer_twice', r'Auer\s+Auer'),
+        ('auer_after', r'Auer (?P<aa_word>\S+) Auer(?:\s+Auer)?'),
+        ('large_number',
+         r'\b(?P<ln_number>\d{1,3}(?:[\.\s]\d{3})+)\b(?![:\-]\d)'),
+        ('large_number_word', r'(?P<lw_number>\d+)\s+'
+                              r'(?P<lw_unit>(?i:Milliarden?|Milliounen?))'),
+        ('unit', unit_pattern(Num2Word_LB.UNITS)),
+        ('percent', r'(?P<p_number>\d+(?:[,.]\d+)?)\s*%'),
+        ('eent_unit',
+         f'eent (?P<eu_unit>{singular_pattern(Num2Word_LB.UNITS)})'),
+        ('year_with_suffix', r'\b(?P<ys_year>1\d{3}|20\d{2})er\b(?! \d{4})'),
+        ('number', r'\b\d+\b'),
+    ]
+    # Rules whose output normalize_dates() still sees
+    BEFORE_MONTH_YEAR = frozenset([
+        'abbreviation', 'match_result', 'date', 'numeric_date'])
+    # Rules whose output normalize_dates() reads as a month before a year
+    YEAR_AFTER = BEFORE_MONTH_YEAR | {'day_before_date'}
+    # Rules whose output the first normalize_ordinal_dates() still sees
+    BEFORE_FIRST_ORDINAL_DATES = BEFORE_MONTH_YEAR | {'month_year'}
+    # Rules whose output normalize_times() still sees
+    BEFORE_TIMES = BEFORE_FIRST_ORDINAL_DATES | frozenset([
+        'ordinal_date', 'day_before_date', 'numeric_month'])
+    # Rules whose output may be followed by an 'Auer' normalize_times()
+    # drops
+    AUER_BEFORE = BEFORE_TIMES | {'auer_twice', 'auer_after'}
+    # Rules whose output the second normalize_ordinal_dates() still sees
+    BEFORE_ORDINAL_DATES = BEFORE_MONTH_YEAR | frozenset([
+        'month_year', 'ordinal_date', 'day_before_date', 'numeric_month',
+        'time', 'auer_twice', 'auer_after'])
+    # Rules whose output normalize_units() still sees
+    BEFORE_UNITS = frozenset([
+        'month_year', 'abbreviation', 'match_result', 'date', 'numeric_date',
+        'ordinal_date', 'day_before_date', 'numeric_month', 'time',
+        'auer_twice', 'auer_after', 'large_number', 'large_number_word'])
+
+    auer_twice_re = re.compile(r'\s+Auer')
+    auer_after_re = re.compile(r' (\S+) Auer(?:\s+Auer)?')
+    auer_dropped_re = re.compile(r' Auer(?:\s+Auer)?')
+    auer_last_re = re.compile(r'Auer \S+$')
+    year_re = re.compile(r'\d{4}')
+    word_re = re.compile(f'[{ALPHA}]+')
+    last_word_re = re.compile(f'[{ALPHA}]+$')
+    word_start_re = re.compile(r'\b')
+    singular_fix_re = re.compile(
+        f' (?:{singular_pattern(Num2Word_LB.UNITS)})')
+    line_break_re = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+    ALPHA_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                            'abcdefghijklmnopqrstuvwxyzäëöüÄËÖÜ')
+    line_breaks = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+    def normalize(self, text):
+        """Normalize `text` in a single scan; the result is the one of
+        normalize_passes(). Where a pass reads the output of an earlier
+        one, the scan looks at the previous token to do the same."""
+        if self.profile is None:
+            return self.scan(self.prepare_lines(text))[0]
+        stats = {}
+        text = self.profiled(stats, 'prepare_lines', self.prepare_lines, text)
+        return self.scan(text, stats=stats)[0]
+
+    def normalize_part(self, text):
+        """Return normalize(`text`) for a handler normalizing part of its
+        token. The part is not recorded in the profile: the stages of the
+        token's text are."""
+        token_re, handlers = self.rules.compile()
+        return self._scan(self.prepare_lines(text), None, token_re,
+                          handlers)[0]
+
+    def profiled(self, stats, stage, func, text):
+        """Return ``func(text)``, recording it as `stage` in `stats`"""
+        calls = self.lb.calls
+        started = time.perf_counter()
+        result = func(text)
+        seconds = time.perf_counter() - started
+        self.profile.record(stats, stage, seconds, int(result != text), text,
+                            result, self.lb.calls - calls)
+        return result
+
+    def profiled_handlers(self, handlers, stats):
+        """Return `handlers` recording their calls in `stats`"""
+        def wrap(rule, handler):
+            def profiled_handler(normalizer, match):
+                calls = self.lb.calls
+                started = time.perf_counter()
+                word = handler(normalizer, match)
+                seconds = time.perf_counter() - started
+                self.profile.record(stats, rule, seconds, 1, match.group(0),
+                                    word, self.lb.calls - calls)
+                return word
+            return profiled_handler
+        return {rule: wrap(rule, handler)
+                for rule, handler in handlers.items()}
+
+    def scan(self, text, stop=None, stats=None):
+        """Normalize `text`, prepared by prepare_lines(), and return the
+        result and the length of the input it stands for.
+
+        With `stop`, the scan ends at the last line break up to `stop`
+        that is not part of a match, and the result only covers the text
+        up to and including that line break; the length is 0 if there is
+        no such line break.
+
+        With a profile, the scan is recorded in `stats` (a new dict by
+        default), which is then added to the profile."""
+        if self.profile is not None:
+            if stats is None:
+                stats = {}
+            return self.profiled_scan(text, stop, stats)
+        token_re, handlers = self.rules.compile()
+        return self._scan(text, stop, token_re, handlers)
+
+    def profiled_scan(self, text, stop, stats):
+        token_re, handlers = self.rules.compile()
+        handlers = self.profiled_handlers(handlers, stats)
+        calls = self.lb.calls
+        started = time.perf_counter()
+        result, length = self._scan(text, stop, token_re, handlers)
+        seconds = time.perf_counter() - started
+        matches = sum(values[2] for stage, values in stats.items()
+                      if stage in handlers)
+        self.profile.record(stats, 'scan', seconds, matches, text[:length],
+                            result, self.lb.calls - calls)
+        self.profile.add(stats)
+        return result, length
+
+    def _scan(self, text, stop, token_re, handlers):
+        out = []
+        pos = 0
+        last_rule = last_match = None
+        # the token in front of the last one, if it is still in the output
+        before_rule = before_match = None
+        # what a day merged into the last token replaced, see below
+        merged = None
+        # the output, input position and line break of the last gap with
+        # a line break, for the scans with a stop
+        safe = 0, 0, -1
+        match = token_re.search(text)
+        while match:
+            rule = match.lastgroup
+            start = match.start()
+            end = match.end()
+            gap = text[pos:start]
+            if (last_rule and 'month_year' in handlers
+                    and text.startswith(' ', pos)
+                    and self.year_re.match(text, pos + 1)
+                    and self.ends_with_word(last_rule, out[-1],
+                                            text[pos - 1])):
+                # 'zwee 1930', also when 'zwee' was '2' in the input:
+                # normalize_dates() reads any word and four digits as a
+                # month and a year
+                if last_rule in self.YEAR_AFTER:
+                    out[-1] = self.capitalize_last_word(out[-1])
+                out.append(' ')
+                out.append(self.lb.to_year(int(text[pos + 1:pos + 5])))
+                pos += 5
+                last_rule = 'month_year'
+                last_match = merged = before_rule = before_match = None
+                match = token_re.search(text, pos)
+                continue
+            if stop is not None and start > stop:
+                break
+            if (rule == 'month_year' and not gap
+                    and last_rule in self.YEAR_AFTER):
+                # '1926er 1987': the word starts in the previous output
+                tail = self.last_word_re.search(out[-1])
+                out[-1] = out[-1][:tail.start()]
+                month_name = self.month_name(
+                    tail.group(0) + match.group('my_word'))
+                year = self.lb.to_year(int(match.group('my_year')))
+                word = f"{month_name} {year}"
+            else:
+                word = handlers[rule](self, match)
+
+            day = None
+            if rule in self.BEFORE_ORDINAL_DATES and self.word_re.match(word):
+                day = self.day_before(last_rule, last_match, gap, rule,
+                                      self.first_pass_date(rule, match))
+            if day is None:
+                merged = None
+            else:
+                # '1. 18. Plaz': the ordinal dates passes read the day in
+                # front of this token as the start of a date as well
+                previous = out.pop()
+                if merged and last_rule == 'numeric_month':
+                    # '1. 22.9. 9:8' is read as '1.' and '22.9. 9:8'
+                    out.extend(merged)
+                merged = [previous, gap] if last_rule == 'number' else None
+                at_word_start = self.word_start_re.match(
+                    text, last_match.start())
+                word = self.date_after_day(day, word, at_word_start)
+                gap = ''
+                second = None
+                if (last_rule == before_rule == 'number'
+                        and self.word_re.match(word)
+                        and rule in self.BEFORE_FIRST_ORDINAL_DATES):
+                    # '1. 3. 12:30': the first pass made this date of
+                    # '3. zwielef', the second one reads '1.' as its day
+                    second = self.day_before(before_rule, before_match,
+                                             out[-1], rule)
+                if second is not None:
+                    out.pop()
+                    out.pop()
+                    at_word_start = self.word_start_re.match(
+                        text, before_match.start())
+                    word = self.date_after_day(second, word, at_word_start)
+
+            if rule in self.AUER_BEFORE:
+                # '3. Auer Auer': normalize_times() reads the 'Auer' the
+                # token ends with as well
+                word, end = self.auer_tail(rule, word, text, end)
+            if rule in self.BEFORE_UNITS and word.endswith('eent'):
+                singular = self.singular_fix_re.match(text, end)
+                if singular:
+                    word = word[:-4] + self.article(singular.group(0)[1:])
+            if stop is not None and '\n' in gap:
+                safe = len(out), pos, text.rfind('\n', pos, start)
+            out.append(gap)
+            out.append(word)
+            pos = end
+            if day is None:
+                before_rule, before_match = last_rule, last_match
+            else:
+                before_rule = before_match = None
+            last_rule = rule
+            last_match = match
+            match = token_re.search(text, end)
+        if stop is None:
+            out.append(text[pos:])
+            return ''.join(out), len(text)
+        cut = text.rfind('\n', pos, stop + 1)
+        if cut >= 0:
+            safe = len(out), pos, cut
+        length, pos, cut = safe
+        return ''.join(out[:length]) + text[pos:cut + 1], cut + 1
+
+    def normalize_stream(self, lines, chunk_size=65536):
+        """Normalize the lines of `lines` (e.g. a file) and yield the
+        result in pieces, each ending with a line break.
+
+        Lines are normalized in chunks of about `chunk_size` characters.
+        A chunk only ends at a line break that no rule matches across
+        (like '40\n000' or '12\n%'), so the output is the one of
+        normalize() on the whole text, with every line break written as
+        '\n'. Memory use depends on `chunk_size`, not on the input size.
+        """
+        buffer = []
+        size = 0
+        limit = chunk_size
+        ended = True
+        # profile statistics of the chunk being read
+        stats = {}
+        for line in lines:
+            stripped = line.rstrip('\r\n')
+            ended = len(stripped) < len(line)
+            if ('Tel' in stripped or 'Phone' in stripped
+                    or self.line_break_re.search(stripped)):
+                if self.profile is None:
+                    stripped = self.prepare_lines(stripped + '\n')
+                else:
+                    stripped = self.profiled(stats, 'prepare_lines',
+                                             self.prepare_lines,
+                                             stripped + '\n')
+            buffer.append(stripped)
+            size += len(stripped) + 1
+            if size >= limit:
+                text = '\n'.join(buffer)
+                # The line break must be followed by a line with some
+                # text, so that every match across it is in the chunk
+                done, length = self.scan(text, text.rstrip().rfind('\n'),
+                                         stats)
+                stats = {}
+                if not length:
+                    # try again when the next chunk is in
+                    limit = size + chunk_size
+                    continue
+                yield done
+                buffer = [text[length:]]
+                size = len(buffer[0]) + 1
+                limit = chunk_size
+        if buffer:
+            text = '\n'.join(buffer) + ('\n' if ended else '')
+            yield self.scan(text, stats=stats)[0]
+
+    def segments(self, text):
+        """Split `text` into the lists of lines that normalize_incremental()
+        normalizes on their own.
+
+        Segments are separated by a blank line, except where a match may
+        span it: the matches of DEFAULT_RULES only do after a digit or
+        'Auer' (like '12\n\n%'), see spans_blank_line(). Rules of your
+        own must not span blank lines otherwise."""
+        lines = text.splitlines()
+        start = 0
+        tail = ''
+        for index, line in enumerate(lines):
+            if line:
+                if not line.isspace():
+                    tail = line
+            elif (start < index < len(lines) - 1
+                  and not self.spans_blank_line(tail)):
+                yield lines[start:index]
+                start = index + 1
+                tail = ''
+        if lines:
+            yield lines[start:]
+
+    def spans_blank_line(self, line):
+        """Return True if a match may start in `line`, the last line with
+        some text before a blank line, and go on after the blank line"""
+        line = line.rstrip()
+        return line[-1:].isdecimal() or line.endswith('Auer')
+
+    def normalize_incremental(self, text):
+        """Return normalize(`text`), normalizing only the segments (see
+        segments()) that are not in `segment_cache` yet.
+
+        Segments are cached by a hash of their content, so when a text is
+        edited and normalized again, only the paragraphs that changed are.
+        The cache is cleared when the rules change."""
+        compiled = self.rules.compile()
+        if compiled is not self._segment_rules:
+            self.segment_cache.cache_clear()
+            self._segment_rules = compiled
+        out = []
+        for lines in self.segments(text):
+            segment = '\n'.join(lines)
+            data = segment.encode('utf-8', 'surrogatepass')
+            key = (hashlib.blake2b(data, digest_size=16).digest(),)
+            result = self.segment_cache.get(key)
+            if result is None:
+                if 'Tel' in segment or 'Phone' in segment:
+                    segment = '\n'.join(self.phone_line(line)
+                                        for line in lines)
+                result = self.scan(segment)[0]
+                self.segment_cache.put(key, result)
+            out.append(result)
+        return '\n\n'.join(out)
+
+    def normalize_file(self, infile, outfile, chunk_size=65536):
+        """Normalize the text file `infile` into `outfile` as it is read,
+        see normalize_stream()"""
+        for chunk in self.normalize_stream(infile, chunk_size):
+            outfile.write(chunk)
+
+    def ends_with_word(self, rule, word, original):
+        if rule in self.YEAR_AFTER:
+            return word[-1] in self.ALPHA_CHARS
+        return original in self.ALPHA_CHARS
+
+    def auer_tail(self, rule, word, text, end):
+        """Return the output `word` of a token of `rule` ending at `end`
+        with the 'Auer' normalize_times() drops after it, and where the
+        text after it starts"""
+        if word.endswith('Auer'):
+            if rule in self.BEFORE_TIMES:
+                twice = self.auer_twice_re.match(text, end)
+                if twice:
+                    end = twice.end()
+            after = self.auer_after_re.match(text, end)
+            if after:
+                after_word = self.auer_word(after.group(1))
+                if after_word is not None:
+                    return f'{word} {after_word}', after.end()
+        elif rule in self.BEFORE_TIMES and self.auer_last_re.search(word):
+            # 'Auer 2023 Auer'
+            dropped = self.auer_dropped_re.match(text, end)
+            if dropped:
+                end = dropped.end()
+        return word, end
+
+    def auer_word(self, word):
+        """Return what 'Auer word Auer' is left of `word` once
+        normalize_times() dropped the second 'Auer', or None if it keeps
+        it"""
+        # the passes before normalize_times() must leave a single word
+        # of 'word Auer'
+        before = self.normalize_abbreviations(word + ' Auer')
+        before = self.normalize_dates(self.normalize_match_results(before))
+        before = self.normalize_ordinal_dates(before)
+        if not self.auer_after_pattern.fullmatch('Auer ' + before):
+            return None
+        text = self.normalize_part(word + ' Auer')
+        return text[:-5] if text.endswith(' Auer') else text
+
+    def capitalize_last_word(self, text):
+        word = self.last_word_re.search(text)
+        return text[:word.start()] + self.month_name(word.group(0))
+
+    def day_before(self, rule, match, gap, next_rule, first_pass=False):
+        """Return the day the ordinal dates passes read from the token
+        `match` of `rule` in front of a token of `next_rule`, or None.
+        `first_pass` tells if that token already is a date to the second
+        pass, see first_pass_date()."""
+        if (rule == 'number' and gap in ('.', '. ')
+                and len(match.group(0)) <= 2
+                and (next_rule != 'day_before_date' or first_pass)):
+            return match.group(0), ''
+        if (rule == 'numeric_month' and gap in ('', ' ')
+                and next_rule in self.BEFORE_FIRST_ORDINAL_DATES):
+            return match.group('nm_day'), match.group('nm_month')
+        return None
+
+    def first_pass_date(self, rule, match):
+        """Return True if the first ordinal dates pass makes a date of the
+        token `match` of `rule` with its day, like '22.3. Mee 2023'"""
+        return (rule == 'day_before_date'
+                and self.year_re.search(match.group('dd_date')) is not None)
+
+    def date_after_day(self, day, word, at_word_start):
+        day, month = day
+        if month:
+            # 'DD.M. word': the first pass reads 'M. word', the second
+            # one 'DD.' and the result
+            word = self.date_after_day((month, ''), word, False)
+            return self.date_after_day((day, ''), word, at_word_start)
+        first = self.word_re.match(word)
+        if first is None:
+            if at_word_start:
+                day = self.lb.to_cardinal(int(day))
+            return f"{day}.{word}"
+        month_name = self.month_name(first.group(0))
+        ordinal = self.ordinal_before(day, month_name)
+        return f"{ordinal} {month_name}{word[first.end():]}"
+
+    def date_word(self, match, group):
+        """Return the word of `group` as the ordinal dates see it after
+        normalize_abbreviations(), and the rest of the spelled out letters"""
+        word = match.group(group)
+        abbreviation = self.abbreviation_pattern.match(match.string,
+                                                       match.start(group))
+        if abbreviation and abbreviation.end() == match.end(group):
+            spelled = self.token_abbreviation(abbreviation)
+            word = self.word_re.match(spelled).group(0)
+            return word, spelled[len(word):]
+        return word, ''
+
+    def prepare_lines(self, text):
+        """Apply the line based part of the pipeline: phone numbers and
+        the line endings normalize_phone_numbers() leaves behind"""
+        if 'Tel' in text or 'Phone' in text:
+            return self.normalize_phone_numbers(text)
+        if text and (text[-1] in self.line_breaks
+                     or self.line_break_re.search(text)):
+            return '\n'.join(text.splitlines())
+        return text
+
+    def month_name(self, word):
+        word = word.lower()
+        return self.months.get(word, word.capitalize())
+
+    def numbered_month_name(self, number):
+        if 1 <= number <= 12:
+            return list(self.months.values())[number - 1]
+        # normalize_numbers() spells the number out later on
+        return f"Monat {self.lb.to_cardinal(number)}"
+
+    def ordinal_before(self, day, following_word):
+        return self.adjust_ordinal_for_following_word(
+            self.lb.to_ordinal(int(day)), following_word)
+
+    def fix_singular(self, text):
+        for unit in self.lb.UNITS:
+            article = self.lb.unit_article(unit)
+            text = text.replace(f"eent {unit.singular}",
+                                f"{article} {unit.singular}")
+        return text
+
+    def article(self, singular):
+        """Return the word for one of the unit `singular`"""
+        for unit in self.lb.UNITS:
+            if unit.singular == singular:
+                return self.lb.unit_article(unit)
+
+    def token_month_year(self, match):
+        word = match.group('my_word')
+        prefix = ''
+        abbreviation = self.abbreviation_pattern.match(
+            match.string, match.start('my_word'))
+        if abbreviation and abbreviation.end() == match.end('my_word'):
+            # The abbreviation is spelled out first; only the letters
+            # after the last hyphen of e.g. 'I-GRÄCK' are taken as a month
+            spelled = self.token_abbreviation(abbreviation)
+            prefix, _, word = spelled.rpartition('-')
+            prefix += '-' if prefix else ''
+        year_text = self.lb.to_year(int(match.group('my_year')))
+        return f"{prefix}{self.month_name(word)} {year_text}"
+
+    def token_abbreviation(self, match):
+        abbreviation = match.group(0)
+        if abbreviation in self.word_abbreviations:
+            return self.word_abbreviations[abbreviation]
+        return ''.join(self.letter_pronunciations.get(letter, letter)
+                       for letter in abbreviation)
+
+    def token_match_result(self, match):
+        left = int(match.group('mr_left'))
+        right = int(match.group('mr_right'))
+        left_word = 'eent' if left == 1 else self.lb.to_cardinal(left)
+        right_word = 'eent' if right == 1 else self.lb.to_cardinal(right)
+        return f"{left_word} zu {right_word}"
+
+    def token_date(self, match):
+        word, rest = self.date_word(match, 'd_month')
+        month_name = self.month_name(word)
+        day_ordinal = self.ordinal_before(match.group('d_day'), month_name)
+        year_text = self.lb.to_year(int(match.group('d_year')))
+        return f"{day_ordinal} {month_name}{rest} {year_text}"
+
+    def token_numeric_date(self, match):
+        month_name = self.numbered_month_name(int(match.group('nd_month')))
+        day_ordinal = self.ordinal_before(match.group('nd_day'), month_name)
+        year_text = self.lb.to_year(int(match.group('nd_year')))
+        return f"{day_ordinal} {month_name} {year_text}"
+
+    def token_ordinal_date(self, match):
+        word, rest = self.date_word(match, 'od_word')
+        month_name = self.month_name(word)
+        day_ordinal = self.ordinal_before(match.group('od_day'), month_name)
+        return f"{day_ordinal} {month_name}{rest}"
+
+    def token_day_before_date(self, match):
+        # '22.3. Äre': the first ordinal dates pass turns '3. Äre' into
+        # 'drëtten Äre', the second one reads '22.drëtten' as a date too
+        date = self.normalize_part(match.group('dd_date'))
+        at_word_start = self.word_start_re.match(match.string, match.start())
+        return self.date_after_day((match.group('dd_day'), ''), date,
+                                   at_word_start)
+
+    def token_numeric_month(self, match):
+        month_name = self.numbered_month_name(int(match.group('nm_month')))
+        day_ordinal = self.ordinal_before(match.group('nm_day'), month_name)
+        return f"{day_ordinal} {month_name}"
+
+    def token_time(self, match):
+        hours = int(match.group('t_hours'))
+        minutes = int(match.group('t_minutes'))
+        if hours == 0:
+            hours_word = "null"
+        elif hours == 1:
+            hours_word = "eng"
+        else:
+            hours_word = self.lb.to_cardinal(hours)
+        minutes_word = "null" if minutes == 0 else self.lb.to_cardinal(minutes)
+        if match.string.endswith('Auer ', 0, match.start()):
+            # 'Auer 10.41': normalize_times() drops the 'Auer' after the
+            # hours and keeps the one after the minutes
+            return f"{hours_word} {minutes_word}{match.group('t_auer') or ''}"
+        # and otherwise the one after the minutes
+        return f"{hours_word} Auer {minutes_word}"
+
+    def token_auer_twice(self, match):
+        return 'Auer'
+
+    def token_auer_after(self, match):
+        word = match.group('aa_word')
+        after_word = self.auer_word(word)
+        if after_word is None:
+            # 'Auer 12:30 Auer' is 'Auer zwielef zu drësseg Auer' then
+            return 'Auer ' + self.normalize_part(word + ' Auer')
+        return 'Auer ' + after_word
+
+    def token_large_number(self, match):
+        digits = match.group('ln_number').replace('.', '')
+        number = int(''.join(digits.split()))
+        return self.lb.to_cardinal(number)
+
+    def token_large_number_word(self, match):
+        number = int(match.group('lw_number'))
+        unit = match.group('lw_unit')
+        number_word = self.lb.to_cardinal(number)
+        if unit.lower() in ['milliarden', 'milliard']:
+            if number == 1:
+                return f"{number_word} Milliard"
+            return f"{number_word} Milliarden"
+        if unit.lower() in ['milliounen', 'millioun']:
+            if number == 1:
+                return f"{number_word} Millioun"
+            return f"{number_word} Milliounen"
+        return f"{number_word} {unit}"
+
+    def token_unit(self, match):
+        number = int(match.group('u_number'))
+        unit = self.lb.find_unit(match.group('u_unit'))
+        if number == 2 and unit.gender == 'f':
+            return f"zwou {unit.plural}"
+        number_word = self.lb.to_cardinal(number)
+        return self.fix_singular(f"{number_word} {unit.plural}")
+
+    def token_percent(self, match):
+        number = match.group('p_number')
+        if number.isdigit():
+            number_word = self.lb.to_cardinal(int(number))
+            return self.fix_singular(f"{number_word} Prozent")
+        percentage = self.lb.to_percentage(number.replace(',', '.'))
+        return self.fix_singular(percentage)
+
+    def token_eent_unit(self, match):
+        singular = match.group('eu_unit')
+        return f"{self.article(singular)} {singular}"
+
+    def token_year_with_suffix(self, match):
+        year = int(match.group('ys_year'))
+        try:
+            year_text = self.lb.to_year(year)
+        except AttributeError:
+            year_text = self.lb.to_cardinal(year)
+        return f"{year_text}er"
+
+    def token_number(self, match):
+        return self.lb.to_cardinal(int(match.group(0)))
+
+
+DEFAULT_RULES = RuleRegistry(
+    NormalizationRule(name, pattern,
+                      getattr(LuxembourgishNormalizer, 'token_' + name),
+                      index * 10)
+    for index, (name, pattern)
+    in enumerate(LuxembourgishNormalizer.TOKEN_PATTERNS, 1))
+
+
+class TextNormalizer:
+    """Text normalizer for Luxembourgish with special handling for years,
+    units, etc.
+
+    The older pipeline of run_num2words: one regular expression pass per
+    stage of `stages`, in order. Subclasses pick other stages or patterns."""
+
+    stages = ('normalize_years_with_suffix', 'normalize_currency',
+              'normalize_units', 'fix_final_n')
+    # Whether normalize_years_with_suffix() also spells two-digit decades
+    # ('80er')
+    decades = True
+
+    # Unit mappings
+    unit_mappings = {
+        '°': 'Grad',
+        'ml': 'Milliliter',
+        'gr': 'Gramm',
+        '%': 'Prozent'
+    }
+
+    # Years between 1000-2099 followed by 'er'
+    year_pattern = re.compile(r'\b(1\d{3}|20\d{2})er\b')
+    # 2-digit numbers followed by 'er'
+    decade_pattern = re.compile(r'\b([1-9]\d)er\b')
+    neg_temp_pattern = re.compile(r'(?<![0-9])-(\d+)\s*[°\u00B0]')
+    temp_pattern = re.compile(r'(?<![0-9])(\d+)\s*[°\u00B0]')
+    ml_pattern = re.compile(r'(?<![a-zA-Z0-9-])(\d+)\s*ml\b')
+    gr_pattern = re.compile(r'(?<![a-zA-Z0-9-])(\d+)\s*gr\b')
+    kg_pattern = re.compile(r'(?<![a-zA-Z0-9-])(\d+)\s*kg\b')
+    percent_pattern = re.compile(r'(?<![a-zA-Z0-9-])(\d+)\s*%')
+    # Forms of 1 before a unit, patched up after spelling the units
+    singular_fixes = (
+        ("eent Milliliter", "een Milliliter"),
+        ("eent Gramm", "een Gramm"),
+        ("eent Grad", "een Grad"),
+        ("eent Prozent", "een Prozent"),
+    )
+    # Number followed by currency code or symbol, with a comma or a dot as
+    # decimal separator
+    currency_pattern = re.compile(
+        r'(\d+[,.]\d+)\s*(EUR|€|USD|\$|GBP|£|CNY|¥|DEM|DM)')
+    currency_map = {
+        '€': 'EUR',
+        '$': 'USD',
+        '£': 'GBP',
+        '¥': 'CNY',
+        'DM': 'DEM'
+    }
+    final_n_pattern = re.compile(r'(\ben)(\s+)([a-zA-ZäöüÄÖÜ])', re.UNICODE)
+
+    def __init__(self):
+        self.lb = CONVERTER_CLASSES['lb']
+
+    def normalize_years_with_suffix(self, text):
+        """
+        Convert expressions like '1970er' to 'nonzénghonnertsiwenzeger' and
+        '80er' to 'achtzeger'.
+        Matches year patterns followed by 'er' suffix.
+        """
+        def replace_year_with_suffix(match):
+            year = int(match.group(1))
+            # Convert the year to words using the to_year method if available
+            try:
+                year_text = self.lb.to_year(year)
+            except AttributeError:
+                # Fallback if to_year method is not available
+                year_text = self.lb.to_cardinal(year)
+            return f"{year_text}er"
+
+        # First replace 4-digit years
+        result = self.year_pattern.sub(replace_year_with_suffix, text)
+        # Then replace 2-digit decades
+        if self.decades:
+            result = self.decade_pattern.sub(
+                lambda m: f"{self.lb.to_cardinal(int(m.group(1)))}er", result)
+        return result
+
+    def cardinal_for_unit(self, num):
+        # Patch: Use 'eenhonnert' for 100 when followed by a unit (°/ml/gr/kg)
+        if int(num) == 1:
+            return "een"
+        if int(num) == 100:
+            return "eenhonnert"
+        return self.lb.to_cardinal(int(num))
+
+    def normalize_units(self, text):
+        """
+        Convert numbers followed by units like °, ml, gr, kg, or %
+        with or without spaces (e.g., '90°', '100 ml', '50ml', '1kg').
+        """
+        # Handle negative temperatures first
+        text = self.neg_temp_pattern.sub(
+            lambda m: f"minus {self.lb.to_cardinal(int(m.group(1)))} Grad",
+            text)
+        text = self.temp_pattern.sub(
+            lambda m: f"{self.cardinal_for_unit(m.group(1))} Grad", text)
+        text = self.ml_pattern.sub(
+            lambda m: f"{self.cardinal_for_unit(m.group(1))} Milliliter",
+            text)
+        text = self.gr_pattern.sub(
+            lambda m: f"{self.cardinal_for_unit(m.group(1))} Gramm", text)
+
+        def kilogram(match):
+            if int(match.group(1)) == 1:
+                return "ee Kilogramm"
+            return f"{self.cardinal_for_unit(match.group(1))} Kilogramm"
+
+        text = self.kg_pattern.sub(kilogram, text)
+        text = self.percent_pattern.sub(
+            lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Prozent",
+            text)
+        return self.fix_singular_units(text)
+
+    def fix_singular_units(self, text):
+        # Fix any singular forms (1 unit)
+        for wrong, right in self.singular_fixes:
+            text = text.replace(wrong, right)
+        return text
+
+    def normalize_currency(self, text):
+        """
+        Convert currency expressions like '1,50 EUR', '1.50 €', '2,25 USD' to
+        Luxembourgish text.
+        Handles both comma and dot as decimal separators.
+        """
+        def replace_currency(match):
+            currency = match.group(2)
+            try:
+                amount = float(match.group(1).replace(',', '.'))
+                return self.lb.to_currency(
+                    amount, self.currency_map.get(currency, currency))
+            except ValueError:
+                # If parsing fails, return original
+                return match.group(0)
+
+        return self.currency_pattern.sub(replace_currency, text)
+
+    def fix_final_n(self, text):
+        """
+        Fixes words ending in '-en' to keep or drop the final 'n' based on the
+        next word. The 'n' is kept only if the next word starts with a vowel
+        (aeiouäöü) or n, d, t, z, h (not case-sensitive).
+        """
+        def repl(match):
+            en, space, next_char = match.groups()
+            if next_char.lower() in 'aeiouäöünndtzh':
+                return en + space + next_char
+            return 'e' + space + next_char
+
+        # Apply repeatedly in case of multiple matches
+        prev = None
+        while prev != text:
+            prev = text
+            text = self.final_n_pattern.sub(repl, text)
+        return text
+
+    def normalize_text(self, text):
+        """Apply all normalization rules to the text"""
+        for stage in self.stages:
+            text = getattr(self, stage)(text)
+        return text
+
+
+_default_normalizer = None
+_default_lock = threading.Lock()
+
+
+def default_normalizer():
+    """Return the LuxembourgishNormalizer with DEFAULT_RULES that the
+    whole process shares, created on first use."""
+    global _default_normalizer
+    if _default_normalizer is None:
+        with _default_lock:
+            if _default_normalizer is None:
+                _default_normalizer = LuxembourgishNormalizer()
+    return _default_normalizer
+
+
+def main(argv=None):
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(
+        prog='python -m num2words.normalizer',
+        description="Normalize numbers, dates and abbreviations in "
+                    "Luxembourgish text")
+    parser.add_argument('input', nargs='?',
+                        help="text file (default: standard input)")
+    parser.add_argument('--stream', action='store_true',
+                        help="write the output while reading the input, in "
+                             "chunks of bounded size")
+    parser.add_argument('--chunk-size', type=int, default=65536,
+                        help="characters per chunk with --stream")
+    parser.add_argument('--profile', action='store_true',
+                        help="write the statistics of every stage to "
+                             "standard error, as JSON")
+    args = parser.parse_args(argv)
+    profile = NormalizationProfile() if args.profile else None
+    if profile is not None:
+        normalizer = LuxembourgishNormalizer(profile=profile)
+    else:
+        normalizer = default_normalizer()
+    infile = open(args.input, encoding='utf-8') if args.input else sys.stdin
+    with infile:
+        if args.stream:
+            normalizer.normalize_file(infile, sys.stdout, args.chunk_size)
+        else:
+            print(normalizer.normalize(infile.read()))
+    if profile is not None:
+        print(profile.to_json(indent=2, sort_keys=True), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
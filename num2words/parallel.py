@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Convert large batches of numbers on several processes.
+
+The conversion code is pure Python, so threads cannot use more than one
+core. ParallelConverter splits the input into chunks, converts them with
+num2words_many() on a pool of worker processes and hands the results back
+in input order::
+
+    >>> from num2words.parallel import ParallelConverter
+    >>> with ParallelConverter(langs=['lb']) as pool:
+    ...     words = pool.map(range(1000000), lang='lb')
+
+Unless a fixed `chunksize` is given, the chunk size adapts to the measured
+conversion time, so that each chunk keeps a worker busy for about
+`target_seconds`.
+"""
+
+from __future__ import unicode_literals
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import CONVERTER_CLASSES, num2words_many
+
+
+def _warm_up(langs):
+    for lang in langs:
+        CONVERTER_CLASSES.resolve(lang)
+
+
+def _convert_chunk(numbers, lang, to, errors, kwargs):
+    started = time.perf_counter()
+    words = num2words_many(numbers, lang=lang, to=to, errors=errors,
+                           **kwargs)
+    return words, time.perf_counter() - started
+
+
+class ParallelConverter(object):
+    """Pool of worker processes converting numbers in chunks.
+
+    `workers` defaults to the number of CPUs. The converters of `langs`
+    are loaded in every worker when it starts; other languages are loaded
+    on first use and then stay warm for the lifetime of the pool.
+    """
+
+    def __init__(self, workers=None, langs=(), mp_context=None,
+                 min_chunksize=16, max_chunksize=8192, target_seconds=0.05):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunksize = min_chunksize
+        self.max_chunksize = max_chunksize
+        self.target_seconds = target_seconds
+        self._executor = ProcessPoolExecutor(
+            self.workers, mp_context=mp_context, initializer=_warm_up,
+            initargs=(tuple(langs),))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut the worker processes down."""
+        self._executor.shutdown(wait=True)
+
+    def _first_chunksize(self, numbers):
+        try:
+            size = len(numbers) // (self.workers * 4)
+        except TypeError:
+            size = self.min_chunksize
+        return max(self.min_chunksize, min(self.max_chunksize, size))
+
+    def _next_chunksize(self, count, seconds):
+        if seconds <= 0:
+            return self.max_chunksize
+        size = int(self.target_seconds * count / seconds)
+        return max(self.min_chunksize, min(self.max_chunksize, size))
+
+    def imap(self, numbers, lang='en', to='cardinal', errors='raise',
+             chunksize=None, **kwargs):
+        """Return an iterator over the words for `numbers`, in order.
+
+        `numbers` is consumed lazily: at most two chunks per worker are
+        read ahead, so arbitrarily long iterables can be streamed. Errors
+        are handled as by num2words_many(); with ``errors='raise'`` the
+        chunks still in flight are cancelled.
+        """
+        if errors not in ('raise', 'return'):
+            raise ValueError("errors must be 'raise' or 'return', not %r"
+                             % (errors,))
+        # Fail early, in this process, for unknown languages
+        CONVERTER_CLASSES.resolve(lang)
+        if hasattr(numbers, 'tolist'):
+            numbers = numbers.tolist()
+        return self._imap(numbers, lang, to, errors, chunksize, kwargs)
+
+    def _imap(self, numbers, lang, to, errors, chunksize, kwargs):
+        size = chunksize or self._first_chunksize(numbers)
+        numbers = iter(numbers)
+        pending = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < 2 * self.workers:
+                    chunk = list(islice(numbers, size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(self._executor.submit(
+                        _convert_chunk, chunk, lang, to, errors, kwargs))
+                if not pending:
+                    return
+                words, seconds = pending.popleft().result()
+                if chunksize is None:
+                    size = self._next_chunksize(len(words), seconds)
+                for item in words:
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def map(self, numbers, lang='en', to='cardinal', errors='raise',
+            chunksize=None, **kwargs):
+        """Return the list of words for `numbers`, in order."""
+        return list(self.imap(numbers, lang=lang, to=to, errors=errors,
+                              chunksize=chunksize, **kwargs))
+
+
+def num2words_parallel(numbers, lang='en', to='cardinal', errors='raise',
+                       workers=None, chunksize=None, **kwargs):
+    """Convert `numbers` like num2words_many() on a temporary pool of
+    `workers` processes and return the list of words."""
+    with ParallelConverter(workers, langs=[lang]) as pool:
+        return pool.map(numbers, lang=lang, to=to, errors=errors,
+                        chunksize=chunksize, **kwargs)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import importlib
+import threading
+from collections import OrderedDict
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+
+class ConverterRegistry(MutableMapping):
+    """Mapping of language codes to converter instances.
+
+    Languages are registered with a ``'lang_XX.Num2Word_XX'`` path relative
+    to the ``num2words`` package. The module is only imported, and the
+    converter only instantiated, the first time the language is looked up.
+    Membership tests and iteration over the language codes never import
+    anything, so ``lang in CONVERTER_CLASSES`` stays cheap.
+    """
+
+    def __init__(self, specs, package=__package__):
+        self._package = package
+        self._specs = OrderedDict(specs)
+        self._instances = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, lang):
+        try:
+            return self._instances[lang]
+        except KeyError:
+            pass
+        with self._lock:
+            # Another thread may have loaded it while we were waiting.
+            if lang not in self._instances:
+                self._instances[lang] = self._load(self._specs[lang])
+            return self._instances[lang]
+
+    def __setitem__(self, lang, converter):
+        with self._lock:
+            self._specs[lang] = None
+            self._instances[lang] = converter
+
+    def __delitem__(self, lang):
+        with self._lock:
+            del self._specs[lang]
+            self._instances.pop(lang, None)
+
+    def __contains__(self, lang):
+        return lang in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self._specs))
+
+    def _load(self, spec):
+        module_name, class_name = spec.rsplit('.', 1)
+        module = importlib.import_module('.' + module_name, self._package)
+        return getattr(module, class_name)()
+
+    def is_loaded(self, lang):
+        """Return True if the converter for `lang` is already instantiated.
+        """
+        return lang in self._instances
+
+    def resolve(self, lang):
+        """Return the converter for `lang`, falling back to its first two
+        letters (``'fr_XX'`` -> ``'fr'``) when the full code is unknown.
+        """
+        # We try the full language first
+        if lang not in self._specs:
+            # ... and then try only the first 2 letters
+            lang = lang[:2]
+        if lang not in self._specs:
+            raise NotImplementedError()
+        return self[lang]
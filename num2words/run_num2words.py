@@ -6,7 +6,6 @@ Includes special cases like:
 - Units with or without spaces (e.g., '90°', '100 ml', '50ml')
 """
 
-import re
 import sys
 import os
 
@@ -15,187 +14,10 @@ sys.path.insert(0, os.path.abspath('..'))
 
 try:
     from num2words.lang_LB import Num2Word_LB
+    from num2words.normalizer import TextNormalizer  # noqa: F401
 except ImportError:
-    try:
-        from lang_LB import Num2Word_LB
-    except ImportError:
-        print("ERROR: Could not import Num2Word_LB class")
-        sys.exit(1)
-
-class TextNormalizer:
-    """Text normalizer for Luxembourgish with special handling for years, units, etc."""
-    
-    def __init__(self):
-        self.lb = Num2Word_LB()
-        
-        # Unit mappings
-        self.unit_mappings = {
-            '°': 'Grad',
-            'ml': 'Milliliter',
-            'gr': 'Gramm',
-            '%': 'Prozent'
-        }
-
-    def normalize_years_with_suffix(self, text):
-        """
-        Convert expressions like '1970er' to 'nonzénghonnertsiwenzeger' and '80er' to 'achtzeger'.
-        Matches year patterns followed by 'er' suffix.
-        """
-        # Pattern for years between 1000-2099 followed by 'er'
-        year_pattern = r'\b(1\d{3}|20\d{2})er\b'
-        
-        # Pattern for 2-digit numbers followed by 'er'
-        decade_pattern = r'\b([1-9]\d)er\b'
-        
-        def replace_year_with_suffix(match):
-            year = int(match.group(1))
-            # Convert the year to words using the to_year method if available
-            try:
-                year_text = self.lb.to_year(year)
-            except AttributeError:
-                # Fallback if to_year method is not available
-                year_text = self.lb.to_cardinal(year)
-            
-            # Add the -er suffix
-            return f"{year_text}er"
-        
-        def replace_decade_with_suffix(match):
-            decade = int(match.group(1))
-            # Convert the decade to words
-            decade_text = self.lb.to_cardinal(decade)
-            # Add the -er suffix
-            return f"{decade_text}er"
-        
-        # First replace 4-digit years
-        result = re.sub(year_pattern, replace_year_with_suffix, text)
-        # Then replace 2-digit decades
-        result = re.sub(decade_pattern, replace_decade_with_suffix, result)
-        
-        return result
-
-    def normalize_units(self, text):
-        """
-        Convert numbers followed by units like °, ml, gr, kg, or %
-        with or without spaces (e.g., '90°', '100 ml', '50ml', '1kg').
-        """
-        # Handle negative temperatures first
-        neg_temp_pattern = r'(?<![0-9])-(\d+)\s*[°\u00B0]'
-        text = re.sub(neg_temp_pattern, lambda m: f"minus {self.lb.to_cardinal(int(m.group(1)))} Grad", text)
-        
-        # Patch: Use 'eenhonnert' for 100 when followed by a unit (°/ml/gr/kg)
-        def cardinal_for_unit(num):
-            if int(num) == 1:
-                return "een"
-            if int(num) == 100:
-                return "eenhonnert"
-            return self.lb.to_cardinal(int(num))
-
-        # Handle temperature (°)
-        temp_pattern = r'(?<![0-9])(\d+)\s*[°\u00B0]'
-        text = re.sub(temp_pattern, lambda m: f"{cardinal_for_unit(m.group(1))} Grad", text)
-        
-        # Handle milliliters (ml)
-        ml_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*ml\b'
-        text = re.sub(ml_pattern, lambda m: f"{cardinal_for_unit(m.group(1))} Milliliter", text)
-        
-        # Handle grams (gr)
-        gr_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*gr\b'
-        text = re.sub(gr_pattern, lambda m: f"{cardinal_for_unit(m.group(1))} Gramm", text)
-        
-        # Handle kilograms (kg)
-        kg_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*kg\b'
-        text = re.sub(kg_pattern, lambda m: f"{'ee' if int(m.group(1)) == 1 else cardinal_for_unit(m.group(1))} Kilogramm", text)
-        
-        # Handle percentages (%)
-        percent_pattern = r'(?<![a-zA-Z0-9-])(\d+)\s*%'
-        text = re.sub(percent_pattern, lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Prozent", text)
-        
-        # Fix any singular forms (1 unit)
-        text = text.replace("eent Milliliter", "een Milliliter")
-        text = text.replace("eent Gramm", "een Gramm")
-        text = text.replace("eent Grad", "een Grad")
-        text = text.replace("eent Prozent", "een Prozent")
-        
-        return text
-
-    def normalize_currency(self, text):
-        """
-        Convert currency expressions like '1,50 EUR', '1.50 €', '2,25 USD' to Luxembourgish text.
-        Handles both comma and dot as decimal separators.
-        """
-        # Pattern for currency expressions: number followed by currency code or symbol
-        # Supports both comma and dot as decimal separators
-        currency_pattern = r'(\d+[,.]\d+)\s*(EUR|€|USD|\$|GBP|£|CNY|¥|DEM|DM)'
-        
-        def replace_currency(match):
-            amount_str = match.group(1)
-            currency = match.group(2)
-            
-            # Convert comma to dot for parsing
-            if ',' in amount_str:
-                amount_str = amount_str.replace(',', '.')
-            
-            try:
-                amount = float(amount_str)
-                
-                # Map currency symbols to currency codes
-                currency_map = {
-                    '€': 'EUR',
-                    '$': 'USD', 
-                    '£': 'GBP',
-                    '¥': 'CNY',
-                    'DM': 'DEM'
-                }
-                
-                currency_code = currency_map.get(currency, currency)
-                
-                # Convert to Luxembourgish currency text
-                return self.lb.to_currency(amount, currency_code)
-                
-            except ValueError:
-                # If parsing fails, return original
-                return match.group(0)
-        
-        return re.sub(currency_pattern, replace_currency, text)
-        
-    def fix_final_n(self, text):
-        """
-        Fixes words ending in '-en' to keep or drop the final 'n' based on the next word.
-        The 'n' is kept only if the next word starts with a vowel (aeiouäöü) or n, d, t, z, h (not case-sensitive).
-        """
-        # Regex: word ending in 'en' followed by a space and a word
-        pattern = re.compile(r'(\ben)(\s+)([a-zA-ZäöüÄÖÜ])', re.UNICODE)
-        def repl(match):
-            en = match.group(1)
-            space = match.group(2)
-            next_char = match.group(3)
-            if next_char.lower() in 'aeiouäöünndtzh':
-                return en + space + next_char
-            else:
-                return 'e' + space + next_char
-        # Apply repeatedly in case of multiple matches
-        prev = None
-        while prev != text:
-            prev = text
-            text = pattern.sub(repl, text)
-        return text
-
-    def normalize_text(self, text):
-        """Apply all normalization rules to the text"""
-        # First normalize years with suffix
-        result = self.normalize_years_with_suffix(text)
-        
-        # Then normalize currency
-        result = self.normalize_currency(result)
-        
-        # Then normalize units
-        result = self.normalize_units(result)
-        
-        # Then fix final n
-        result = self.fix_final_n(result)
-        
-        # Return the fully normalized text
-        return result
+    print("ERROR: Could not import Num2Word_LB class")
+    sys.exit(1)
 
 
 def test_normalizer():
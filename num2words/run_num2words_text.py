@@ -18,92 +18,45 @@ sys.path.insert(0, os.path.abspath('..'))
 
 try:
     from num2words.lang_LB import Num2Word_LB
+    from num2words import normalizer
 except ImportError:
-    try:
-        from lang_LB import Num2Word_LB
-    except ImportError:
-        print("ERROR: Could not import Num2Word_LB class")
-        sys.exit(1)
+    print("ERROR: Could not import Num2Word_LB class")
+    sys.exit(1)
 
-class TextNormalizer:
-    """Text normalizer for Luxembourgish with special handling for years, units, etc."""
-    
-    def __init__(self):
-        self.lb = Num2Word_LB()
-        
-        # Unit mappings
-        self.unit_mappings = {
-            '°': 'Grad',
-            'ml': 'Milliliter',
-            'gr': 'Gramm',
-            '%': 'Prozent'
-        }
 
-    def normalize_years_with_suffix(self, text):
-        """
-        Convert expressions like '1970er' to 'nonnzénghonnertsiwenzeger'.
-        Matches year patterns followed by 'er' suffix.
-        """
-        # Pattern for years between 1000-2099 followed by 'er'
-        pattern = r'\b(1\d{3}|20\d{2})er\b'
-        
-        def replace_year_with_suffix(match):
-            year = int(match.group(1))
-            # Convert the year to words using the to_year method if available
-            try:
-                year_text = self.lb.to_year(year)
-            except AttributeError:
-                # Fallback if to_year method is not available
-                year_text = self.lb.to_cardinal(year)
-            
-            # Add the -er suffix
-            return f"{year_text}er"
-        
-        # Replace all occurrences in the text
-        result = re.sub(pattern, replace_year_with_suffix, text)
-        return result
+class TextNormalizer(normalizer.TextNormalizer):
+    """Text normalizer for Luxembourgish with special handling for years,
+    units, etc.
+
+    Spells years and units only, without the currency and final -n stages."""
+
+    stages = ('normalize_years_with_suffix', 'normalize_units')
+    decades = False
+
+    temp_pattern = re.compile(r'\b(\d+)\s*°\b')
+    ml_pattern = re.compile(r'\b(\d+)\s*ml\b')
+    gr_pattern = re.compile(r'\b(\d+)\s*gr\b')
+    percent_pattern = re.compile(r'\b(\d+)\s*%\b')
+    singular_fixes = (
+        ("eent Milliliter", "ee Milliliter"),
+        ("eent Gramm", "ee Gramm"),
+        ("eent Grad", "ee Grad"),
+        ("eent Prozent", "ee Prozent"),
+    )
 
     def normalize_units(self, text):
         """
         Convert numbers followed by units like °, ml, gr, or %
         with or without spaces (e.g., '90°', '100 ml', '50ml').
         """
-        # Handle each unit type separately to ensure they all match properly
-        
-        # Handle temperature (°)
-        temp_pattern = r'\b(\d+)\s*°\b'
-        text = re.sub(temp_pattern, lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Grad", text)
-        
-        # Handle milliliters (ml)
-        ml_pattern = r'\b(\d+)\s*ml\b'
-        text = re.sub(ml_pattern, lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Milliliter", text)
-        
-        # Handle grams (gr)
-        gr_pattern = r'\b(\d+)\s*gr\b'
-        text = re.sub(gr_pattern, lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Gramm", text)
-        
-        # Handle percentages (%)
-        percent_pattern = r'\b(\d+)\s*%\b'
-        text = re.sub(percent_pattern, lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} Prozent", text)
-        
-        # Fix any singular forms (1 unit)
-        text = text.replace("eent Milliliter", "ee Milliliter")
-        text = text.replace("eent Gramm", "ee Gramm")
-        text = text.replace("eent Grad", "ee Grad")
-        text = text.replace("eent Prozent", "ee Prozent")
-        
-        return text
-        
-    def normalize_text(self, text):
-        """Apply all normalization rules to the text"""
-        # First normalize years with suffix
-        result = self.normalize_years_with_suffix(text)
-        
-        # Then normalize units
-        result = self.normalize_units(result)
-        
-        # Return the fully normalized text
-        return result
+        for pattern, unit in ((self.temp_pattern, 'Grad'),
+                              (self.ml_pattern, 'Milliliter'),
+                              (self.gr_pattern, 'Gramm'),
+                              (self.percent_pattern, 'Prozent')):
+            text = pattern.sub(
+                lambda m: f"{self.lb.to_cardinal(int(m.group(1)))} {unit}",
+                text)
+        return self.fix_singular_units(text)
 
 
 def test_normalizer():
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""HTTP server keeping converters and the normalizer warm.
+
+``python -m num2words.server`` (or ``num2words serve``) answers JSON
+requests with the standard library's HTTP server. The converters stay
+loaded between requests, connections are kept alive (HTTP/1.1) and
+``--workers`` processes share the listening socket::
+
+    POST /convert          {"number": 42, "lang": "lb", "to": "ordinal"}
+                           -> {"words": "zweeavéierzegsten"}
+    GET  /convert?number=42&lang=lb&to=ordinal
+    POST /convert/batch    {"numbers": [1, "2.50"], "lang": "en",
+                            "to": "currency", "kwargs": {"currency": "USD"}}
+                           -> {"results": [{"words": ...}, {"error": ...}]}
+    POST /normalize        {"text": "Den 1. Mee"} -> {"text": ...}
+    POST /normalize/batch  {"texts": ["...", "..."]} -> {"texts": [...]}
+    GET  /health           -> {"status": "ok"}
+
+``lang`` defaults to ``en`` and ``to`` to ``cardinal``; ``kwargs`` are
+passed on to the converter. Errors come back with a 4xx status and an
+``error`` field, or, in a batch, as the ``error`` of that number.
+Request bodies larger than ``--max-body`` bytes and batches of more than
+``--max-batch`` items are refused with status 413.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import os
+import signal
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from . import _batch_converter
+from .batch import describe_error
+from .cache import kwargs_key
+from .parallel import _warm_up
+
+
+class RequestError(Exception):
+    """A request the server refuses, with its HTTP status."""
+
+    def __init__(self, status, message):
+        super(RequestError, self).__init__(message)
+        self.status = status
+
+
+class ConversionService(object):
+    """The conversions behind the endpoints, without the HTTP.
+
+    The converter of every (lang, to, kwargs) combination is resolved
+    once and kept, as is the shared Luxembourgish normalizer.
+    """
+
+    def __init__(self, max_batch=10000, langs=()):
+        self.max_batch = max_batch
+        self._converters = {}
+        _warm_up(langs)
+        from .normalizer import default_normalizer
+        self.normalizer = default_normalizer()
+
+    def converter(self, lang='en', to='cardinal', kwargs=None):
+        kwargs = kwargs or {}
+        if not isinstance(kwargs, dict):
+            raise RequestError(400, 'kwargs must be an object')
+        key = (lang, to, kwargs_key(kwargs))
+        convert = self._converters.get(key)
+        if convert is None:
+            try:
+                convert = _batch_converter(lang, to, kwargs)
+            except NotImplementedError as err:
+                raise RequestError(
+                    400, str(err) or 'unsupported lang/to: %s/%s'
+                    % (lang, to))
+            if key[2] is not None:
+                self._converters[key] = convert
+        return convert
+
+    def _items(self, request, field):
+        items = request.get(field)
+        if not isinstance(items, list):
+            raise RequestError(400, '%s must be a list' % field)
+        if len(items) > self.max_batch:
+            raise RequestError(413, 'at most %d %s per request'
+                               % (self.max_batch, field))
+        return items
+
+    def convert(self, request):
+        if 'number' not in request:
+            raise RequestError(400, 'number is required')
+        convert = self.converter(request.get('lang', 'en'),
+                                 request.get('to', 'cardinal'),
+                                 request.get('kwargs'))
+        try:
+            return {'words': convert(request['number'])}
+        except Exception as err:
+            raise RequestError(400, describe_error(err))
+
+    def convert_batch(self, request):
+        numbers = self._items(request, 'numbers')
+        convert = self.converter(request.get('lang', 'en'),
+                                 request.get('to', 'cardinal'),
+                                 request.get('kwargs'))
+        results = []
+        for number in numbers:
+            try:
+                results.append({'words': convert(number)})
+            except Exception as err:
+                results.append({'error': describe_error(err)})
+        return {'results': results}
+
+    def normalize(self, request):
+        text = request.get('text')
+        if not isinstance(text, str):
+            raise RequestError(400, 'text must be a string')
+        return {'text': self.normalizer.normalize(text)}
+
+    def normalize_batch(self, request):
+        texts = self._items(request, 'texts')
+        if not all(isinstance(text, str) for text in texts):
+            raise RequestError(400, 'texts must be strings')
+        return {'texts': [self.normalizer.normalize(text)
+                          for text in texts]}
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """Request handler; the service and limits are on the server."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'num2words'
+    # seconds an idle keep-alive connection is kept open
+    timeout = 30
+    # headers and body are written separately; with Nagle's algorithm
+    # the body would wait for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+
+    POST_ROUTES = {
+        '/convert': 'convert',
+        '/convert/batch': 'convert_batch',
+        '/normalize': 'normalize',
+        '/normalize/batch': 'normalize_batch',
+    }
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            self._respond(200, {'status': 'ok'})
+        elif url.path == '/convert':
+            self._call('convert', dict(parse_qsl(url.query)))
+        elif url.path in self.POST_ROUTES:
+            self._respond(405, {'error': 'use POST'})
+        else:
+            self._respond(404, {'error': 'not found'})
+
+    def do_POST(self):
+        name = self.POST_ROUTES.get(urlsplit(self.path).path)
+        if name is None:
+            self._discard_body()
+            self._respond(404, {'error': 'not found'})
+            return
+        try:
+            request = self._read_json()
+        except RequestError as err:
+            self._respond(err.status, {'error': str(err)})
+            return
+        self._call(name, request)
+
+    def _call(self, name, request):
+        try:
+            response = getattr(self.server.service, name)(request)
+        except RequestError as err:
+            self._respond(err.status, {'error': str(err)})
+        else:
+            self._respond(200, response)
+
+    def _content_length(self):
+        try:
+            return int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+
+    def _discard_body(self):
+        length = self._content_length()
+        if length is not None and length <= self.server.max_body:
+            self.rfile.read(length)
+        else:
+            self.close_connection = True
+
+    def _read_json(self):
+        length = self._content_length()
+        if length is None:
+            self.close_connection = True
+            raise RequestError(411, 'Content-Length is required')
+        if length > self.server.max_body:
+            # the body is not read, the connection cannot be reused
+            self.close_connection = True
+            raise RequestError(413, 'request body larger than %d bytes'
+                               % self.server.max_body)
+        try:
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError as err:
+            raise RequestError(400, 'invalid JSON: %s' % err)
+        if not isinstance(request, dict):
+            raise RequestError(400, 'the request must be a JSON object')
+        return request
+
+    def _respond(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.access_log:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """HTTP server with one thread per connection."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, service=None, max_body=1 << 20,
+                 access_log=False):
+        ThreadingHTTPServer.__init__(self, address, ConversionHandler)
+        self.service = service or ConversionService()
+        self.max_body = max_body
+        self.access_log = access_log
+
+
+def _block_sigterm(block):
+    if hasattr(signal, 'pthread_sigmask'):
+        signal.pthread_sigmask(signal.SIG_BLOCK if block
+                               else signal.SIG_UNBLOCK, [signal.SIGTERM])
+
+
+def serve(server, workers=1):
+    """Serve requests on `server` until interrupted.
+
+    With more than one worker, the process forks `workers` children that
+    accept connections on the socket of `server` and waits for them.
+    """
+    if workers <= 1 or not hasattr(os, 'fork'):
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+    children = []
+    # stop the children too when the parent is killed, even while it is
+    # still forking them; the children inherit the handler
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    try:
+        for _ in range(workers):
+            # a SIGTERM arriving around fork() waits until the parent has
+            # recorded the child and the child is inside its own try
+            _block_sigterm(True)
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    _block_sigterm(False)
+                    server.serve_forever()
+                except (KeyboardInterrupt, SystemExit):
+                    pass
+                finally:
+                    os._exit(0)
+            children.append(pid)
+            _block_sigterm(False)
+        server.server_close()
+        for pid in children:
+            os.waitpid(pid, 0)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+
+
+def main(argv=None, prog='python -m num2words.server'):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes serving requests (default: 1)')
+    parser.add_argument('--langs', default='',
+                        help='comma separated languages to load at start')
+    parser.add_argument('--max-body', type=int, default=1 << 20,
+                        help='largest request body in bytes (default: 1 MB)')
+    parser.add_argument('--max-batch', type=int, default=10000,
+                        help='most numbers or texts per batch request')
+    parser.add_argument('--access-log', action='store_true',
+                        help='log every request to standard error')
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    langs = [lang for lang in args.langs.split(',') if lang]
+    try:
+        service = ConversionService(args.max_batch, langs)
+    except NotImplementedError:
+        parser.error('unknown language in --langs: %s' % args.langs)
+    server = ConversionServer((args.host, args.port), service,
+                              args.max_body, args.access_log)
+    host, port = server.server_address[:2]
+    print('num2words serving on http://%s:%d/ with %d worker(s)'
+          % (host, port, args.workers), file=sys.stderr)
+    serve(server, args.workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
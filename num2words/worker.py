@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Long-lived worker answering conversion requests over a pipe or socket.
+
+Programs that need words for numbers all the time, like speech synthesis
+front-ends, start ``num2words worker`` (or ``python -m num2words.worker``)
+once and talk to it over its standard input and output, or over a Unix
+domain socket with ``--socket PATH``. Requests and responses are JSON
+objects, one per line (UTF-8, newline-terminated; newlines inside strings
+are escaped by JSON)::
+
+    {"id": 1, "op": "convert", "number": 42, "lang": "lb", "to": "ordinal"}
+    -> {"id": 1, "words": "zweeavéierzegsten"}
+    {"id": 2, "op": "normalize", "text": "Den 1. Mee"}
+    -> {"id": 2, "text": "Den éischte Mee"}
+
+The operations are those of the HTTP server (see num2words.server) with
+the same fields: ``convert`` (the default), ``convert_batch``,
+``normalize`` and ``normalize_batch``, plus ``ping``. A request that fails
+gets ``{"id": ..., "error": "..."}``. Responses come in the order of the
+requests and carry their ``id``, so a client may send several requests
+before reading the responses. Each response is flushed as soon as it is
+written. Every socket connection is served by a thread of its own.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+from .batch import describe_error
+from .server import ConversionService, RequestError
+
+# the ConversionService methods requests may call
+OPERATIONS = ('convert', 'convert_batch', 'normalize', 'normalize_batch')
+
+
+def handle_request(service, line):
+    """Return the response (a dict) to the JSON request of `line`."""
+    try:
+        request = json.loads(line)
+    except ValueError as err:
+        return {'id': None, 'error': 'invalid JSON: %s' % err}
+    if not isinstance(request, dict):
+        return {'id': None, 'error': 'the request must be a JSON object'}
+    response = {'id': request.get('id')}
+    op = request.get('op', 'convert')
+    if op == 'ping':
+        response['pong'] = True
+    elif op not in OPERATIONS:
+        response['error'] = 'unknown op: %s' % (op,)
+    else:
+        try:
+            response.update(getattr(service, op)(request))
+        except RequestError as err:
+            response['error'] = str(err)
+        except Exception as err:
+            response['error'] = describe_error(err)
+    return response
+
+
+def serve_stream(service, infile, outfile):
+    """Answer the requests read from the binary file `infile` on the
+    binary file `outfile` until `infile` ends."""
+    for line in infile:
+        if not line.strip():
+            continue
+        response = handle_request(service, line)
+        outfile.write(json.dumps(response, ensure_ascii=False)
+                      .encode('utf-8') + b'\n')
+        outfile.flush()
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        serve_stream(self.server.service, self.rfile, self.wfile)
+
+
+class WorkerServer(socketserver.ThreadingUnixStreamServer):
+    """Unix domain socket server with one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(self, path, service=None):
+        socketserver.ThreadingUnixStreamServer.__init__(
+            self, path, _ConnectionHandler)
+        self.service = service or ConversionService()
+
+
+def _remove_socket(path):
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except OSError:
+        pass
+
+
+def _socket_in_use(path):
+    """Return whether a server answers on the Unix domain socket `path`.
+    A socket nobody answers on is left behind by a worker that was killed,
+    and is removed."""
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            _remove_socket(path)
+            return False
+        except OSError:
+            return False
+    return True
+
+
+def main(argv=None, prog='python -m num2words.worker'):
+    parser = argparse.ArgumentParser(prog=prog,
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('--socket', metavar='PATH',
+                        help='listen on this Unix domain socket instead of '
+                        'answering on standard input and output')
+    parser.add_argument('--langs', default='',
+                        help='comma separated languages to load at start')
+    parser.add_argument('--max-batch', type=int, default=10000,
+                        help='most numbers or texts per batch request')
+    args = parser.parse_args(argv)
+
+    langs = [lang for lang in args.langs.split(',') if lang]
+    try:
+        service = ConversionService(args.max_batch, langs)
+    except NotImplementedError:
+        parser.error('unknown language in --langs: %s' % args.langs)
+    if args.socket is None:
+        try:
+            serve_stream(service, sys.stdin.buffer, sys.stdout.buffer)
+        except (KeyboardInterrupt, BrokenPipeError):
+            pass
+        return 0
+    if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+        parser.error('Unix domain sockets are not available here')
+    if _socket_in_use(args.socket):
+        parser.error('address in use: %s' % args.socket)
+    server = WorkerServer(args.socket, service)
+    # clean up on kill as well as on ^C
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    print('num2words worker listening on %s' % args.socket, file=sys.stderr)
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.server_close()
+        _remove_socket(args.socket)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
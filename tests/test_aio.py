@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from num2words import num2words, num2words_many
+from num2words.aio import (amap, anormalize, anormalize_lines, anum2words,
+                           anum2words_many, make_executor, normalize_lb)
+
+
+def collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+
+class AsyncTest(TestCase):
+
+    def test_anum2words(self):
+        self.assertEqual(asyncio.run(anum2words(42, lang='lb')),
+                         num2words(42, lang='lb'))
+        self.assertEqual(
+            asyncio.run(anum2words(1.5, lang='en', to='currency',
+                                   currency='USD')),
+            num2words(1.5, lang='en', to='currency', currency='USD'))
+
+    def test_anum2words_many(self):
+        self.assertEqual(asyncio.run(anum2words_many(range(5), lang='fr')),
+                         num2words_many(range(5), lang='fr'))
+
+    def test_executor(self):
+        with make_executor(2, langs=['lb']) as executor:
+            words = asyncio.run(anum2words(7, lang='lb', executor=executor))
+        self.assertEqual(words, num2words(7, lang='lb'))
+
+    def test_process_executor(self):
+        with make_executor(1, langs=['lb'], processes=True) as executor:
+            lines = collect(anormalize_lines(['3 Kilometer'],
+                                             executor=executor))
+        self.assertEqual(lines, [normalize_lb('3 Kilometer')])
+
+    def test_anormalize_lines(self):
+        text = ['Um 10:34 Auer\n', 'Telefon: 62 11 08\n', '5 Stonnen']
+        self.assertEqual(collect(anormalize_lines(iter(text))),
+                         [normalize_lb(line.rstrip('\n')) for line in text])
+
+    def test_async_source(self):
+        async def source():
+            for line in (b'2 Fl\xc3\xa4schen\n', b'1970er'):
+                yield line
+        self.assertEqual(collect(anormalize_lines(source(), max_pending=1)),
+                         [normalize_lb('2 Fläschen'), normalize_lb('1970er')])
+
+    def test_anormalize(self):
+        text = 'Den 30. Abrëll 2010\nTelefon: 08'
+        self.assertEqual(asyncio.run(anormalize(text)), normalize_lb(text))
+
+    def test_backpressure(self):
+        read = []
+
+        def numbers():
+            for n in range(100):
+                read.append(n)
+                yield n
+
+        async def take_three():
+            agen = amap(str, numbers(), max_pending=4)
+            results = [await agen.__anext__() for _ in range(3)]
+            await agen.aclose()
+            return results
+
+        self.assertEqual(asyncio.run(take_three()), ['0', '1', '2'])
+        self.assertLessEqual(len(read), 4 + 2)
+
+    def test_cancellation(self):
+        started = []
+        release = threading.Event()
+
+        def slow(n):
+            started.append(n)
+            release.wait(5)
+            return n
+
+        async def run():
+            with make_executor(1) as executor:
+                task = asyncio.ensure_future(collect_async(
+                    amap(slow, range(10), executor, max_pending=5)))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                release.set()
+
+        async def collect_async(agen):
+            return [item async for item in agen]
+
+        asyncio.run(run())
+        time.sleep(0.05)
+        # Only the call already running when cancelled was executed
+        self.assertEqual(started, [0])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            collect(amap(str, [1], max_pending=0))
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(anum2words(1, lang='xx'))
@@ -86,3 +86,52 @@ class Num2WordBaseTest(TestCase):
     def test_pluralize_not_implemented(self):
         with self.assertRaises(NotImplementedError):
             self.base.pluralize(n=None, forms=None)
+
+    def test_chunk_table(self):
+        from num2words.lang_EN import Num2Word_EN
+        n2w = Num2Word_EN()
+        table = n2w._chunk_table()
+        self.assertEqual(len(table), 1000)
+        self.assertIs(n2w._chunk_table(), table)
+        self.assertEqual(table[342], n2w.clean(n2w.splitnum(342)))
+        for value in (1000, 1001, 123456789, 10 ** 18 + 7):
+            self.assertEqual(n2w._split_merge(value, table),
+                             n2w.clean(n2w.splitnum(value)))
+
+    def test_chunk_table_state(self):
+        from num2words.lang_DA import Num2Word_DA
+        from num2words.lang_TET import Num2Word_TET
+        n2w = Num2Word_DA()
+        cardinals = n2w._chunk_table()
+        n2w.ordflag = True
+        self.assertIsNot(n2w._chunk_table(), cardinals)
+        self.assertIsNone(Num2Word_TET()._chunk_table())
+        self.assertIsNone(self.base._chunk_table())
+
+    def test_split_engine(self):
+        from num2words.lang_FR import Num2Word_FR
+        iterative = Num2Word_FR()
+        legacy = Num2Word_FR()
+        legacy.SPLIT_ENGINE = 'legacy'
+        self.assertIsNone(legacy._chunk_table())
+        for value in (0, 7, 80, 181, 1000, 2001, 71000071, 10 ** 30 + 1):
+            self.assertEqual(iterative.to_cardinal(value),
+                             legacy.to_cardinal(value))
+            self.assertEqual(iterative._split_merge(value, ()),
+                             legacy.clean(legacy.splitnum(value)))
+
+    def test_scale_for(self):
+        from num2words.lang_EN import Num2Word_EN
+        converter = Num2Word_EN()
+        for value in (0, 1, 99, 100, 101, 999, 1000, 10 ** 6 - 1,
+                      10 ** 303, 10 ** 305 + 7):
+            linear = next(elem for elem in converter.cards if elem <= value)
+            self.assertEqual(converter._scale_for(value), linear)
+        self.assertIsNone(converter._scale_for(-1))
+
+    def test_scale_for_unsorted_cards(self):
+        from num2words.lang_EN import Num2Word_EN
+        converter = Num2Word_EN()
+        converter.cards[5000] = 'five thousand'
+        # Not in descending order any more: the first match wins
+        self.assertEqual(converter._scale_for(6000), 1000)
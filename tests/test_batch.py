@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import io
+import json
+import types
+from array import array
+from decimal import InvalidOperation
+from unittest import TestCase
+
+from num2words import num2words, num2words_many
+from num2words.batch import (convert_file, convert_jsonl, convert_lines,
+                             convert_records, parse_line)
+
+
+class Num2WordsManyTest(TestCase):
+
+    def test_matches_num2words(self):
+        numbers = [0, 1, 21, 1999, 12.5, '42', '1.50']
+        for lang, to in [('en', 'cardinal'), ('de', 'ordinal'),
+                         ('fr', 'year'), ('en', 'currency')]:
+            if to == 'ordinal':
+                numbers = [n for n in numbers if n not in (12.5, '1.50')]
+            self.assertEqual(
+                num2words_many(numbers, lang=lang, to=to),
+                [num2words(n, lang=lang, to=to) for n in numbers])
+
+    def test_kwargs(self):
+        self.assertEqual(
+            num2words_many([1.5, 2.0], lang='en', to='currency',
+                           currency='USD'),
+            ['one dollar, fifty cents', 'two dollars, zero cents'])
+
+    def test_lazy(self):
+        results = num2words_many(range(3), lang='en', lazy=True)
+        self.assertIsInstance(results, types.GeneratorType)
+        self.assertEqual(list(results), ['zero', 'one', 'two'])
+
+    def test_tolist(self):
+        self.assertEqual(num2words_many(array('i', [7, 8]), lang='en'),
+                         ['seven', 'eight'])
+
+    def test_unit_strings(self):
+        self.assertEqual(num2words_many(['50 ml'], lang='lb', to='unit'),
+                         [num2words('50 ml', lang='lb', to='unit')])
+
+    def test_errors_raise(self):
+        with self.assertRaises(InvalidOperation):
+            num2words_many(['1', 'abc', '3'], lang='en')
+
+    def test_errors_return(self):
+        results = num2words_many(['1', 'abc', '3'], lang='en',
+                                 errors='return')
+        self.assertEqual(results[0], 'one')
+        self.assertIsInstance(results[1], InvalidOperation)
+        self.assertEqual(results[2], 'three')
+
+    def test_resolution_errors(self):
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], lang='lalala')
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], lang='en', to='babidibibidiboo!')
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], lang='en', to='unit')
+        with self.assertRaises(ValueError):
+            num2words_many([1], errors='ignore')
+
+
+class ConvertLinesTest(TestCase):
+
+    def test_parse_line(self):
+        self.assertEqual(parse_line('42\n'), ('42', 'en', 'cardinal'))
+        self.assertEqual(parse_line(' 42  fr ', to='year'),
+                         ('42', 'fr', 'year'))
+        self.assertEqual(parse_line('42 - ordinal', lang='de'),
+                         ('42', 'de', 'ordinal'))
+        self.assertIsNone(parse_line(' \n'))
+        self.assertRaises(ValueError, parse_line, '1 en cardinal x')
+
+    def test_overrides(self):
+        lines = ['1999\n', '1999 de year\n', '\n', '3 - ordinal\r\n']
+        self.assertEqual(list(convert_lines(lines, lang='fr')), [
+            ('1999', num2words('1999', lang='fr'), None),
+            ('1999 de year', num2words('1999', lang='de', to='year'), None),
+            ('', '', None),
+            ('3 - ordinal', 'troisième', None)])
+
+    def test_errors(self):
+        results = list(convert_lines(['x', '1 xx', '2 xx', '1 2 3 4', '5']))
+        self.assertEqual([words for _, words, _ in results],
+                         [None, None, None, None, 'five'])
+        self.assertIsInstance(results[1][2], NotImplementedError)
+        self.assertIs(results[1][2], results[2][2])
+        self.assertIsInstance(results[3][2], ValueError)
+
+    def test_convert_file(self):
+        out, err = io.StringIO(), io.StringIO()
+        errors = convert_file(io.StringIO('1\nx\n2\n3\n'), out, err,
+                              buffer_lines=2, name='numbers.txt')
+        self.assertEqual(errors, 1)
+        self.assertEqual(out.getvalue(), 'one\n\ntwo\nthree\n')
+        self.assertTrue(err.getvalue().startswith('numbers.txt:2: x: '))
+
+
+class ConvertRecordsTest(TestCase):
+
+    def test_records(self):
+        lines = [
+            '{"id": 1, "number": 1.5, "lang": "lb", "to": "currency"}',
+            '{"id": 2, "number": 2}',
+            '',
+            '{"id": "x", "number": "1.5", "to": "currency", '
+            '"kwargs": {"currency": "USD"}}',
+            '{"number": 3, "to": "ordinal"}',
+        ]
+        self.assertEqual(list(convert_records(lines, lang='fr')), [
+            {'id': 1, 'words': num2words(1.5, lang='lb', to='currency')},
+            {'id': 2, 'words': 'deux'},
+            {'id': 'x', 'words': num2words('1.5', lang='fr',
+                                           to='currency', currency='USD')},
+            {'id': None, 'words': 'troisième'}])
+
+    def test_order_across_groups(self):
+        lines = [json.dumps({'id': i, 'number': i, 'lang': lang})
+                 for i, lang in enumerate(['en', 'de', 'en', 'fr', 'de'])]
+        for buffer_size in (1, 2, 100):
+            records = list(convert_records(lines, buffer_size=buffer_size))
+            self.assertEqual([r['id'] for r in records], list(range(5)))
+            self.assertEqual(records[3]['words'], num2words(3, lang='fr'))
+
+    def test_errors(self):
+        lines = ['{"id": 1, "number": "x"}', '{"id": 2, "number": 1, '
+                 '"lang": "xx"}', '{"id": 3}', '[1]', '{x',
+                 '{"id": 4, "number": 1, "kwargs": {"bad": [1]}}',
+                 '{"id": 5, "number": 5}']
+        records = list(convert_records(lines))
+        self.assertEqual([r['id'] for r in records],
+                         [1, 2, 3, None, None, 4, 5])
+        self.assertEqual(['error' in r for r in records],
+                         [True] * 6 + [False])
+        self.assertIn('xx', records[1]['error'])
+
+    def test_convert_jsonl(self):
+        out = io.StringIO()
+        errors = convert_jsonl(
+            io.StringIO('{"id": 1, "number": 1}\n{"id": 2}\n'), out,
+            buffer_size=1)
+        self.assertEqual(errors, 1)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(records[0], {'id': 1, 'words': 'one'})
+        self.assertEqual(records[1]['id'], 2)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import json
+import os
+import random
+import shutil
+import tempfile
+from unittest import TestCase
+
+from num2words import bench
+
+
+class BenchTest(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_distributions_are_reproducible(self):
+        for make in bench.DISTRIBUTIONS.values():
+            self.assertEqual(make(random.Random(1), 10),
+                             make(random.Random(1), 10))
+
+    def test_run(self):
+        report = bench.run(['en', 'lb'], ['cardinal', 'unit'], count=5,
+                           repeat=1)
+        self.assertIn('en/cardinal/huge', report['results'])
+        self.assertIn('lb/unit/units', report['results'])
+        self.assertEqual(report['skipped'],
+                         {'en/unit/units': 'not implemented'})
+        result = report['results']['lb/cardinal/small']
+        self.assertEqual(result['calls'] + result['rejected'], 5)
+        self.assertGreater(result['ns_per_call'], 0)
+
+    def test_partial_support(self):
+        class Partial(object):
+            def str_to_number(self, value):
+                return int(value)
+
+            def to_cardinal(self, number):
+                if number > 10:
+                    raise NotImplementedError()
+                return str(number)
+
+        bench.CONVERTER_CLASSES['xx_partial'] = Partial()
+        self.addCleanup(bench.CONVERTER_CLASSES.pop, 'xx_partial')
+        self.assertEqual(
+            bench.supported_numbers('xx_partial', 'cardinal', [1, 20, 3],
+                                    None), [1, 3])
+        self.assertRaises(NotImplementedError, bench.supported_numbers,
+                          'xx_partial', 'year', [1], None)
+
+    def test_compare(self):
+        baseline = {'results': {'a': {'ns_per_call': 100.0},
+                                'b': {'ns_per_call': 100.0}}}
+        report = {'results': {'a': {'ns_per_call': 120.0},
+                              'b': {'ns_per_call': 130.0},
+                              'c': {'ns_per_call': 999.0}}}
+        self.assertEqual(bench.compare(report, baseline, 0.25),
+                         [('b', 100.0, 130.0, 1.3)])
+
+    def test_main(self):
+        output = os.path.join(self.tmp, 'report.json')
+        argv = ['--langs', 'fr', '--to', 'year', '--count', '3',
+                '--repeat', '1', '-q']
+        self.assertEqual(bench.main(argv + ['--output', output]), 0)
+        with open(output) as f:
+            report = json.load(f)
+        self.assertEqual(list(report['results']), ['fr/year/years'])
+
+        # A baseline ten times faster than possible is a regression
+        report['results']['fr/year/years']['ns_per_call'] /= 10
+        baseline = os.path.join(self.tmp, 'baseline.json')
+        with open(baseline, 'w') as f:
+            json.dump(report, f)
+        self.assertEqual(bench.main(argv + ['--baseline', baseline]), 1)
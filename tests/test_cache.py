@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import (cache_clear, cache_info, disable_cache, enable_cache,
+                       num2words, num2words_many)
+from num2words.cache import ResultCache
+
+
+class ResultCacheTest(TestCase):
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        cache.put(('a',), 'one')
+        cache.put(('b',), 'two')
+        self.assertEqual(cache.get(('a',)), 'one')
+        cache.put(('c',), 'three')
+        self.assertIsNone(cache.get(('b',)))
+        self.assertEqual(cache.get(('a',)), 'one')
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions,
+                          info.currsize), (2, 1, 1, 2))
+
+    def test_maxbytes(self):
+        cache = ResultCache(maxsize=None, maxbytes=300)
+        for i in range(10):
+            cache.put((i,), 'x' * 50)
+        info = cache.cache_info()
+        self.assertLessEqual(info.currbytes, 300)
+        self.assertGreater(info.evictions, 0)
+        self.assertEqual(info.currsize + info.evictions, 10)
+        cache.put(('big',), 'x' * 1000)
+        self.assertIsNone(cache.get(('big',)))
+
+    def test_clear(self):
+        cache = ResultCache()
+        cache.put(('a',), 'one')
+        cache.get(('a',))
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(),
+                         (0, 0, 0, 0, 1024, 0, None, 0))
+
+
+class Num2WordsCacheTest(TestCase):
+
+    def setUp(self):
+        enable_cache(maxsize=100)
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_disabled_by_default(self):
+        disable_cache()
+        self.assertIsNone(cache_info())
+        self.assertEqual(num2words(42), 'forty-two')
+
+    def test_hits(self):
+        for _ in range(3):
+            self.assertEqual(num2words(1999, lang='de', to='year'),
+                             'neunzehnhundertneunundneunzig')
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+        cache_clear()
+        self.assertEqual(cache_info().currsize, 0)
+
+    def test_number_types(self):
+        # Equal numbers of different types get entries of their own
+        self.assertEqual(num2words(1), 'one')
+        self.assertEqual(num2words(1.0), 'one')
+        self.assertEqual(num2words(Decimal('1.5')), 'one point five')
+        self.assertEqual(num2words(Decimal('1.50')), 'one point five')
+        self.assertEqual(num2words('1'), 'one')
+        self.assertEqual(cache_info().misses, 5)
+
+    def test_kwargs(self):
+        self.assertEqual(num2words(1, lang='en', to='currency',
+                                   currency='USD'),
+                         num2words(1, lang='en', to='currency',
+                                   currency='USD'))
+        self.assertNotEqual(num2words(1.5, lang='en', to='currency',
+                                      currency='EUR'),
+                            num2words(1.5, lang='en', to='currency',
+                                      currency='USD'))
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_bypass(self):
+        # Unhashable kwargs are passed through untouched
+        with self.assertRaises(Exception):
+            num2words(1, lang='en', to='currency', currency=['USD'])
+        self.assertEqual(cache_info().bypassed, 1)
+        self.assertEqual(cache_info().currsize, 0)
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(OverflowError):
+                num2words(10 ** 1000)
+        self.assertEqual(cache_info().currsize, 0)
+
+    def test_num2words_many(self):
+        numbers = [1, 2, 1, 2, 3]
+        self.assertEqual(num2words_many(numbers, lang='fr'),
+                         [num2words(n, lang='fr') for n in numbers])
+        self.assertEqual(cache_info().currsize, 3)
@@ -18,7 +18,9 @@
 
 from __future__ import unicode_literals
 
+import json
 import os
+import tempfile
 import unittest
 
 import delegator
@@ -111,3 +113,45 @@ class CliTestCase(unittest.TestCase):
              output.out).strip(),
             "ciento cincuenta euros con cincuenta y cinco céntimos"
         )
+
+    def test_cli_batch(self):
+        """Convert a file of numbers, with per-line overrides, and report
+        the lines that fail without stopping
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.txt',
+                                         delete=False) as f:
+            f.write('150\n150 es\nabc\n\n3 fr ordinal\n')
+        self.addCleanup(os.remove, f.name)
+        output = self.cli.run_cmd('--batch', f.name)
+        self.assertEqual(output.return_code, 1)
+        self.assertEqual(output.out.split('\n'), [
+            'one hundred and fifty', 'ciento cincuenta', '', '',
+            'troisième', ''])
+        self.assertIn(':3: abc:', output.err)
+
+    def test_cli_jsonl(self):
+        """Convert JSON records, with the errors in the output records
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl',
+                                         delete=False) as f:
+            f.write('{"id": 1, "number": 150, "lang": "es"}\n'
+                    '{"id": 2, "number": "x"}\n')
+        self.addCleanup(os.remove, f.name)
+        output = self.cli.run_cmd('--jsonl', f.name)
+        self.assertEqual(output.return_code, 0)
+        records = [json.loads(line) for line in output.out.splitlines()]
+        self.assertEqual(records[0], {'id': 1, 'words': 'ciento cincuenta'})
+        self.assertEqual(records[1]['id'], 2)
+        self.assertIn('error', records[1])
+
+    def test_cli_csv(self):
+        """Append a spelled out column to a CSV file
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.csv',
+                                         delete=False) as f:
+            f.write('id,amount\n1,150\n')
+        self.addCleanup(os.remove, f.name)
+        output = self.cli.run_cmd('csv', '-c', 'amount', '-l', 'es', f.name)
+        self.assertEqual(output.return_code, 0)
+        self.assertEqual(output.out.splitlines(), [
+            'id,amount,amount_words', '1,150,ciento cincuenta'])
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from num2words import corpus
+from num2words.normalizer import LuxembourgishNormalizer
+
+LINES = [
+    'Den 30. Abrëll 2010 um 10:34 Auer.\n',
+    'Et steet 71:56 an 3-2 fir d\'CSV.\n',
+    'Tel: 08 123 456\n',
+    '\n',
+    'An den 1970er Joren hat hien 25% an 93,9 %.\n',
+    '2 Stonnen, 100 ml an 90° a 500 gr.\n',
+]
+
+
+class CorpusTest(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.input = os.path.join(self.tmp, 'in')
+        self.output = os.path.join(self.tmp, 'out')
+        os.makedirs(os.path.join(self.input, 'sub'))
+        self.files = {
+            'a.txt': LINES * 20,
+            os.path.join('sub', 'b.txt'): LINES[::-1] * 7,
+            'empty.txt': [],
+        }
+        for name, lines in self.files.items():
+            self.write(os.path.join(self.input, name), ''.join(lines))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, path, text):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def expected(self, name):
+        normalizer = LuxembourgishNormalizer()
+        return ''.join(normalizer.normalize_stream(self.files[name]))
+
+    def test_find_inputs(self):
+        inputs = corpus.find_inputs([self.input], '*.txt')
+        self.assertEqual([name for _, name in inputs],
+                         ['a.txt', 'empty.txt', os.path.join('sub', 'b.txt')])
+        inputs = corpus.find_inputs([os.path.join(self.input, '*.txt')])
+        self.assertEqual([name for _, name in inputs], ['a.txt', 'empty.txt'])
+        with self.assertRaises(ValueError):
+            corpus.find_inputs([os.path.join(self.input, 'nothing*')])
+        self.write(os.path.join(self.input, 'sub', 'a.txt'), '')
+        with self.assertRaises(ValueError):
+            corpus.find_inputs([os.path.join(self.input, 'a.txt'),
+                                os.path.join(self.input, 'sub', 'a.txt')])
+
+    def test_plan_shards(self):
+        path = os.path.join(self.input, 'a.txt')
+        with open(path, 'rb') as f:
+            data = f.read()
+        for size in (1, 50, 100, len(data), len(data) * 2):
+            shards = corpus.plan_shards(path, size)
+            self.assertEqual(shards[0][0], 0)
+            self.assertEqual(shards[-1][1], len(data))
+            for (_, end), (start, _) in zip(shards, shards[1:]):
+                self.assertEqual(end, start)
+                self.assertEqual(data[end - 1:end], b'\n')
+        self.assertEqual(
+            corpus.plan_shards(os.path.join(self.input, 'empty.txt'), 10), [])
+
+    def test_normalize_corpus(self):
+        inputs = corpus.find_inputs([self.input])
+        progress = corpus.normalize_corpus(inputs, self.output, workers=2,
+                                           shard_size=100)
+        for name in self.files:
+            self.assertEqual(self.read(os.path.join(self.output, name)),
+                             self.expected(name))
+        self.assertEqual(os.listdir(os.path.join(self.output, 'sub')),
+                         ['b.txt'])
+        self.assertEqual(progress.lines, 20 * 6 + 7 * 6)
+        self.assertEqual(progress.done_bytes, progress.total_bytes)
+
+    def test_resume(self):
+        inputs = corpus.find_inputs([self.input])
+        path = os.path.join(self.input, 'a.txt')
+        output = os.path.join(self.output, 'a.txt')
+        corpus.normalize_corpus(inputs, self.output, workers=1)
+        # b.txt is done, a.txt was interrupted after its first shard
+        os.remove(output)
+        start, end = corpus.plan_shards(path, 100)[0]
+        self.write('%s.part-%d-%d' % (output, start, end), 'done before\n')
+
+        progress = corpus.normalize_corpus(inputs, self.output, workers=1,
+                                           shard_size=100)
+        self.assertTrue(self.read(output).startswith('done before\n'))
+        self.assertEqual(progress.skipped_bytes,
+                         os.path.getsize(os.path.join(self.input, 'sub',
+                                                      'b.txt')) + end)
+
+        corpus.normalize_corpus(inputs, self.output, workers=1,
+                                shard_size=100, restart=True)
+        self.assertEqual(self.read(output), self.expected('a.txt'))
+
+    def test_main(self):
+        self.assertEqual(corpus.main([os.path.join(self.input, 'a.txt'),
+                                      '-o', self.output, '--workers', '1',
+                                      '-q']), 0)
+        self.assertEqual(os.listdir(self.output), ['a.txt'])
+        with self.assertRaises(SystemExit):
+            corpus.main([os.path.join(self.input, 'nothing*'),
+                         '-o', self.output, '-q'])
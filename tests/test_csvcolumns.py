@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+import io
+from unittest import TestCase
+
+from num2words import num2words
+from num2words.csvcolumns import convert_csv, convert_rows
+
+CSV = ('id,amount,note\n'
+       '1,1.50,"a, b"\n'
+       '2,,c\n'
+       '3,x,d\n'
+       '4,12\n')
+
+
+class ConvertCsvTest(TestCase):
+
+    def convert(self, text, columns, **kwargs):
+        out, err = io.StringIO(), io.StringIO()
+        failed = convert_csv(io.StringIO(text), out, columns, errfile=err,
+                             **kwargs)
+        return failed, out.getvalue(), err.getvalue()
+
+    def test_convert(self):
+        failed, out, err = self.convert(CSV, ['amount'], lang='lb',
+                                        to='currency', chunk_size=2)
+        self.assertEqual(failed, 1)
+        self.assertEqual(out.splitlines(), [
+            'id,amount,note,amount_words',
+            '1,1.50,"a, b",%s' % num2words('1.50', lang='lb', to='currency'),
+            '2,,c,',
+            '3,x,d,',
+            '4,12,,%s' % num2words('12', lang='lb', to='currency')])
+        self.assertTrue(err.startswith('<stdin>:4: amount: x: '))
+
+    def test_columns(self):
+        text = 'a;b\n1;2\n'
+        failed, out, _ = self.convert(text, ['b', 'a'], delimiter=';',
+                                      suffix='_w', to='ordinal')
+        self.assertEqual(failed, 0)
+        self.assertEqual(out, 'a;b;b_w;a_w\n1;2;second;first\n')
+
+    def test_workers(self):
+        text = 'n\n' + ''.join('%d\n' % n for n in range(100))
+        _, out, _ = self.convert(text, ['n'], lang='fr', chunk_size=7,
+                                 workers=2)
+        self.assertEqual(out, self.convert(text, ['n'], lang='fr')[1])
+        self.assertEqual(out.splitlines()[-1],
+                         '99,%s' % num2words(99, lang='fr'))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, self.convert, '', ['a'])
+        self.assertRaises(ValueError, self.convert, 'a,b\n1,2\n', ['c'])
+        self.assertRaises(NotImplementedError, self.convert, 'a\n1\n',
+                          ['a'], lang='xx')
+
+    def test_convert_rows(self):
+        rows, errors = convert_rows([['1', 'x'], ['2']], [1, 0], width=2)
+        self.assertEqual(rows, [['1', 'x', '', 'one'],
+                                ['2', '', '', 'two']])
+        self.assertEqual([error[:2] for error in errors], [(0, 1)])
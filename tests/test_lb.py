@@ -408,6 +408,34 @@ class Num2WordsLBTests(unittest.TestCase):
         expected = "D'Paquet weit fënnefhonnert Gramm an et kosts 2.50 Euro"
         self.assertEqual(self.n2w.to_unit(text), expected)
 
+    def test_unit_table(self):
+        from num2words.lang_LB import Unit
+        # Negative temperatures take any degree sign
+        self.assertEqual(self.n2w.to_unit("-5\u2103"), "minus fënnef Grad")
+        self.assertEqual(self.n2w.to_unit("1\u2109"), "ee Grad")
+        # Celsius and Fahrenheit after the degree sign
+        self.assertEqual(self.n2w.to_unit("5°C an -30 °F"),
+                         "fënnef Grad Celsius an minus drësseg "
+                         "Grad Fahrenheit")
+        self.assertEqual(self.n2w.to_unit("1°Celsius"), "ee Grad Celsius")
+        self.assertEqual(self.n2w.to_unit("5°Cx"), "fënnef GradCx")
+        # New units are rows of the table
+        n2w = Num2Word_LB()
+        n2w.UNITS = n2w.UNITS + (
+            Unit(r'km', 'Kilometer', 'Kilometer', 'm', guarded=True),
+            Unit(r'St\.', 'Stonn', 'Stonnen', 'f'),
+        )
+        self.assertEqual(n2w.to_unit("1km an 3 St."),
+                         "ee Kilometer an dräi Stonnen")
+        self.assertEqual(n2w.to_unit("1 St. an 2kg"),
+                         "eng Stonn an zwee Kilogramm")
+        self.assertEqual(n2w.to_unit("x1km"), "x1km")
+        self.assertEqual(self.n2w.to_unit("1km"), "1km")
+        # Two of a feminine unit are 'zwou'
+        self.assertEqual(self.n2w.to_unit("2 Stonnen an 2 Monaten"),
+                         "zwou Stonnen an zwee Monaten")
+        self.assertEqual(self.n2w.to_unit("1 Wochen"), "eng Woch")
+
     def test_str_to_number(self):
         self.assertEqual(self.n2w.str_to_number("1"), 1)
         self.assertEqual(self.n2w.str_to_number("1,5"), 1.5)
@@ -525,6 +553,23 @@ class Num2WordsLBTests(unittest.TestCase):
         self.assertEqual(self.n2w.to_cardinal(0), "null")
         self.assertEqual(self.n2w.to_ordinal(1), "eensten")
 
+    def test_cardinal_tables(self):
+        # Integral Decimals are spelled like ints
+        from decimal import Decimal
+        for number in (0, 1, 13, 21, 101, 1001, 1100, 13000, 99999, 100000,
+                       1000000, 2000000, 1234567890123):
+            self.assertEqual(self.n2w.to_cardinal(Decimal(number)),
+                             self.n2w.to_cardinal(number))
+        self.assertEqual(self.n2w.to_cardinal(1234567),
+                         "engMilliounzweehonnertdrëssegvéierdausend"
+                         "fënnefhonnertsechzegsiwen")
+        self.assertEqual(self.n2w.to_cardinal(3000000001),
+                         "dräi Milliardeneent")
+        self.assertEqual(self.n2w.to_cardinal(Decimal("5.5")),
+                         "fënnef Komma fënnef")
+        with self.assertRaises(OverflowError):
+            self.n2w.to_cardinal(self.n2w.MAXVAL)
+
     def test_unsupported_currency(self):
         # Test error handling for unsupported currency
         with self.assertRaises(NotImplementedError):
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import glob
+import io
+import json
+import os
+from unittest import TestCase
+
+from num2words.lang_LB import Num2Word_LB, Unit
+from num2words.normalizer import (DEFAULT_RULES, LuxembourgishNormalizer,
+                                  NormalizationProfile, RuleRegistry,
+                                  unit_pattern)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+PHRASES = [
+    'Den 30. Abrëll 2010 um 10:34 Auer.',
+    'Et steet 71:56 an 3-2 fir d\'CSV.',
+    'Um 22.3. Äre Bréif, de 4. Juni 2023.',
+    'An den 1970er Joren hat hien 25% an 93,9 %.',
+    '2 Stonnen, 100 ml an 90° a 500 gr.',
+    'Tel: 08 123 456',
+    'Am Mäerz 1999 goufen et 961 Milliarden an 40 000 Leit.',
+    'Den 1. FC huet den 9. Plaz.',
+    'VW, FIFA an NATO',
+    'Zeil een\nZeil zwee 17h40\r\nan drëtt 8:15',
+]
+
+
+class NormalizerEngineTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = LuxembourgishNormalizer()
+
+    def assert_same(self, text):
+        self.assertEqual(self.normalizer.normalize(text),
+                         self.normalizer.normalize_passes(text), text)
+
+    def test_fixtures(self):
+        paths = sorted(glob.glob(os.path.join(HERE, '*.txt')))
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                self.assert_same(f.read())
+
+    def test_phrases(self):
+        for text in PHRASES:
+            self.assert_same(text)
+
+    def test_time_with_dot(self):
+        self.assertEqual(self.normalizer.normalize('17.40'),
+                         'siwwenzéng Auer véierzeg')
+        self.assertEqual(self.normalizer.normalize_passes('17.40'),
+                         'siwwenzéng Auer véierzeg')
+
+    def test_days_before_dates(self):
+        for text in ['De 1. 22.3. um 2023', 'Mee 3. 3. 12:30',
+                     'Mir sinn de 1. 22.3. do']:
+            self.assert_same(text)
+
+    def test_auer_after_date(self):
+        for text in ['den 3. Mee Auer X Auer', '3.5. Auer X Auer',
+                     '3. Auer Auer an', 'Auer 1. Auer', 'Auer 2023 Auer',
+                     '1. Auer X Auer , Mee', 'den , Auer 22.3. Auer',
+                     'Auer 12:30 Auer', 'Auer Auer 5 Auer']:
+            self.assert_same(text)
+
+    def test_large_number_words(self):
+        for text, expected in [('2 Milliarde', 'zwee Milliarde'),
+                               ('3 Millioune', 'dräi Millioune'),
+                               ('1 Milliard', 'een Milliard'),
+                               ('4 milliounen', 'véier Milliounen')]:
+            self.assertEqual(self.normalizer.normalize(text), expected)
+            self.assert_same(text)
+
+    def test_differences(self):
+        # Where normalize() deliberately differs from normalize_passes():
+        # the passes read 'X Auer 2023' as a date after all, and
+        # normalize_times() the times it already spelled out
+        self.assertEqual(self.normalizer.normalize('Auer 22.3. Auer 2023'),
+                         'Auer zweeanzwanzegsten Drëtten '
+                         'zweedausenddräianzwanzeg')
+        self.assertEqual(self.normalizer.normalize('8h15 Auer 10.30'),
+                         'aacht Auer fofzéng zéng drësseg')
+        self.assertEqual(self.normalizer.normalize_passes('8h15 Auer 10.30'),
+                         'aacht Auer fofzéng zéng Auer drësseg')
+
+    def test_units(self):
+        for text, expected in [('2 Minutten', 'zwou Minutten'),
+                               ('5 kg an 1 ml', 'fënnef Kilogramm an een '
+                                                'Milliliter'),
+                               ('eent Stonn', 'eng Stonn'),
+                               ('5°C an 30 °F', 'fënnef Grad Celsius an '
+                                                'drësseg Grad Fahrenheit'),
+                               ('1°C', 'een Grad Celsius'),
+                               ('2:1 Gramm', 'zwee zu ee Gramm')]:
+            self.assertEqual(self.normalizer.normalize(text), expected)
+            self.assert_same(text)
+
+    def test_unit_table(self):
+        n2w = Num2Word_LB()
+        n2w.UNITS = n2w.UNITS + (Unit(r'Deeg', 'Dag', 'Deeg', 'm'),
+                                 Unit(r'Nuechten', 'Nuecht', 'Nuechten', 'f'))
+        rules = DEFAULT_RULES.copy()
+        rules.remove('unit')
+        rules.add('unit', unit_pattern(n2w.UNITS),
+                  LuxembourgishNormalizer.token_unit,
+                  DEFAULT_RULES['unit'].priority)
+        normalizer = LuxembourgishNormalizer(rules=rules)
+        normalizer.lb = n2w
+        text = '3 Deeg an 2 Nuechten'
+        self.assertEqual(normalizer.normalize(text),
+                         'dräi Deeg an zwou Nuechten')
+        self.assertEqual(normalizer.normalize_passes(text),
+                         'dräi Deeg an zwou Nuechten')
+
+    def test_empty(self):
+        self.assertEqual(self.normalizer.normalize(''), '')
+
+
+def euro(normalizer, match):
+    return normalizer.lb.to_cardinal(int(match.group('eu_amount'))) + ' Euro'
+
+
+class RuleRegistryTest(TestCase):
+
+    def test_default_rules(self):
+        normalizer = LuxembourgishNormalizer()
+        self.assertIs(normalizer.rules, DEFAULT_RULES)
+        names = [rule.name for rule in DEFAULT_RULES]
+        self.assertEqual(names, [name for name, _ in
+                                 LuxembourgishNormalizer.TOKEN_PATTERNS])
+
+    def test_compiled_once(self):
+        rules = DEFAULT_RULES.copy()
+        compiled = rules.compile()
+        self.assertIs(rules.compile(), compiled)
+        self.assertGreaterEqual(rules.compile_seconds, 0)
+        rules.disable('number')
+        self.assertIsNot(rules.compile(), compiled)
+
+    def test_disable(self):
+        rules = DEFAULT_RULES.copy()
+        rules.disable('abbreviation', 'number')
+        normalizer = LuxembourgishNormalizer(rules=rules)
+        self.assertEqual(normalizer.normalize('VW 3 Stonnen'),
+                         'VW dräi Stonnen')
+        rules.enable('abbreviation')
+        self.assertEqual(normalizer.normalize('VW 3'), 'FAUWEE 3')
+        # the shared rules are left alone
+        self.assertEqual(LuxembourgishNormalizer().normalize('VW 3'),
+                         'FAUWEE dräi')
+
+    def test_disable_all(self):
+        rules = DEFAULT_RULES.copy()
+        rules.disable(*[rule.name for rule in rules])
+        normalizer = LuxembourgishNormalizer(rules=rules)
+        self.assertEqual(normalizer.normalize('den 2. Mee 1999'),
+                         'den 2. Mee 1999')
+
+    def test_add(self):
+        rules = DEFAULT_RULES.copy()
+        rules.add('euro', r'(?P<eu_amount>\d+) ?€', euro, priority=5)
+        normalizer = LuxembourgishNormalizer(rules=rules)
+        self.assertEqual(normalizer.normalize('Et kascht 12 € an 3 Stonnen'),
+                         'Et kascht zwielef Euro an dräi Stonnen')
+        rules.remove('euro')
+        self.assertEqual(normalizer.normalize('12 €'), 'zwielef €')
+
+    def test_add_last(self):
+        rules = RuleRegistry()
+        rule = rules.add('euro', r'(?P<eu_amount>\d+) ?€', euro)
+        self.assertEqual(rule.priority, 10)
+        self.assertEqual(rules.add('other', 'x', euro).priority, 20)
+        self.assertEqual(len(rules), 2)
+        self.assertIn('euro', rules)
+
+    def test_invalid_rules(self):
+        rules = DEFAULT_RULES.copy()
+        with self.assertRaises(ValueError):
+            rules.add('number', r'\d', euro)
+        with self.assertRaises(ValueError):
+            rules.add('not a name', r'\d', euro)
+        with self.assertRaises(ValueError):
+            rules.add('hours', r'(?P<t_hours>\d+)h', euro)
+        self.assertNotIn('hours', rules)
+
+
+class NormalizeStreamTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = LuxembourgishNormalizer()
+
+    def assert_streams(self, text):
+        # normalize() may drop a line break at the end of the text
+        expected = self.normalizer.normalize(text + '.')[:-1]
+        lines = io.StringIO(text).readlines()
+        for chunk_size in (1, 10, 100, 100000):
+            self.assertEqual(
+                ''.join(self.normalizer.normalize_stream(lines, chunk_size)),
+                expected, (text, chunk_size))
+
+    def test_fixtures(self):
+        for path in sorted(glob.glob(os.path.join(HERE, '*.txt'))):
+            with open(path, encoding='utf-8') as f:
+                self.assert_streams(f.read())
+
+    def test_phrases(self):
+        self.assert_streams('\n'.join(PHRASES) + '\n')
+
+    def test_across_lines(self):
+        self.assert_streams('Et waren 40\n000 Leit\n')
+        self.assert_streams(
+            'Et waren 12\n\n\n% an 3\nStonnen\nmat 1\n000\n000\n')
+        self.assert_streams('Auer\nAuer 961\nMilliarden\nan 2 \n\n°\n')
+        self.assert_streams('Tel: 08 12\n000\n\nStonnen\n')
+
+    def test_line_ends(self):
+        self.assert_streams('')
+        self.assert_streams('\n\n')
+        self.assert_streams('1\n\n2')
+        self.assert_streams('1\r\n2\u20283\n')
+        self.assertEqual(
+            ''.join(self.normalizer.normalize_stream(['1\r\n', '2'])),
+            'een\nzwee')
+
+    def test_incremental(self):
+        read = []
+
+        def lines():
+            for number in range(100000):
+                read.append(number)
+                yield 'Linn %d mat 40 000 Leit\n' % number
+
+        chunks = self.normalizer.normalize_stream(lines(), chunk_size=1000)
+        first = next(chunks)
+        self.assertTrue(first.startswith(
+            'Linn null mat véierzegdausend Leit\nLinn een mat'))
+        self.assertLess(len(read), 100)
+        chunks.close()
+
+    def test_normalize_file(self):
+        output = io.StringIO()
+        self.normalizer.normalize_file(
+            io.StringIO('den 4. Juni 2023\nTel: 08\n'), output, chunk_size=4)
+        self.assertEqual(output.getvalue(),
+                         'den véierte Juni zweedausenddräianzwanzeg\n'
+                         'Tel: null aacht\n')
+
+
+class ProfileTest(TestCase):
+
+    def test_stages(self):
+        events = []
+        profile = NormalizationProfile(callback=events.append)
+        normalizer = LuxembourgishNormalizer(profile=profile)
+        text = 'Den 4. Juni 2023 mat 12 Leit\nTel: 621 123'
+        self.assertEqual(normalizer.normalize(text),
+                         LuxembourgishNormalizer().normalize(text))
+        stats = profile.as_dict()
+        self.assertEqual(events, [stats])
+        self.assertEqual(set(stats), {'prepare_lines', 'scan', 'date',
+                                      'number'})
+        self.assertEqual(stats['number'], dict(
+            stats['number'], calls=1, matches=1, bytes_in=2,
+            bytes_out=len('zwielef'), converter_calls=1))
+        self.assertEqual(stats['prepare_lines']['matches'], 1)
+        self.assertEqual(stats['scan']['matches'], 2)
+        self.assertEqual(stats['scan']['converter_calls'],
+                         sum(stage['converter_calls']
+                             for name, stage in stats.items()
+                             if name not in ('scan', 'prepare_lines')))
+        self.assertGreater(stats['scan']['seconds'], 0)
+        self.assertEqual(json.loads(profile.to_json()), stats)
+        profile.reset()
+        self.assertEqual(profile.as_dict(), {})
+
+    def test_nested(self):
+        # The handlers of 'den 3. Mee' and 'Auer X Auer' normalize parts
+        # of their tokens, which the profile records once
+        events = []
+        profile = NormalizationProfile(callback=events.append)
+        normalizer = LuxembourgishNormalizer(profile=profile)
+        text = 'den 22.3. Mee um Auer 10 Auer'
+        self.assertEqual(normalizer.normalize(text),
+                         LuxembourgishNormalizer().normalize(text))
+        self.assertEqual(len(events), 1)
+        stats = profile.as_dict()
+        self.assertEqual(events, [stats])
+        self.assertEqual(set(stats), {'prepare_lines', 'scan',
+                                      'day_before_date', 'auer_after'})
+        self.assertEqual(stats['scan']['calls'], 1)
+        self.assertEqual(stats['scan']['matches'], 2)
+        self.assertEqual(stats['scan']['converter_calls'],
+                         stats['day_before_date']['converter_calls']
+                         + stats['auer_after']['converter_calls'])
+
+    def test_stream(self):
+        events = []
+        normalizer = LuxembourgishNormalizer(
+            profile=NormalizationProfile(callback=events.append))
+        lines = ['Linn %d\n' % number for number in range(100)]
+        self.assertEqual(
+            ''.join(normalizer.normalize_stream(lines, chunk_size=100)),
+            ''.join(LuxembourgishNormalizer().normalize_stream(lines)))
+        self.assertGreater(len(events), 1)
+        self.assertEqual(sum(event['number']['matches'] for event in events),
+                         100)
+        self.assertEqual(normalizer.profile.as_dict()['number']['matches'],
+                         100)
+
+    def test_no_profile(self):
+        from num2words import CONVERTER_CLASSES
+        self.assertIs(LuxembourgishNormalizer().lb, CONVERTER_CLASSES['lb'])
+
+
+class IncrementalTest(TestCase):
+
+    def assert_incremental(self, normalizer, text):
+        self.assertEqual(normalizer.normalize_incremental(text),
+                         normalizer.normalize(text), text)
+
+    def test_same_as_normalize(self):
+        normalizer = LuxembourgishNormalizer()
+        paths = sorted(glob.glob(os.path.join(HERE, '*.txt')))
+        texts = []
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                texts.append(f.read())
+        self.assert_incremental(normalizer, '\n\n'.join(texts))
+        for text in PHRASES + ['', '\n', '\n\n', 'a\n\n', '\n\nb\n\n\n',
+                               '40\n\n000 Leit', '12 \n\n%', 'Auer\n\nAuer',
+                               '5\n\nMilliarden', 'Tel: 621\r\n\r\n12 Leit']:
+            self.assert_incremental(normalizer, text)
+
+    def test_segments(self):
+        normalizer = LuxembourgishNormalizer()
+        self.assertEqual(list(normalizer.segments('a\n\nb\nc\n\n\nd\n\n')),
+                         [['a'], ['b', 'c'], ['', 'd', '']])
+        # blank lines a match may span do not separate segments
+        self.assertEqual(list(normalizer.segments('12\n\n%\n\nAuer\n \nAuer')),
+                         [['12', '', '%'], ['Auer', ' ', 'Auer']])
+
+    def test_only_changed_segments(self):
+        normalizer = LuxembourgishNormalizer()
+        paragraphs = ['%d. Paragraf mat 12 Leit.' % number
+                      for number in range(20)]
+        normalizer.normalize_incremental('\n\n'.join(paragraphs))
+        self.assertEqual(normalizer.segment_cache.cache_info().misses, 20)
+        paragraphs[7] = 'Den 4. Juni 2023 um 17:30.'
+        self.assert_incremental(normalizer, '\n\n'.join(paragraphs))
+        info = normalizer.segment_cache.cache_info()
+        self.assertEqual((info.hits, info.misses), (19, 21))
+
+    def test_rules_change(self):
+        rules = DEFAULT_RULES.copy()
+        normalizer = LuxembourgishNormalizer(rules=rules)
+        self.assertEqual(normalizer.normalize_incremental('VW 3'),
+                         'FAUWEE dräi')
+        rules.disable('abbreviation')
+        self.assertEqual(normalizer.normalize_incremental('VW 3'), 'VW dräi')
+
+
+class SharedEngineTest(TestCase):
+
+    def test_shared_converter(self):
+        from num2words import CONVERTER_CLASSES
+        from num2words.normalizer import TextNormalizer
+        from num2words.run_num2words_text import TextNormalizer as Text
+        converter = CONVERTER_CLASSES['lb']
+        self.assertIs(LuxembourgishNormalizer().lb, converter)
+        self.assertIs(TextNormalizer().lb, converter)
+        self.assertIs(Text().lb, converter)
+
+    def test_default_normalizer(self):
+        from num2words.normalizer import default_normalizer
+        self.assertIs(default_normalizer(), default_normalizer())
+        self.assertIs(default_normalizer().rules, DEFAULT_RULES)
+
+    def test_wrappers(self):
+        import luxembourgish_normalizer
+        from num2words import normalizer, run_num2words, run_num2words_text
+        self.assertIs(luxembourgish_normalizer.LuxembourgishNormalizer,
+                      LuxembourgishNormalizer)
+        self.assertIs(luxembourgish_normalizer.DEFAULT_RULES, DEFAULT_RULES)
+        self.assertIs(run_num2words.TextNormalizer, normalizer.TextNormalizer)
+        self.assertTrue(issubclass(run_num2words_text.TextNormalizer,
+                                   normalizer.TextNormalizer))
+        self.assertEqual(
+            run_num2words_text.TextNormalizer().normalize_text(
+                '1970er: 1ml an 2,50 EUR'),
+            'nonzénghonnertsiwwenzeger: een Milliliter an 2,50 EUR')
+
+
+class GoldenTest(TestCase):
+    """The fixtures against tests/golden_normalized.json, written by
+    ``benchmarks/normalizer_throughput.py --update-golden``."""
+
+    def test_golden(self):
+        from num2words.normalizer import TextNormalizer
+        from num2words.run_num2words_text import TextNormalizer as Text
+        with open(os.path.join(HERE, 'golden_normalized.json'),
+                  encoding='utf-8') as f:
+            golden = json.load(f)
+        normalizers = {
+            'lb': LuxembourgishNormalizer().normalize,
+            'text': TextNormalizer().normalize_text,
+            'text_simple': Text().normalize_text,
+        }
+        paths = sorted(glob.glob(os.path.join(HERE, '*.txt')))
+        self.assertEqual(sorted(golden['lb']),
+                         [os.path.basename(path) for path in paths])
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            for name, normalize in normalizers.items():
+                self.assertEqual(normalize(text),
+                                 golden[name][os.path.basename(path)],
+                                 '%s: %s' % (name, path))
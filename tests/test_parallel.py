@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import types
+from decimal import InvalidOperation
+from unittest import TestCase
+
+from num2words import num2words_many
+from num2words.parallel import ParallelConverter, num2words_parallel
+
+
+class ParallelConverterTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParallelConverter(workers=2, langs=['lb'],
+                                     min_chunksize=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_map_keeps_order(self):
+        numbers = list(range(0, 5000, 7))
+        self.assertEqual(self.pool.map(numbers, lang='lb', chunksize=3),
+                         num2words_many(numbers, lang='lb'))
+
+    def test_adaptive_chunks(self):
+        numbers = list(range(2000))
+        self.assertEqual(self.pool.map(numbers, lang='de', to='ordinal'),
+                         num2words_many(numbers, lang='de', to='ordinal'))
+
+    def test_imap_streams(self):
+        results = self.pool.imap((n * n for n in range(100)), lang='fr')
+        self.assertIsInstance(results, types.GeneratorType)
+        self.assertEqual(list(results),
+                         num2words_many([n * n for n in range(100)],
+                                        lang='fr'))
+
+    def test_kwargs(self):
+        self.assertEqual(
+            self.pool.map([1.5, 2.25], lang='en', to='currency',
+                          currency='USD'),
+            num2words_many([1.5, 2.25], lang='en', to='currency',
+                           currency='USD'))
+
+    def test_errors(self):
+        with self.assertRaises(InvalidOperation):
+            self.pool.map(['1', 'x', '3'], lang='en', chunksize=1)
+        results = self.pool.map(['1', 'x', '3'], lang='en', errors='return',
+                                chunksize=1)
+        self.assertEqual(results[::2], ['one', 'three'])
+        self.assertIsInstance(results[1], InvalidOperation)
+        with self.assertRaises(ValueError):
+            self.pool.imap([1], errors='ignore')
+        with self.assertRaises(NotImplementedError):
+            self.pool.imap([1], lang='xx')
+
+    def test_empty(self):
+        self.assertEqual(self.pool.map([], lang='lb'), [])
+
+    def test_num2words_parallel(self):
+        self.assertEqual(num2words_parallel(range(50), lang='lb', workers=1),
+                         num2words_many(range(50), lang='lb'))
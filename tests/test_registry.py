@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import subprocess
+import sys
+from unittest import TestCase
+
+from num2words import CONVERTER_CLASSES, num2words
+from num2words.lang_EN import Num2Word_EN
+from num2words.registry import ConverterRegistry
+
+
+class ConverterRegistryTest(TestCase):
+
+    def setUp(self):
+        self.registry = ConverterRegistry([
+            ('en', 'lang_EN.Num2Word_EN'),
+            ('fr', 'lang_FR.Num2Word_FR'),
+        ], package='num2words')
+
+    def test_lookup_is_lazy(self):
+        self.assertIn('en', self.registry)
+        self.assertFalse(self.registry.is_loaded('en'))
+        converter = self.registry['en']
+        self.assertIsInstance(converter, Num2Word_EN)
+        self.assertTrue(self.registry.is_loaded('en'))
+        self.assertFalse(self.registry.is_loaded('fr'))
+        self.assertIs(self.registry['en'], converter)
+
+    def test_mapping_protocol(self):
+        self.assertEqual(list(self.registry), ['en', 'fr'])
+        self.assertEqual(len(self.registry), 2)
+        self.assertNotIn('de', self.registry)
+        with self.assertRaises(KeyError):
+            self.registry['de']
+        self.assertEqual(
+            [type(c).__name__ for c in self.registry.values()],
+            ['Num2Word_EN', 'Num2Word_FR'])
+
+    def test_register_and_remove(self):
+        converter = Num2Word_EN()
+        self.registry['xx'] = converter
+        self.assertIs(self.registry['xx'], converter)
+        self.assertEqual(list(self.registry), ['en', 'fr', 'xx'])
+        del self.registry['xx']
+        self.assertNotIn('xx', self.registry)
+
+    def test_resolve_fallback(self):
+        self.assertIs(self.registry.resolve('fr_XX'), self.registry['fr'])
+        with self.assertRaises(NotImplementedError):
+            self.registry.resolve('lalala')
+
+    def test_package_registry(self):
+        self.assertEqual(len(CONVERTER_CLASSES), 63)
+        self.assertEqual(num2words(42, lang='fr_XX'), 'quarante-deux')
+
+    def test_import_does_not_load_languages(self):
+        code = ('import sys, num2words; '
+                'print(len([m for m in sys.modules '
+                'if m.startswith("num2words.lang_")]))')
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.strip(), b'0')
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import unittest
+from unittest import TestCase
+
+from num2words import num2words
+from num2words.normalizer import default_normalizer
+from num2words.server import ConversionServer, ConversionService
+
+
+class ServerTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ConversionServer(
+            ('127.0.0.1', 0), ConversionService(max_batch=3), max_body=1000)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def setUp(self):
+        self.connection = http.client.HTTPConnection(
+            *self.server.server_address[:2], timeout=10)
+        self.addCleanup(self.connection.close)
+
+    def request(self, method, path, body=None):
+        if body is not None and not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.connection.request(method, path, body)
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+
+    def test_convert(self):
+        self.assertEqual(
+            self.request('POST', '/convert',
+                         {'number': 42, 'lang': 'lb', 'to': 'ordinal'}),
+            (200, {'words': num2words(42, lang='lb', to='ordinal')}))
+        self.assertEqual(
+            self.request('GET', '/convert?number=2.5&to=currency'),
+            (200, {'words': num2words('2.5', to='currency')}))
+
+    def test_convert_batch(self):
+        status, body = self.request('POST', '/convert/batch', {
+            'numbers': [1.5, 'x'], 'to': 'currency',
+            'kwargs': {'currency': 'USD'}})
+        self.assertEqual(status, 200)
+        self.assertEqual(body['results'][0], {
+            'words': num2words(1.5, to='currency', currency='USD')})
+        self.assertIn('error', body['results'][1])
+
+    def test_normalize(self):
+        text = 'Den 1. Mee 2020 um 10:30 Auer'
+        expected = default_normalizer().normalize(text)
+        self.assertEqual(self.request('POST', '/normalize', {'text': text}),
+                         (200, {'text': expected}))
+        self.assertEqual(
+            self.request('POST', '/normalize/batch', {'texts': [text, '']}),
+            (200, {'texts': [expected, '']}))
+
+    def test_keep_alive(self):
+        self.request('GET', '/health')
+        sock = self.connection.sock
+        self.assertEqual(self.request('GET', '/health'),
+                         (200, {'status': 'ok'}))
+        self.assertIs(self.connection.sock, sock)
+
+    def test_errors(self):
+        self.assertEqual(self.request('POST', '/convert', b'{x')[0], 400)
+        self.assertEqual(self.request('POST', '/convert', [1])[0], 400)
+        self.assertEqual(self.request('POST', '/convert', {})[0], 400)
+        self.assertEqual(
+            self.request('POST', '/convert', {'number': 1, 'lang': 'xx'})[0],
+            400)
+        self.assertEqual(
+            self.request('POST', '/convert', {'number': 'x'})[0], 400)
+        self.assertEqual(self.request('GET', '/nothing')[0], 404)
+        self.assertEqual(self.request('POST', '/nothing', {})[0], 404)
+        self.assertEqual(self.request('GET', '/convert/batch')[0], 405)
+        # the connection is still usable after all these
+        self.assertEqual(self.request('GET', '/health')[0], 200)
+
+    def test_limits(self):
+        self.assertEqual(self.request('POST', '/convert/batch',
+                                      {'numbers': [1, 2, 3, 4]})[0], 413)
+        self.assertEqual(self.request('POST', '/normalize',
+                                      {'text': 'x' * 2000})[0], 413)
+
+
+# serves with two workers; with an argument, the parent is killed right
+# after forking the first one
+WORKERS_SCRIPT = """
+import os, signal, sys
+from num2words import server
+httpd = server.ConversionServer(('127.0.0.1', 0), server.ConversionService())
+print(httpd.server_address[1], flush=True)
+fork = os.fork
+def kill_after_fork():
+    pid = fork()
+    if pid:
+        os.kill(os.getpid(), signal.SIGTERM)
+    return pid
+if sys.argv[1:]:
+    os.fork = kill_after_fork
+server.serve(httpd, 2)
+"""
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'no fork')
+class WorkersTest(TestCase):
+
+    def start(self, *args):
+        env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env['PYTHONPATH'] = os.pathsep.join(
+            [root] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+        server = subprocess.Popen(
+            [sys.executable, '-c', WORKERS_SCRIPT] + list(args), env=env,
+            stdout=subprocess.PIPE)
+        self.addCleanup(server.stdout.close)
+        return server, int(server.stdout.readline())
+
+    def assertStopped(self, server, port):
+        self.assertEqual(server.wait(timeout=60), 0)
+        # no child is left accepting connections
+        with self.assertRaises(ConnectionRefusedError):
+            socket.create_connection(('127.0.0.1', port), timeout=10).close()
+
+    def test_sigterm(self):
+        server, port = self.start()
+        connection = http.client.HTTPConnection('127.0.0.1', port,
+                                                timeout=10)
+        connection.request('POST', '/convert',
+                           json.dumps({'number': 2}).encode('utf-8'))
+        response = connection.getresponse()
+        self.assertEqual(json.loads(response.read().decode('utf-8')),
+                         {'words': 'two'})
+        connection.close()
+        server.send_signal(signal.SIGTERM)
+        self.assertStopped(server, port)
+
+    def test_sigterm_while_forking(self):
+        self.assertStopped(*self.start('kill'))
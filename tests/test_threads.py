@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import copy
+import pickle
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from num2words import CONVERTER_CLASSES, num2words
+from num2words.lang_DA import Num2Word_DA
+
+# Conversions whose converters keep intermediate results on self
+CASES = [
+    ('ar', 'cardinal', {}), ('ar', 'ordinal', {}),
+    ('ar', 'currency', {}), ('ar', 'currency', {'currency': 'TND'}),
+    ('zh', 'cardinal', {}), ('zh', 'cardinal', {'reading': 'capital'}),
+    ('zh', 'currency', {}), ('zh_TW', 'cardinal', {'reading': True}),
+    ('da', 'cardinal', {}), ('da', 'ordinal', {}),
+    ('sl', 'cardinal', {}), ('sl', 'ordinal', {}),
+    ('ro', 'cardinal', {}), ('ro', 'currency', {}),
+    ('pt', 'currency', {}), ('tr', 'cardinal', {}), ('tr', 'ordinal', {}),
+    ('tet', 'cardinal', {}), ('tet', 'ordinal', {}),
+    ('en', 'cardinal', {}), ('fa', 'cardinal', {}), ('he', 'cardinal', {}),
+    ('lb', 'cardinal', {}), ('lb', 'ordinal', {}),
+]
+
+
+def make_calls(count, seed=0):
+    rnd = random.Random(seed)
+    calls = []
+    for _ in range(count):
+        lang, to, kwargs = rnd.choice(CASES)
+        number = rnd.randrange(1, 10 ** rnd.randint(1, 9))
+        if to == 'cardinal' and rnd.random() < 0.3:
+            number = -number / 100.0
+        elif to == 'currency':
+            number = number / 100.0
+        calls.append((number, lang, to, kwargs))
+    return calls
+
+
+def convert(call):
+    number, lang, to, kwargs = call
+    try:
+        return num2words(number, lang=lang, to=to, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+class ThreadSafetyTest(TestCase):
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        # Switch threads as often as possible to provoke interleaving
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_matches_sequential(self):
+        calls = make_calls(4000)
+        expected = [convert(call) for call in calls]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(convert, calls, chunksize=7))
+        mismatches = [(call, want, got) for call, want, got
+                      in zip(calls, expected, results) if want != got]
+        self.assertEqual(mismatches, [])
+
+    def test_call_state_is_per_thread(self):
+        converter = Num2Word_DA()
+        seen = []
+
+        def ordinal():
+            seen.append(converter.to_ordinal(3))
+            seen.append(converter.ordflag)
+
+        # to_ordinal() sets ordflag while it runs, in its own thread only
+        converter.ordflag = False
+        thread = threading.Thread(target=ordinal)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [converter.to_ordinal(3), False])
+        self.assertFalse(converter.ordflag)
+
+    def test_configuration_is_shared(self):
+        converter = Num2Word_DA()
+        seen = []
+
+        def configure():
+            converter.precision = 3
+            seen.append(converter.precision)
+
+        thread = threading.Thread(target=configure)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [3])
+        self.assertEqual(converter.precision, 3)
+        thread = threading.Thread(
+            target=lambda: seen.append(converter.precision))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [3, 3])
+
+    def test_copy_and_pickle(self):
+        converter = CONVERTER_CLASSES['ar']
+        for clone in (copy.copy(converter),
+                      pickle.loads(pickle.dumps(converter))):
+            self.assertEqual(clone.to_currency(1.5),
+                             converter.to_currency(1.5))
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+import contextlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+
+from num2words import num2words
+from num2words.normalizer import default_normalizer
+from num2words.server import ConversionService
+from num2words.worker import handle_request, main, serve_stream
+
+REQUESTS = [
+    {'id': 1, 'number': 42, 'lang': 'lb', 'to': 'ordinal'},
+    {'id': 2, 'op': 'normalize', 'text': 'Den 1. Mee'},
+    {'id': 3, 'op': 'convert_batch', 'numbers': [1, 'x'], 'lang': 'fr'},
+    {'id': 4, 'op': 'ping'},
+]
+
+
+def encode(requests):
+    return b''.join(json.dumps(request).encode('utf-8') + b'\n'
+                    for request in requests)
+
+
+class WorkerTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ConversionService(max_batch=2)
+
+    def check_responses(self, responses):
+        self.assertEqual([response['id'] for response in responses],
+                         [1, 2, 3, 4])
+        self.assertEqual(responses[0]['words'],
+                         num2words(42, lang='lb', to='ordinal'))
+        self.assertEqual(responses[1]['text'],
+                         default_normalizer().normalize('Den 1. Mee'))
+        self.assertEqual(responses[2]['results'][0], {'words': 'un'})
+        self.assertIn('error', responses[2]['results'][1])
+        self.assertTrue(responses[3]['pong'])
+
+    def test_handle_request(self):
+        self.assertEqual(handle_request(self.service,
+                                        b'{"id": 5, "number": 3}'),
+                         {'id': 5, 'words': 'three'})
+        self.assertEqual(handle_request(self.service, '{"id": 6, "op": "x"}'),
+                         {'id': 6, 'error': 'unknown op: x'})
+        for record_id, line in [
+                (None, '{x'), (None, '[1]'), (7, '{"id": 7}'),
+                (7, '{"id": 7, "number": "y"}'),
+                (7, '{"id": 7, "op": "convert_batch", "numbers": [1, 2, 3]}'),
+                (7, '{"id": 7, "number": 1, "kwargs": {"nope": 1}}')]:
+            response = handle_request(self.service, line)
+            self.assertIn('error', response, line)
+            self.assertEqual(response['id'], record_id)
+
+    def test_serve_stream(self):
+        out = io.BytesIO()
+        serve_stream(self.service, io.BytesIO(encode(REQUESTS) + b'\n'),
+                     out)
+        self.check_responses([json.loads(line)
+                              for line in out.getvalue().splitlines()])
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'no Unix sockets')
+    def test_socket(self):
+        from num2words.worker import WorkerServer
+        path = os.path.join(tempfile.mkdtemp(), 'worker.sock')
+        server = WorkerServer(path, self.service)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.connect(path)
+                stream = sock.makefile('rwb')
+                # pipelined: every request is sent before reading
+                stream.write(encode(REQUESTS))
+                stream.flush()
+                self.check_responses([json.loads(stream.readline())
+                                      for _ in REQUESTS])
+                stream.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'no Unix sockets')
+    def test_socket_in_use(self):
+        from num2words.worker import WorkerServer, _socket_in_use
+        path = os.path.join(tempfile.mkdtemp(), 'worker.sock')
+        self.assertFalse(_socket_in_use(path))
+        # left behind: bound, but nobody listens any more
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.bind(path)
+        self.assertFalse(_socket_in_use(path))
+        self.assertFalse(os.path.exists(path))
+        server = WorkerServer(path, self.service)
+        try:
+            self.assertTrue(_socket_in_use(path))
+            with contextlib.redirect_stderr(io.StringIO()) as err, \
+                    self.assertRaises(SystemExit):
+                main(['--socket', path])
+            self.assertIn('address in use', err.getvalue())
+            self.assertTrue(os.path.exists(path))
+        finally:
+            server.server_close()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+    def test_pipe(self):
+        env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env['PYTHONPATH'] = os.pathsep.join(
+            [root] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+        worker = subprocess.Popen(
+            [sys.executable, '-m', 'num2words.worker'], env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        out, _ = worker.communicate(encode(REQUESTS), timeout=60)
+        self.assertEqual(worker.returncode, 0)
+        self.check_responses([json.loads(line) for line in out.splitlines()])